@@ -0,0 +1,192 @@
+import gzip
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import pandas as pd
+
+# Desteklenen arşiv uzantıları
+ARCHIVE_SUFFIXES = ('.zip', '.gz', '.zst')
+
+T = TypeVar("T")
+
+
+class ArchiveMember:
+    """
+    Arşiv içindeki tek bir CSV üyesi; dosya diske açılmadan akış olarak okunur.
+
+    .zip arşivlerinde ``member`` arşivdeki dosya adıdır. .gz / .zst tek
+    dosyalık sıkıştırmalardır; üye adı arşiv uzantısı atılmış dosya adıdır
+    (örn. THYAO.csv.gz -> THYAO.csv).
+
+    Args:
+        archive: Arşiv dosyası
+        member: Üye adı (.zip için zorunlu)
+    """
+
+    def __init__(self, archive: Path, member: Optional[str] = None):
+        self.archive = Path(archive)
+        self.kind = self.archive.suffix.lower()
+        if self.kind not in ARCHIVE_SUFFIXES:
+            raise ValueError(f"Desteklenmeyen arşiv türü: {self.archive}")
+        if member is None:
+            if self.kind == '.zip':
+                raise ValueError(f".zip arşivi için üye adı gerekli: {self.archive}")
+            member = self.archive.stem
+        self.member = member
+
+    @property
+    def stem(self) -> str:
+        """Üyenin uzantısız dosya adı (örn. 'THYAO')."""
+        return Path(Path(self.member).name).stem
+
+    @contextmanager
+    def open(self) -> Iterator[BinaryIO]:
+        """Üyeyi sıkıştırması açılan ikili akış olarak açar (bağlam yöneticisi)."""
+        if self.kind == '.zip':
+            with zipfile.ZipFile(self.archive) as archive, archive.open(self.member) as stream:
+                yield stream
+        elif self.kind == '.gz':
+            with gzip.open(self.archive, 'rb') as stream:
+                yield stream
+        else:
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError(f".zst arşivleri için 'zstandard' paketi gerekli: {self.archive}") from e
+            with open(self.archive, 'rb') as raw, zstandard.ZstdDecompressor().stream_reader(raw) as stream:
+                yield stream
+
+    def signature(self) -> Tuple[Any, ...]:
+        """
+        Üyenin değişip değişmediğini anlamak için imza.
+
+        .zip üyelerinde arşiv dizinindeki CRC ve boyut kullanılır (arşivin
+        tamamı okunmaz); tek dosyalık arşivlerde dosya boyutu ve mtime.
+        """
+        if self.kind == '.zip':
+            with zipfile.ZipFile(self.archive) as archive:
+                info = archive.getinfo(self.member)
+            return (str(self.archive.resolve()), self.member, info.CRC, info.file_size)
+        stat = self.archive.stat()
+        return (str(self.archive.resolve()), self.member, stat.st_size, stat.st_mtime_ns)
+
+    def __str__(self) -> str:
+        return f"{self.archive}::{self.member}"
+
+    def __repr__(self) -> str:
+        return f"ArchiveMember({str(self.archive)!r}, {self.member!r})"
+
+
+CsvSource = Union[Path, ArchiveMember]
+
+
+def list_csv_members(archive: Path, tickers: Optional[Iterable[str]] = None) -> List[ArchiveMember]:
+    """
+    Arşivdeki CSV üyelerini, istenirse yalnızca verilen hisse kodlarıyla döndürür.
+
+    Seçim üye adlarıyla (dosya adı = hisse kodu) arşiv dizini üzerinden
+    yapılır; seçilmeyen üyelerin sıkıştırması açılmaz.
+
+    Args:
+        archive: .zip, .csv.gz veya .csv.zst dosyası
+        tickers: Hisse kodları (büyük/küçük harf duyarsız); None ise tüm CSV'ler
+
+    Returns:
+        List[ArchiveMember]: Ad sırasına göre seçilen üyeler
+    """
+    archive = Path(archive)
+    wanted = {ticker.strip().upper() for ticker in tickers} if tickers is not None else None
+
+    if archive.suffix.lower() == '.zip':
+        with zipfile.ZipFile(archive) as zf:
+            names = [
+                info.filename for info in zf.infolist()
+                if not info.is_dir() and info.filename.lower().endswith('.csv')
+            ]
+        members = [ArchiveMember(archive, name) for name in sorted(names)]
+    else:
+        members = [ArchiveMember(archive)]
+        if not members[0].member.lower().endswith('.csv'):
+            members = []
+
+    if wanted is not None:
+        members = [member for member in members if member.stem.upper() in wanted]
+    return members
+
+
+def find_csv_sources(
+    directory: Path, tickers: Optional[Iterable[str]] = None, archives: Sequence[Path] = ()
+) -> List[CsvSource]:
+    """
+    Klasördeki düz CSV dosyalarını ve arşiv üyelerini birlikte listeler.
+
+    Klasördeki arşivler ile ``archives`` içinde verilen arşivler taranır.
+    Aynı hisse hem düz dosya hem arşiv üyesi olarak varsa düz dosya kullanılır.
+
+    Args:
+        directory: Hisse CSV klasörü (yoksa yalnızca arşivler kullanılır)
+        tickers: Hisse kodları; None ise tümü
+        archives: Ek arşiv dosyaları
+
+    Returns:
+        List[CsvSource]: Düz CSV yolları ve ArchiveMember'lar
+    """
+    wanted = {ticker.strip().upper() for ticker in tickers} if tickers is not None else None
+    directory = Path(directory)
+
+    plain = sorted(directory.glob("*.csv")) if directory.exists() else []
+    plain = [path for path in plain if wanted is None or path.stem.upper() in wanted]
+    seen = {path.stem.upper() for path in plain}
+
+    archive_paths = list(archives)
+    if directory.exists():
+        archive_paths += sorted(
+            path for path in directory.iterdir()
+            if path.suffix.lower() in ARCHIVE_SUFFIXES and path not in archive_paths
+        )
+
+    sources: List[CsvSource] = list(plain)
+    for archive in archive_paths:
+        for member in list_csv_members(archive, wanted):
+            if member.stem.upper() not in seen:
+                seen.add(member.stem.upper())
+                sources.append(member)
+    return sources
+
+
+def read_csv_source(source: CsvSource, **read_csv_kwargs: Any) -> pd.DataFrame:
+    """
+    Düz CSV dosyasını veya arşiv üyesini pandas ile okur.
+
+    Arşiv üyeleri geçici dosyaya açılmadan akıştan okunur; diğer argümanlar
+    ``pd.read_csv``'ye aynen iletilir.
+    """
+    if isinstance(source, ArchiveMember):
+        with source.open() as stream:
+            return pd.read_csv(stream, **read_csv_kwargs)
+    return pd.read_csv(source, **read_csv_kwargs)
+
+
+def source_signature(source: CsvSource) -> Tuple[Any, ...]:
+    """Düz dosya için (yol, boyut, mtime_ns), arşiv üyesi için ArchiveMember.signature()."""
+    if isinstance(source, ArchiveMember):
+        return source.signature()
+    stat = Path(source).stat()
+    return (str(Path(source).resolve()), stat.st_size, stat.st_mtime_ns)
+
+
+def map_sources(func: Callable[[CsvSource], T], sources: Sequence[CsvSource], max_workers: int = 1) -> List[T]:
+    """
+    Kaynakları (isteğe bağlı) iş parçacığı havuzunda işler; sonuçlar kaynak sırasındadır.
+
+    zlib/zstd sıkıştırma açma ve pandas CSV ayrıştırma GIL'i büyük ölçüde
+    bıraktığından üyeler paralel açılabilir; her iş parçacığı arşivi kendi
+    dosya tanıtıcısıyla açar.
+    """
+    if max_workers <= 1 or len(sources) <= 1:
+        return [func(source) for source in sources]
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(func, sources))
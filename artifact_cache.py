@@ -0,0 +1,293 @@
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Önbellek anahtarı şeması değişirse eski girdilerin kullanılmaması için sürüm
+CACHE_SCHEMA_VERSION = 1
+
+# Dosya parmak izi için okuma bloğu (byte)
+_FILE_CHUNK_SIZE = 1 << 20
+
+
+def _update_fingerprint(hasher, obj: Any) -> None:
+    """Nesnenin içeriğini hasher'a tür etiketiyle birlikte ekler."""
+    if isinstance(obj, pd.DataFrame):
+        hasher.update(b"DF")
+        hasher.update(repr(list(obj.columns)).encode())
+        hasher.update(repr([str(t) for t in obj.dtypes]).encode())
+        hasher.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, pd.Series):
+        hasher.update(b"SR")
+        hasher.update(repr((obj.name, str(obj.dtype))).encode())
+        hasher.update(pd.util.hash_pandas_object(obj, index=True).to_numpy().tobytes())
+    elif isinstance(obj, np.ndarray):
+        hasher.update(b"ND")
+        hasher.update(repr((obj.shape, str(obj.dtype))).encode())
+        hasher.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, Path):
+        hasher.update(b"FILE")
+        with open(obj, "rb") as f:
+            for chunk in iter(lambda: f.read(_FILE_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+    elif inspect.isfunction(obj) or inspect.ismethod(obj) or inspect.ismodule(obj) or inspect.isclass(obj):
+        # Kod değişince aşama anahtarı da değişir
+        hasher.update(b"CODE")
+        hasher.update(inspect.getsource(obj).encode())
+    elif isinstance(obj, dict):
+        hasher.update(b"DICT")
+        for key in sorted(obj, key=repr):
+            _update_fingerprint(hasher, key)
+            _update_fingerprint(hasher, obj[key])
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(b"SEQ%d" % len(obj))
+        for item in obj:
+            _update_fingerprint(hasher, item)
+    else:
+        hasher.update(b"VAL")
+        hasher.update(repr(obj).encode())
+
+
+def fingerprint(*objs: Any) -> str:
+    """
+    Nesnelerin içerik tabanlı SHA-256 parmak izini döndürür.
+
+    DataFrame/Series için pandas satır hash'leri, NumPy dizileri için ham
+    byte'lar, Path için dosya içeriği, fonksiyon/modüller için kaynak kod
+    kullanılır; sözlük ve listeler özyinelemeli işlenir.
+    """
+    hasher = hashlib.sha256()
+    for obj in objs:
+        _update_fingerprint(hasher, obj)
+    return hasher.hexdigest()
+
+
+class ArtifactCache:
+    """
+    Pipeline aşamalarının çıktıları için yerel, içerik adresli önbellek.
+
+    Her girdi, aşama adı + girdilerin parmak izi + konfigürasyon dilimi +
+    aşama kodunun hash'i ile anahtarlanır. Girdiler değişmediyse aşama
+    atlanır ve çıktı diskten yüklenir. Toplam boyut ``max_bytes`` değerini
+    aşınca en uzun süredir kullanılmayan (LRU) girdiler silinir.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = 2 * 1024 ** 3, enabled: bool = True):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.index_path = self.root / "index.json"
+        self.index: Dict[str, Dict[str, Any]] = {}
+
+        if self.enabled:
+            self.root.mkdir(parents=True, exist_ok=True)
+            if self.index_path.exists():
+                try:
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        self.index = json.load(f)
+                except Exception as e:
+                    print(f"  [UYARI] Önbellek indeksi okunamadı, sıfırlanıyor: {e}")
+                    self.index = {}
+
+    def make_key(
+        self, stage: str, inputs: Sequence[Any], config: Optional[Dict[str, Any]] = None, code: Sequence[Any] = ()
+    ) -> str:
+        """
+        Aşama için içerik adresli anahtar üretir.
+
+        Args:
+            stage: Aşama adı
+            inputs: Aşamanın girdileri (DataFrame, dizi, dosya yolu veya önceki aşama anahtarı)
+            config: Aşamayı etkileyen konfigürasyon dilimi
+            code: Anahtara kaynak kodu dahil edilecek fonksiyon/modüller
+
+        Returns:
+            str: SHA-256 anahtarı
+        """
+        return fingerprint(CACHE_SCHEMA_VERSION, stage, list(inputs), config or {}, list(code))
+
+    def _path_for(self, key: str, suffix: str) -> Path:
+        return self.root / key[:2] / f"{key}{suffix}"
+
+    def _touch(self, key: str) -> None:
+        self.index[key]["last_access"] = time.time()
+
+    def _register(self, key: str, stage: str, path: Path) -> None:
+        self.index[key] = {
+            "stage": stage,
+            "file": str(path.relative_to(self.root)),
+            "size": path.stat().st_size,
+            "created": time.time(),
+            "last_access": time.time(),
+        }
+        self._evict()
+        self._save_index()
+
+    def _save_index(self) -> None:
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_path)
+
+    def _evict(self) -> None:
+        """Toplam boyut sınırı aşılırsa en eski erişimli girdileri siler (LRU)."""
+        total = sum(entry["size"] for entry in self.index.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self.index, key=lambda k: self.index[k]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            entry = self.index.pop(key)
+            total -= entry["size"]
+            try:
+                (self.root / entry["file"]).unlink()
+            except FileNotFoundError:
+                pass
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Anahtarın çıktısını döndürür: (bulundu mu, değer)."""
+        entry = self.index.get(key) if self.enabled else None
+        if entry is None:
+            return False, None
+        try:
+            with open(self.root / entry["file"], "rb") as f:
+                value = pickle.load(f)
+        except Exception:
+            self.index.pop(key, None)
+            return False, None
+        self._touch(key)
+        self._save_index()
+        return True, value
+
+    def put(self, key: str, stage: str, value: Any) -> None:
+        """Aşama çıktısını pickle olarak saklar."""
+        if not self.enabled:
+            return
+        path = self._path_for(key, ".pkl")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        self._register(key, stage, path)
+
+    def restore_file(self, key: str, destination: Path) -> bool:
+        """Önbellekteki dosya çıktısını (örn. PNG) hedefe kopyalar; yoksa False döner."""
+        entry = self.index.get(key) if self.enabled else None
+        if entry is None or not (self.root / entry["file"]).exists():
+            return False
+        Path(destination).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self.root / entry["file"], destination)
+        self._touch(key)
+        self._save_index()
+        return True
+
+    def store_file(self, key: str, stage: str, source: Path) -> None:
+        """Üretilmiş bir dosyayı (örn. grafik) önbelleğe kopyalar."""
+        if not self.enabled or not Path(source).exists():
+            return
+        path = self._path_for(key, Path(source).suffix)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, path)
+        self._register(key, stage, path)
+
+    def run_stage(
+        self,
+        stage: str,
+        key: str,
+        compute: Callable[[], Any],
+        timings: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Any:
+        """
+        Aşamayı önbellekten yükler veya hesaplayıp önbelleğe yazar.
+
+        None dönen (başarısız) aşamalar önbelleğe yazılmaz.
+
+        Args:
+            stage: Aşama adı
+            key: make_key ile üretilmiş anahtar
+            compute: Önbellekte yoksa çağrılacak fonksiyon
+            timings: Aşama süreleri ve önbellek isabetlerinin yazılacağı sözlük
+
+        Returns:
+            Any: Aşama çıktısı
+        """
+        start = time.perf_counter()
+        hit, value = self.get(key)
+        if hit:
+            print(f"  [ÖNBELLEK] {stage} aşaması önbellekten yüklendi ({key[:12]})")
+        else:
+            value = compute()
+            if value is not None:
+                self.put(key, stage, value)
+
+        if timings is not None:
+            timings[stage] = {
+                "seconds": round(time.perf_counter() - start, 4),
+                "cache_hit": hit,
+                "key": key,
+            }
+        return value
+
+    def run_file_stage(
+        self,
+        stage: str,
+        key: str,
+        output_path: Path,
+        render: Callable[[], Any],
+        timings: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> bool:
+        """
+        Dosya üreten aşamayı (grafikler) önbellekten geri yükler veya çalıştırır.
+
+        Returns:
+            bool: Çıktı dosyası mevcut mu
+        """
+        start = time.perf_counter()
+        hit = self.restore_file(key, output_path)
+        if hit:
+            print(f"  [ÖNBELLEK] {stage} önbellekten kopyalandı: {output_path}")
+        else:
+            render()
+            self.store_file(key, stage, output_path)
+
+        if timings is not None:
+            timings[stage] = {
+                "seconds": round(time.perf_counter() - start, 4),
+                "cache_hit": hit,
+                "key": key,
+            }
+        return Path(output_path).exists()
+
+
+def _json_default(obj: Any) -> Any:
+    """NumPy/pandas/Path değerlerini JSON'a yazılabilir türlere çevirir."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, (Path, pd.Timestamp)):
+        return str(obj)
+    raise TypeError(f"JSON'a yazılamayan tür: {type(obj).__name__}")
+
+
+def write_run_manifest(manifest: Dict[str, Any], output_path: Path) -> None:
+    """
+    Çalıştırma özetini (metrikler, çıktı yolları, aşama süreleri) JSON olarak kaydeder.
+
+    Args:
+        manifest: Çalıştırma özeti
+        output_path: Hedef .json dosyası
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, default=_json_default)
@@ -0,0 +1,203 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Sequence
+
+# Yıllık işlem günü sayısı (Sharpe oranını yıllıklandırmak için)
+TRADING_DAYS_PER_YEAR = 252
+
+
+def build_config_grid(
+    long_thresholds: Sequence[float],
+    short_thresholds: Sequence[float],
+    cost_bps: Sequence[float],
+    slippage_bps: Sequence[float],
+) -> pd.DataFrame:
+    """
+    Eşik, komisyon ve kayma değerlerinin tüm kombinasyonlarını oluşturur.
+
+    Args:
+        long_thresholds: Beklenen getiri bu değerin üzerindeyse long pozisyon
+        short_thresholds: Beklenen getiri bu değerin altındaysa short pozisyon
+            (-inf short pozisyonu kapatır, strateji long/flat olur)
+        cost_bps: İşlem maliyeti (baz puan, pozisyon değişimi başına)
+        slippage_bps: Kayma (baz puan, pozisyon değişimi başına)
+
+    Returns:
+        pd.DataFrame: Her satırı bir konfigürasyon olan grid
+    """
+    grids = np.meshgrid(
+        np.asarray(long_thresholds, dtype='float64'),
+        np.asarray(short_thresholds, dtype='float64'),
+        np.asarray(cost_bps, dtype='float64'),
+        np.asarray(slippage_bps, dtype='float64'),
+        indexing='ij',
+    )
+    return pd.DataFrame({
+        'long_threshold': grids[0].ravel(),
+        'short_threshold': grids[1].ravel(),
+        'cost_bps': grids[2].ravel(),
+        'slippage_bps': grids[3].ravel(),
+    })
+
+
+def simulate_positions(
+    realized_returns: np.ndarray,
+    positions: np.ndarray,
+    cost_rate: np.ndarray,
+) -> Dict[str, np.ndarray]:
+    """
+    Pozisyon matrisinden getiri, özsermaye eğrisi ve risk metriklerini hesaplar.
+
+    Tüm hesaplamalar (n_konfigürasyon, n_gün) matrisleri üzerinde yapılır,
+    gün bazında Python döngüsü yoktur.
+
+    Args:
+        realized_returns: Gerçekleşen ertesi gün getirisi, (n_gün,)
+        positions: -1/0/1 pozisyonları, (n_konfigürasyon, n_gün)
+        cost_rate: Birim pozisyon değişimi başına toplam maliyet, (n_konfigürasyon,)
+
+    Returns:
+        Dict[str, np.ndarray]: Konfigürasyon başına metrikler ve özsermaye eğrileri
+    """
+    # Pozisyon değişimi (ilk gün sıfır pozisyondan başlanır)
+    turnover = np.abs(np.diff(positions, axis=1, prepend=0.0))
+    strategy_returns = positions * realized_returns[None, :] - turnover * cost_rate[:, None]
+
+    equity = np.cumprod(1.0 + strategy_returns, axis=1)
+    running_peak = np.maximum.accumulate(equity, axis=1)
+    max_drawdown = np.min(equity / running_peak - 1.0, axis=1)
+
+    mean_return = strategy_returns.mean(axis=1)
+    std_return = strategy_returns.std(axis=1, ddof=1) if strategy_returns.shape[1] > 1 else np.zeros(len(positions))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std_return > 0, mean_return / std_return * np.sqrt(TRADING_DAYS_PER_YEAR), 0.0)
+
+    # İsabet oranı: pozisyon açık günlerde yönün doğru tahmin edilme oranı
+    active_days = (positions != 0).sum(axis=1)
+    winning_days = (positions * realized_returns[None, :] > 0).sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        hit_rate = np.where(active_days > 0, winning_days / active_days, np.nan)
+
+    return {
+        'total_return': equity[:, -1] - 1.0,
+        'sharpe': sharpe,
+        'max_drawdown': max_drawdown,
+        'hit_rate': hit_rate,
+        'n_trades': (turnover > 0).sum(axis=1),
+        'exposure': active_days / positions.shape[1],
+        'equity': equity,
+    }
+
+
+def run_backtest_grid(
+    predictions: np.ndarray,
+    current_prices: np.ndarray,
+    next_prices: np.ndarray,
+    config_grid: pd.DataFrame,
+    chunk_size: int = 4096,
+) -> pd.DataFrame:
+    """
+    Tahminleri long/flat/short sinyallerine çevirir ve tüm konfigürasyonları simüle eder.
+
+    Tahmin edilen fiyattan beklenen getiri (tahmin / bugünkü fiyat - 1)
+    hesaplanır ve her konfigürasyonun eşikleriyle yayın (broadcast)
+    karşılaştırılarak pozisyon matrisi elde edilir. Bellek kullanımını
+    sınırlamak için konfigürasyonlar parçalar halinde işlenir.
+
+    Args:
+        predictions: Ertesi gün kapanış fiyatı tahminleri, (n_gün,)
+        current_prices: Tahmin günündeki kapanış fiyatı, (n_gün,)
+        next_prices: Gerçekleşen ertesi gün kapanış fiyatı, (n_gün,)
+        config_grid: build_config_grid çıktısı
+        chunk_size: Aynı anda simüle edilecek konfigürasyon sayısı
+
+    Returns:
+        pd.DataFrame: Konfigürasyon başına total_return, sharpe, max_drawdown,
+        hit_rate, n_trades ve exposure sütunları eklenmiş grid
+    """
+    predictions = np.asarray(predictions, dtype='float64')
+    current_prices = np.asarray(current_prices, dtype='float64')
+    next_prices = np.asarray(next_prices, dtype='float64')
+
+    expected = predictions / current_prices - 1.0
+    realized = next_prices / current_prices - 1.0
+
+    long_thr = config_grid['long_threshold'].to_numpy()
+    short_thr = config_grid['short_threshold'].to_numpy()
+    cost_rate = (config_grid['cost_bps'].to_numpy() + config_grid['slippage_bps'].to_numpy()) / 10_000.0
+
+    metric_names = ['total_return', 'sharpe', 'max_drawdown', 'hit_rate', 'n_trades', 'exposure']
+    metrics = {name: np.empty(len(config_grid)) for name in metric_names}
+
+    for start in range(0, len(config_grid), chunk_size):
+        stop = start + chunk_size
+        positions = (
+            (expected[None, :] > long_thr[start:stop, None]).astype('float64')
+            - (expected[None, :] < short_thr[start:stop, None]).astype('float64')
+        )
+        chunk = simulate_positions(realized, positions, cost_rate[start:stop])
+        for name in metric_names:
+            metrics[name][start:stop] = chunk[name]
+
+    result = config_grid.copy()
+    for name in metric_names:
+        result[name] = metrics[name]
+    result['n_trades'] = result['n_trades'].astype('int64')
+    return result
+
+
+def equity_curve(
+    predictions: np.ndarray,
+    current_prices: np.ndarray,
+    next_prices: np.ndarray,
+    long_threshold: float,
+    short_threshold: float,
+    cost_bps: float,
+    slippage_bps: float,
+) -> np.ndarray:
+    """
+    Tek bir konfigürasyon için özsermaye eğrisini döndürür.
+
+    Args:
+        predictions: Ertesi gün kapanış fiyatı tahminleri
+        current_prices: Tahmin günündeki kapanış fiyatı
+        next_prices: Gerçekleşen ertesi gün kapanış fiyatı
+        long_threshold: Long eşiği
+        short_threshold: Short eşiği (-inf ile short kapalı)
+        cost_bps: İşlem maliyeti (baz puan)
+        slippage_bps: Kayma (baz puan)
+
+    Returns:
+        np.ndarray: 1.0'dan başlayan günlük özsermaye eğrisi
+    """
+    expected = np.asarray(predictions, dtype='float64') / np.asarray(current_prices, dtype='float64') - 1.0
+    realized = np.asarray(next_prices, dtype='float64') / np.asarray(current_prices, dtype='float64') - 1.0
+    positions = ((expected > long_threshold).astype('float64') - (expected < short_threshold).astype('float64'))[None, :]
+    cost_rate = np.array([(cost_bps + slippage_bps) / 10_000.0])
+    return simulate_positions(realized, positions, cost_rate)['equity'][0]
+
+
+def run_model_backtests(
+    model_predictions: Dict[str, np.ndarray],
+    current_prices: np.ndarray,
+    next_prices: np.ndarray,
+    config_grid: pd.DataFrame,
+) -> pd.DataFrame:
+    """
+    Birden fazla modelin tahminlerini aynı grid üzerinde simüle eder.
+
+    Args:
+        model_predictions: Model adı -> ertesi gün kapanış fiyatı tahminleri
+        current_prices: Tahmin günündeki kapanış fiyatı
+        next_prices: Gerçekleşen ertesi gün kapanış fiyatı
+        config_grid: build_config_grid çıktısı
+
+    Returns:
+        pd.DataFrame: Başına 'model' sütunu eklenmiş, tüm modellerin grid sonuçları
+    """
+    results = []
+    for model_name, predictions in model_predictions.items():
+        grid_result = run_backtest_grid(predictions, current_prices, next_prices, config_grid)
+        grid_result.insert(0, 'model', model_name)
+        results.append(grid_result)
+    return pd.concat(results, ignore_index=True)
@@ -0,0 +1,272 @@
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Bir önceki kapanışın borsa tarafından düzeltildiği oran bu kadar 1'in altındaysa olay sayılır
+DEFAULT_DETECTION_TOLERANCE = 0.03
+
+# Tatil günleri verilmezse yalnızca hafta sonları seans dışı sayılır
+DEFAULT_HOLIDAYS: Tuple[str, ...] = ()
+
+# Hacim sütunları fiyatın tersiyle düzeltilir (işlem değeri TL cinsinden değişmez)
+VOLUME_KEYWORD = 'VOLUME'
+
+# Adında PRICE geçse de fiyat olmayan sütunlar: hacim (adet), tutar (TL) ve işlem sayısı
+# (örn. TRADED VALUE OF TRADES AT CLOSING PRICE düzeltilmez)
+NON_PRICE_KEYWORDS = (VOLUME_KEYWORD, 'VALUE', 'NUMBER OF')
+
+# Fiyat sütunlarını tanımlayan anahtar kelimeler
+PRICE_KEYWORDS = ('PRICE', 'VWAP', 'REMAINING BID', 'REMAINING ASK')
+
+
+@dataclass(frozen=True)
+class CorporateAction:
+    """
+    Bölünme / bedelsiz sermaye artırımı olayı.
+
+    Args:
+        ex_date: Hak kullanım (bölünme sonrası ilk işlem) tarihi
+        factor: Bu tarihten önceki fiyatların çarpılacağı oran
+            (örn. %100 bedelsiz veya 2:1 bölünme için 0.5); hacimler 1/factor ile çarpılır
+        source: 'detected' (CHANGE TO PREVIOUS CLOSING'den tespit) veya 'manual'
+    """
+
+    ex_date: pd.Timestamp
+    factor: float
+    source: str = 'manual'
+
+
+def price_columns(columns: Sequence[str]) -> List[str]:
+    """
+    Düzeltilecek fiyat sütunları (fiyat, VWAP ve kalan alış/satış fiyatları).
+
+    Hacim, tutar ve işlem sayısı sütunları adlarında PRICE geçse bile
+    hariçtir; böylece fiyat ve hacim listeleri ayrıktır.
+    """
+    selected = []
+    for col in columns:
+        name = col.strip().upper()
+        if any(keyword in name for keyword in NON_PRICE_KEYWORDS):
+            continue
+        if any(keyword in name for keyword in PRICE_KEYWORDS):
+            selected.append(col)
+    return selected
+
+
+def volume_columns(columns: Sequence[str]) -> List[str]:
+    """Düzeltilecek hacim (adet) sütunları."""
+    return [col for col in columns if VOLUME_KEYWORD in col.strip().upper()]
+
+
+def detect_corporate_actions(
+    dates: np.ndarray,
+    close: np.ndarray,
+    change_pct: np.ndarray,
+    previous: Optional[Tuple[np.datetime64, float]] = None,
+    tolerance: float = DEFAULT_DETECTION_TOLERANCE,
+    holidays: Sequence[str] = DEFAULT_HOLIDAYS,
+) -> List[CorporateAction]:
+    """
+    Ham kapanışlar ile borsanın önceki kapanışa göre değişim yüzdesinden olay tespiti.
+
+    Borsa değişim yüzdesini düzeltilmiş önceki kapanışa göre hesaplar:
+    ``close_t / (1 + change_t / 100)`` düzeltilmiş önceki kapanıştır. Ham
+    önceki kapanışa oranı 1'den belirgin küçükse t günü hak kullanım
+    günüdür ve oran düzeltme çarpanıdır. REFERENCE PRICE sütunu bu veride
+    0 olduğundan kullanılmaz.
+
+    Karşılaştırma yalnızca önceki satır bir önceki işlem seansıysa yapılır
+    (aradaki iş günü sayısı 1; hafta sonları ve ``holidays`` seans dışı).
+    Arada eksik veya elenmiş bir seans varsa ``1 + change/100`` tek seansı,
+    ham kapanış oranı ise birden çok seansı kapsar; bu satırlar olay
+    sayılmaz (tatil ertesi bir olay gerekirse elle girilmelidir).
+
+    Önceki veya sonraki satırda ters oranla geri dönen tek satırlık
+    sıçramalar (tekrarlı/yanlış tarihli satırlar) olay sayılmaz.
+
+    Args:
+        dates: Sıralı işlem tarihleri (datetime64)
+        close: Ham kapanış fiyatları
+        change_pct: CHANGE TO PREVIOUS CLOSING (%)
+        previous: Artımlı güncellemede önceki son satırın (tarih, ham kapanış) bilgisi
+        tolerance: Oranın 1'den sapma eşiği
+        holidays: Borsanın kapalı olduğu hafta içi günler ('YYYY-MM-DD')
+
+    Returns:
+        List[CorporateAction]: Tespit edilen olaylar (tarih sırasıyla)
+    """
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    close = np.asarray(close, dtype='float64')
+    change_pct = np.asarray(change_pct, dtype='float64')
+    if previous is not None:
+        prev_dates = np.r_[np.datetime64(previous[0], 'ns'), dates[:-1]]
+        prev_close = np.r_[previous[1], close[:-1]]
+    else:
+        prev_dates = np.r_[np.datetime64('NaT', 'ns'), dates[:-1]]
+        prev_close = np.r_[np.nan, close[:-1]]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = close / (1.0 + change_pct / 100.0) / prev_close
+
+    # Önceki satır bir önceki işlem seansı mı (busday_count NaT kabul etmez)
+    known = ~np.isnat(prev_dates) & ~np.isnat(dates)
+    consecutive = np.zeros(len(dates), dtype=bool)
+    consecutive[known] = np.busday_count(
+        prev_dates[known].astype('datetime64[D]'), dates[known].astype('datetime64[D]'),
+        holidays=list(holidays),
+    ) == 1
+    candidate = np.isfinite(ratio) & (ratio > 0) & (ratio < 1.0 - tolerance) & consecutive
+
+    # Komşu satırın oranı sıçramayı geri alıyorsa (tek satırlık sıçrama) veri hatasıdır
+    next_ratio = np.r_[ratio[1:], np.nan]
+    prev_ratio = np.r_[np.nan, ratio[:-1]]
+    with np.errstate(invalid='ignore'):
+        reverted = (np.abs(ratio * next_ratio - 1.0) < tolerance) | (np.abs(ratio * prev_ratio - 1.0) < tolerance)
+    events = np.flatnonzero(candidate & ~reverted)
+    return [CorporateAction(pd.Timestamp(dates[i]), float(ratio[i]), 'detected') for i in events]
+
+
+def cumulative_factors(dates: np.ndarray, events: Sequence[CorporateAction]) -> np.ndarray:
+    """Her tarihten sonraki olayların çarpanlarının çarpımı (son tarihlerde 1)."""
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    factors = np.ones(len(dates))
+    for event in events:
+        factors[:np.searchsorted(dates, np.datetime64(event.ex_date, 'ns'), side='left')] *= event.factor
+    return factors
+
+
+class AdjustmentFactorCache:
+    """
+    Hisse başına kümülatif düzeltme çarpanlarını diskte tutan önbellek.
+
+    Her hisse için işlenmiş tarihler, çarpan vektörü, olaylar ve son ham
+    kapanış saklanır. Yeni satırlar geldiğinde yalnızca bu satırlarda olay
+    aranır; yeni bir olay mevcut vektörde ``factors[tarih < ex_date] *= f``
+    ile tek vektörel çarpımla işlenir, geçmiş yeniden taranmaz. İşlenmiş
+    tarih öneki değişmişse (geçmiş veri düzeltilmiş) veya bir elle girilen
+    olay kaldırılmışsa çarpanlar baştan hesaplanır.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    def _path(self, ticker: str) -> Optional[Path]:
+        return self.cache_dir / f"{ticker}.pkl" if self.cache_dir is not None else None
+
+    def _load(self, ticker: str) -> Optional[dict]:
+        path = self._path(ticker)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"  [UYARI] Düzeltme çarpanı önbelleği okunamadı, yeniden hesaplanacak: {e}")
+            return None
+
+    def _save(self, ticker: str, state: dict) -> None:
+        path = self._path(ticker)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(state, f)
+
+    def factors(
+        self,
+        ticker: str,
+        dates: np.ndarray,
+        close: np.ndarray,
+        change_pct: np.ndarray,
+        manual_events: Sequence[CorporateAction] = (),
+        tolerance: float = DEFAULT_DETECTION_TOLERANCE,
+        holidays: Sequence[str] = DEFAULT_HOLIDAYS,
+    ) -> Tuple[np.ndarray, List[CorporateAction], bool]:
+        """
+        Hissenin tarihleri için kümülatif çarpan vektörünü döndürür (gerekirse artımlı günceller).
+
+        Args:
+            ticker: Hisse kodu
+            dates, close, change_pct: Sıralı ham tarih, kapanış ve değişim yüzdesi
+            manual_events: Elle girilen olaylar (tespit edilenlerle aynı tarihteyse elle girilen geçerlidir)
+            tolerance: Tespit eşiği
+            holidays: Seans dışı hafta içi günler (değişirse çarpanlar baştan hesaplanır)
+
+        Returns:
+            Tuple[np.ndarray, List[CorporateAction], bool]: (çarpanlar, tüm olaylar, önbellekten artımlı mı)
+        """
+        dates = np.asarray(dates, dtype='datetime64[ns]')
+        manual = sorted(manual_events, key=lambda event: event.ex_date)
+        state = self._load(ticker)
+
+        incremental = (
+            state is not None
+            and state['tolerance'] == tolerance
+            and state.get('holidays') == sorted(holidays)
+            and set(state['manual']) <= set(manual)
+            and len(state['dates']) <= len(dates)
+            and np.array_equal(state['dates'], dates[:len(state['dates'])])
+        )
+        if incremental:
+            start = len(state['dates'])
+            previous = (state['dates'][-1], state['last_close']) if start else None
+            detected = state['detected'] + detect_corporate_actions(
+                dates[start:], close[start:], change_pct[start:], previous, tolerance, holidays
+            )
+            factors = np.r_[state['factors'], np.ones(len(dates) - start)]
+            applied = set(state['events'])
+        else:
+            detected = detect_corporate_actions(dates, close, change_pct, tolerance=tolerance, holidays=holidays)
+            factors = np.ones(len(dates))
+            applied = set()
+
+        manual_dates = {event.ex_date for event in manual}
+        events = sorted(
+            [event for event in detected if event.ex_date not in manual_dates] + manual,
+            key=lambda event: event.ex_date,
+        )
+        stale = applied - set(events)
+        if stale:
+            # Tespit edilen bir olayın yerini elle girilen aldı; çarpanlar baştan kurulur
+            factors = cumulative_factors(dates, events)
+            incremental = False
+        else:
+            # Yeni olaylar (ve yeni satırlardan önceki eski olaylar) vektöre tek çarpımla işlenir
+            start = len(state['dates']) if incremental else 0
+            for event in events:
+                ex = np.searchsorted(dates, np.datetime64(event.ex_date, 'ns'), side='left')
+                if event not in applied:
+                    factors[:ex] *= event.factor
+                elif ex > start:
+                    factors[start:ex] *= event.factor
+
+        self._save(ticker, {
+            'dates': dates, 'factors': factors, 'detected': detected, 'manual': manual,
+            'events': events, 'last_close': float(close[-1]) if len(close) else np.nan, 'tolerance': tolerance,
+            'holidays': sorted(holidays),
+        })
+        return factors, events, incremental
+
+
+def adjust_frame(df: pd.DataFrame, factors: np.ndarray) -> pd.DataFrame:
+    """
+    Fiyat sütunlarını çarpanla, hacim sütunlarını çarpanın tersiyle tek vektörel çarpımda düzeltir.
+
+    Sütun başına üs (+1 fiyat, -1 hacim) ile (n, sütun) çarpan matrisi
+    ``factors[:, None] ** üs`` kurulur ve değer matrisi bir kez çarpılır.
+    """
+    prices = price_columns(df.columns)
+    volumes = volume_columns(df.columns)
+    columns = prices + volumes
+    if not columns or np.all(factors == 1.0):
+        return df
+
+    exponents = np.r_[np.ones(len(prices)), -np.ones(len(volumes))]
+    adjusted = df[columns].to_numpy(dtype='float64') * factors[:, None] ** exponents[None, :]
+    df = df.copy()
+    df[columns] = adjusted
+    return df
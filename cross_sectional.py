@@ -0,0 +1,217 @@
+import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from archive_source import ArchiveMember, CsvSource, map_sources, read_csv_source, source_signature
+
+# Panel matrislerinde kullanılan sütunlar (ham BIST CSV sütun adı -> panel adı)
+PANEL_COLUMNS: Dict[str, str] = {
+    "CLOSING PRICE": "close",
+    "TOTAL TRADED VOLUME": "volume",
+    "TOTAL TRADED VALUE": "value",
+    "BIST 100 INDEX": "bist100",
+    "BIST 30 INDEX": "bist30",
+}
+
+# Göreli hacim için kullanılan pencere (gün)
+RELATIVE_VOLUME_WINDOW = 20
+
+
+def _source_key(source: CsvSource) -> str:
+    """Panel imzalarında kullanılan kaynak anahtarı (mutlak yol veya arşiv::üye)."""
+    if isinstance(source, ArchiveMember):
+        return f"{source.archive.resolve()}::{source.member}"
+    return str(Path(source).resolve())
+
+
+def load_ticker_frame(csv_path: CsvSource) -> Tuple[str, pd.DataFrame]:
+    """
+    Tek bir hisse CSV dosyasından (veya arşiv üyesinden) panel için gerekli sütunları yükler.
+
+    Args:
+        csv_path: BIST hisse CSV dosyası veya archive_source.ArchiveMember
+
+    Returns:
+        Tuple[str, pd.DataFrame]:
+        - Hisse kodu (INSTRUMENT SERIES CODE, yoksa dosya adı)
+        - TRADE DATE indeksli, PANEL_COLUMNS değerleri sütunlu DataFrame
+    """
+    # Sütun seçimi ada göre tek geçişte yapılır (arşiv akışı ikinci kez açılmaz)
+    wanted = {"TRADE DATE", "INSTRUMENT SERIES CODE", *PANEL_COLUMNS}
+    raw = read_csv_source(csv_path, encoding="utf-8-sig", usecols=lambda col: col.strip().upper() in wanted)
+    raw.columns = [col.strip().upper() for col in raw.columns]
+
+    ticker = csv_path.stem.upper()
+    if "INSTRUMENT SERIES CODE" in raw.columns and raw["INSTRUMENT SERIES CODE"].notna().any():
+        ticker = str(raw["INSTRUMENT SERIES CODE"].dropna().iloc[0]).strip().upper()
+
+    frame = pd.DataFrame(index=pd.to_datetime(raw["TRADE DATE"], errors='coerce'))
+    for source, target in PANEL_COLUMNS.items():
+        if source in raw.columns:
+            values = raw[source].astype(str).str.replace(',', '', regex=False)
+            frame[target] = pd.to_numeric(values, errors='coerce').to_numpy()
+        else:
+            frame[target] = np.nan
+
+    frame = frame[frame.index.notna()]
+    frame = frame[~frame.index.duplicated(keep='first')].sort_index()
+    frame.index.name = "TRADE DATE"
+    return ticker, frame
+
+
+class MarketPanel:
+    """
+    Tüm hisselerin tarih x hisse matrislerini tutan ve diskte önbellekleyen panel.
+
+    Her hisse için dosya imzası (boyut, mtime) saklanır. Yeni veya değişmiş
+    bir dosya eklendiğinde yalnızca o dosya okunur ve ilgili sütunlar
+    matrislerde güncellenir; diğer hisseler yeniden işlenmez.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.matrices: Dict[str, pd.DataFrame] = {name: pd.DataFrame() for name in PANEL_COLUMNS.values()}
+        self.signatures: Dict[str, Tuple[str, Tuple[int, int]]] = {}
+
+        if self.cache_path is not None and self.cache_path.exists():
+            try:
+                with open(self.cache_path, "rb") as f:
+                    cached = pickle.load(f)
+                self.matrices = cached["matrices"]
+                self.signatures = cached["signatures"]
+            except Exception as e:
+                print(f"  [UYARI] Panel önbelleği okunamadı, yeniden oluşturulacak: {e}")
+
+    @property
+    def tickers(self) -> List[str]:
+        return list(self.matrices["close"].columns)
+
+    def update(self, csv_paths: Sequence[CsvSource], max_workers: int = 1) -> List[str]:
+        """
+        Panel'i verilen dosyalarla senkronize eder.
+
+        Args:
+            csv_paths: Panelde yer alacak hisse CSV dosyaları veya arşiv üyeleri
+            max_workers: Yeni/değişmiş kaynakları paralel okuyan iş parçacığı sayısı
+
+        Returns:
+            List[str]: Yeniden okunan hisse kodları
+        """
+        current = {_source_key(p): p for p in csv_paths}
+
+        # Artık listede olmayan dosyaların hisselerini çıkar
+        removed = [key for key in self.signatures if key not in current]
+        for key in removed:
+            ticker, _ = self.signatures.pop(key)
+            self._drop_ticker(ticker)
+
+        # Yalnızca yeni veya değişmiş dosyaları oku
+        changed = []
+        for key, path in current.items():
+            signature = source_signature(path)
+            cached = self.signatures.get(key)
+            if cached is None or cached[1] != signature:
+                changed.append((key, path, signature))
+
+        reloaded = []
+        new_frames = {}
+        loaded = map_sources(load_ticker_frame, [path for _, path, _ in changed], max_workers)
+        for (key, _, signature), (ticker, frame) in zip(changed, loaded):
+            cached = self.signatures.get(key)
+            if cached is not None:
+                self._drop_ticker(cached[0])
+            self.signatures[key] = (ticker, signature)
+            new_frames[ticker] = frame
+            reloaded.append(ticker)
+
+        if new_frames:
+            for name in PANEL_COLUMNS.values():
+                added = pd.DataFrame({ticker: frame[name] for ticker, frame in new_frames.items()})
+                self.matrices[name] = self.matrices[name].join(added, how='outer').sort_index()
+
+        if (reloaded or removed) and self.cache_path is not None:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, "wb") as f:
+                pickle.dump({"matrices": self.matrices, "signatures": self.signatures}, f)
+
+        return reloaded
+
+    def _drop_ticker(self, ticker: str) -> None:
+        for name, matrix in self.matrices.items():
+            if ticker in matrix.columns:
+                self.matrices[name] = matrix.drop(columns=[ticker])
+
+
+def _weighted_index_return(
+    returns: pd.DataFrame, weights: pd.DataFrame, membership: pd.DataFrame
+) -> pd.Series:
+    """Endeks üyeleri üzerinden ağırlıklı ortalama getiri (satır bazında)."""
+    w = (weights * (membership == 1)).where(returns.notna(), 0.0).fillna(0.0)
+    weighted_sum = (returns.fillna(0.0) * w).sum(axis=1)
+    total_weight = w.sum(axis=1)
+    return (weighted_sum / total_weight.replace(0.0, np.nan))
+
+
+def compute_cross_sectional_features(panel: MarketPanel, ticker: str) -> pd.DataFrame:
+    """
+    Tarih x hisse matrisleri üzerinden piyasa geneli ve kesitsel özellikleri hesaplar.
+
+    Tüm hesaplamalar matris işlemleri ile tüm hisseler için birlikte yapılır,
+    ardından hedef hissenin sütunu seçilir.
+
+    Özellikler:
+        - bist100_return / bist30_return: Endeks üyeleri üzerinden önceki günün
+          işlem değeriyle ağırlıklandırılmış günlük getiri
+        - bist100_breadth: BIST 100 üyeleri içinde yükselen hisse oranı
+        - excess_return_bist100: Hissenin getirisi - BIST 100 ağırlıklı getirisi
+        - return_rank: Günlük getirinin tüm hisseler içindeki yüzdelik sırası
+        - volume_zscore: Log hacmin tüm hisseler içindeki z-skoru
+        - relative_volume_rank: Hacim / 20 günlük ortalama hacim oranının yüzdelik sırası
+
+    Args:
+        panel: Güncel MarketPanel
+        ticker: Özellikleri istenen hisse kodu
+
+    Returns:
+        pd.DataFrame: TRADE DATE indeksli kesitsel özellikler
+    """
+    close = panel.matrices["close"]
+    volume = panel.matrices["volume"]
+    value = panel.matrices["value"]
+
+    if ticker not in close.columns:
+        raise KeyError(f"{ticker} panelde bulunamadı")
+
+    returns = close.pct_change(fill_method=None)
+    prev_value = value.shift(1)
+
+    bist100_return = _weighted_index_return(returns, prev_value, panel.matrices["bist100"])
+    bist30_return = _weighted_index_return(returns, prev_value, panel.matrices["bist30"])
+
+    bist100_members = panel.matrices["bist100"] == 1
+    advancing = ((returns > 0) & bist100_members).sum(axis=1)
+    member_count = (returns.notna() & bist100_members).sum(axis=1)
+    breadth = advancing / member_count.replace(0, np.nan)
+
+    log_volume = np.log(volume.where(volume > 0))
+    # Kesitsel std sıfırsa (tüm hacimler eşit) z-skoru 0 kabul edilir
+    volume_std = log_volume.std(axis=1).replace(0.0, np.nan)
+    volume_z = log_volume.sub(log_volume.mean(axis=1), axis=0).div(volume_std, axis=0)
+    volume_z = volume_z.where(volume_std.notna().to_numpy()[:, None] | log_volume.isna(), 0.0)
+
+    relative_volume = volume / volume.rolling(RELATIVE_VOLUME_WINDOW, min_periods=1).mean()
+
+    features = pd.DataFrame({
+        "bist100_return": bist100_return,
+        "bist30_return": bist30_return,
+        "bist100_breadth": breadth,
+        "excess_return_bist100": returns[ticker] - bist100_return,
+        "return_rank": returns.rank(axis=1, pct=True)[ticker],
+        "volume_zscore": volume_z[ticker],
+        "relative_volume_rank": relative_volume.rank(axis=1, pct=True)[ticker],
+    })
+    features.index.name = "TRADE DATE"
+    return features
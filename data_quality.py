@@ -0,0 +1,166 @@
+import json
+import warnings
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+# Robust z-skoru (medyan/MAD) bu eşiği aşan değerler aykırı kabul edilir
+DEFAULT_OUTLIER_THRESHOLD = 5.0
+
+# Raporda listelenecek en uzun takvim boşluğu sayısı
+MAX_REPORTED_GAPS = 20
+
+
+def _column_thresholds(columns, rules: Dict[str, Dict[str, Any]]):
+    """
+    Her sütun için geçerlilik eşiğini ve karşılaştırma türünü belirler.
+
+    Kurallar thyao_dataset.main() içindeki kritik sütun kurallarıyla aynı
+    mantığı izler: sıfıra izin varsa ``x < min``, yoksa fiyat sütunları için
+    ``x < -1000``, diğerleri için ``x <= min``; sıfıra izin verilmeyen
+    sütunlarda NaN da geçersiz sayılır.
+
+    Returns:
+        Tuple: (eşikler, katı karşılaştırma bayrağı, NaN geçersiz mi, sütun -> kural adı listesi)
+    """
+    n = len(columns)
+    thresholds = np.full(n, -np.inf)
+    inclusive = np.zeros(n, dtype=bool)
+    nan_invalid = np.zeros(n, dtype=bool)
+    rule_names = [[] for _ in range(n)]
+
+    for pattern, rule in rules.items():
+        if rule.get('min_value') is None:
+            continue
+        for j, col in enumerate(columns):
+            col_upper = str(col).strip().upper()
+            if pattern not in col_upper:
+                continue
+            rule_names[j].append(pattern)
+            if rule['allow_zero']:
+                threshold, is_inclusive = rule['min_value'], False
+            elif 'PRICE' in col_upper:
+                threshold, is_inclusive = -1000, False
+                nan_invalid[j] = True
+            else:
+                threshold, is_inclusive = rule['min_value'], True
+                nan_invalid[j] = True
+            # Birden fazla kural eşleşirse en katı eşik kullanılır
+            if threshold > thresholds[j] or (threshold == thresholds[j] and is_inclusive):
+                thresholds[j] = threshold
+                inclusive[j] = is_inclusive
+
+    return thresholds, inclusive, nan_invalid, rule_names
+
+
+def profile_data_quality(
+    df: pd.DataFrame,
+    date_col: Optional[str],
+    rules: Dict[str, Dict[str, Any]],
+    suspended_col: Optional[str] = None,
+    outlier_threshold: float = DEFAULT_OUTLIER_THRESHOLD,
+) -> Dict[str, Any]:
+    """
+    Veri kalitesi raporunu tek vektörel geçişte oluşturur.
+
+    Sayısal sütunlar bir kez NumPy matrisine alınır; eksik değerler, kural
+    bazında geçersiz değerler ve aykırı değerler bu matris üzerinde sütun
+    vektörleriyle yayın (broadcast) yapılarak hesaplanır. Tarih sütunu için
+    tekrarlanan tarihler ve işlem takvimindeki boşluklar (iş günü) raporlanır.
+
+    Args:
+        df: İncelenecek DataFrame
+        date_col: TRADE DATE sütunu (yoksa None)
+        rules: Sütun deseni -> {'min_value', 'allow_zero', ...} kuralları
+        suspended_col: SUSPENDED sütunu (yoksa None)
+        outlier_threshold: Robust z-skoru eşiği
+
+    Returns:
+        Dict[str, Any]: JSON'a yazılabilir kalite raporu
+    """
+    n_rows = len(df)
+    report: Dict[str, Any] = {'rows': n_rows, 'columns': len(df.columns)}
+
+    # Eksik değerler: tüm çerçeve için tek isna taraması
+    missing = df.isna().to_numpy().sum(axis=0)
+    report['missing'] = {str(col): int(count) for col, count in zip(df.columns, missing)}
+    report['missing_total'] = int(missing.sum())
+
+    numeric = df.select_dtypes(include='number')
+    numeric_cols = list(numeric.columns)
+    block = numeric.to_numpy(dtype='float64')
+    nan_mask = np.isnan(block)
+
+    # Geçersiz değerler: sütun başına eşik vektörü ile tek karşılaştırma
+    thresholds, inclusive, nan_invalid, rule_names = _column_thresholds(numeric_cols, rules)
+    with np.errstate(invalid='ignore'):
+        below = np.where(inclusive[None, :], block <= thresholds[None, :], block < thresholds[None, :])
+    invalid_mask = below | (nan_mask & nan_invalid[None, :])
+    invalid_counts = invalid_mask.sum(axis=0)
+
+    invalid_by_rule: Dict[str, Dict[str, int]] = {}
+    for j, col in enumerate(numeric_cols):
+        for rule in rule_names[j]:
+            invalid_by_rule.setdefault(rule, {})[str(col)] = int(invalid_counts[j])
+    report['invalid_by_rule'] = invalid_by_rule
+    report['invalid_rows'] = int(invalid_mask.any(axis=1).sum())
+
+    # Aykırı değerler: medyan/MAD tabanlı robust z-skoru
+    with np.errstate(invalid='ignore', divide='ignore'), warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # tamamı NaN sütunlar
+        median = np.nanmedian(block, axis=0) if n_rows else np.zeros(len(numeric_cols))
+        mad = np.nanmedian(np.abs(block - median[None, :]), axis=0) if n_rows else np.zeros(len(numeric_cols))
+        robust_z = np.abs(block - median[None, :]) / (1.4826 * mad[None, :])
+    outlier_mask = (robust_z > outlier_threshold) & np.isfinite(robust_z)
+    outlier_counts = outlier_mask.sum(axis=0)
+    report['outliers'] = {
+        str(col): int(count) for col, count in zip(numeric_cols, outlier_counts) if count > 0
+    }
+    report['outlier_rows'] = int(outlier_mask.any(axis=1).sum())
+    report['outlier_threshold'] = outlier_threshold
+
+    if suspended_col is not None and suspended_col in df.columns:
+        report['suspended_rows'] = int((df[suspended_col] == 1).sum())
+
+    # Tarih kontrolleri: tekrarlanan tarihler ve işlem takvimi boşlukları
+    if date_col is not None and date_col in df.columns:
+        dates = pd.to_datetime(df[date_col], errors='coerce')
+        report['invalid_dates'] = int(dates.isna().sum())
+        report['duplicate_dates'] = int(dates.dropna().duplicated(keep='first').sum())
+
+        unique_days = np.unique(dates.dropna().to_numpy().astype('datetime64[D]'))
+        if len(unique_days) > 1:
+            missing_business_days = np.busday_count(unique_days[:-1], unique_days[1:]) - 1
+            gap_idx = np.flatnonzero(missing_business_days > 0)
+            largest = gap_idx[np.argsort(missing_business_days[gap_idx])[::-1][:MAX_REPORTED_GAPS]]
+            report['calendar_gaps'] = {
+                'count': int(len(gap_idx)),
+                'missing_business_days': int(missing_business_days[gap_idx].sum()),
+                'largest': [
+                    {
+                        'after': str(unique_days[i]),
+                        'before': str(unique_days[i + 1]),
+                        'missing_business_days': int(missing_business_days[i]),
+                    }
+                    for i in largest
+                ],
+            }
+            report['date_range'] = [str(unique_days[0]), str(unique_days[-1])]
+
+    return report
+
+
+def write_quality_report(report: Dict[str, Any], output_path: Path) -> None:
+    """
+    Kalite raporunu JSON dosyası olarak kaydeder.
+
+    Args:
+        report: profile_data_quality çıktısı
+        output_path: Hedef .json dosyası
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,168 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+# Depo dosyaları: sıralı int64 tarih indeksi, (sütun, gün) float64 matrisi ve meta veri
+DATES_FILE = "dates.npy"
+VALUES_FILE = "values.npy"
+META_FILE = "meta.json"
+
+DateLike = Union[str, pd.Timestamp, np.datetime64, int]
+
+
+def _to_ns(value: DateLike) -> int:
+    """Tarihi depo indeksindeki int64 (epoch nanosaniye) değerine çevirir."""
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    return int(pd.Timestamp(value).value)
+
+
+def write_date_store(
+    df: pd.DataFrame,
+    date_col: str,
+    directory: Path,
+    source_key: Optional[str] = None,
+) -> List[str]:
+    """
+    Temizlenmiş veriyi tarih indeksli, bellek eşlemli depoya yazar.
+
+    TRADE DATE sıralı int64 dizisi olarak, sayısal sütunlar ise sütun başına
+    bitişik satırlardan oluşan (sütun, gün) matrisi olarak saklanır; böylece
+    bir sütunun tarih aralığı diskten kopyasız okunan bitişik bir dilimdir.
+    Sayısal olmayan sütunlar depoya alınmaz.
+
+    Args:
+        df: Temizlenmiş DataFrame
+        date_col: Tarih sütunu
+        directory: Depo klasörü
+        source_key: Kaynak verinin anahtarı (örn. aşama önbelleği anahtarı);
+            meta veride saklanır, depo güncelliği kontrolünde kullanılır
+
+    Returns:
+        List[str]: Depoya yazılan sütunlar
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    dates = pd.to_datetime(df[date_col])
+    valid = dates.notna().to_numpy()
+    dates_ns = dates[valid].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    order = np.argsort(dates_ns, kind='stable')
+
+    columns = [col for col in df.columns if col != date_col and pd.api.types.is_numeric_dtype(df[col])]
+    values = df.loc[valid, columns].to_numpy(dtype='float64')[order].T
+
+    np.save(directory / DATES_FILE, dates_ns[order])
+    np.save(directory / VALUES_FILE, np.ascontiguousarray(values))
+    # Meta veri en son yazılır: yarım kalan yazımda depo geçersiz sayılır
+    meta = {'columns': columns, 'rows': int(len(order)), 'date_col': date_col, 'source_key': source_key}
+    with open(directory / META_FILE, "w", encoding="utf-8") as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    return columns
+
+
+def read_store_meta(directory: Path) -> Optional[Dict[str, Any]]:
+    """Deponun meta verisini döndürür (depo yoksa veya okunamıyorsa None)."""
+    try:
+        with open(Path(directory) / META_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+class DateWindow:
+    """
+    Depodan seçilmiş bir tarih aralığı; diziler bellek eşlemli dosyanın görünümleridir.
+
+    Attributes:
+        dates: int64 tarih görünümü (epoch nanosaniye)
+        values: (sütun, gün) float64 görünümü
+        columns: Sütun adları (values satırlarıyla aynı sırada)
+    """
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray, columns: List[str]):
+        self.dates = dates
+        self.values = values
+        self.columns = columns
+        self._positions = {col: i for i, col in enumerate(columns)}
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def column(self, name: str) -> np.ndarray:
+        """Tek sütunun bitişik, kopyasız görünümü."""
+        return self.values[self._positions[name]]
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """Pencereyi tarih indeksli DataFrame olarak döndürür (veri kopyalanır)."""
+        columns = columns or self.columns
+        return pd.DataFrame(
+            {col: np.array(self.column(col)) for col in columns},
+            index=pd.DatetimeIndex(self.dates.view('datetime64[ns]'), name="TRADE DATE"),
+        )
+
+
+class DateIndexedStore:
+    """
+    Tarih indeksli, salt okunur bellek eşlemli veri deposu.
+
+    Dosyalar ``np.load(mmap_mode='r')`` ile açılır; yalnızca erişilen sayfalar
+    diskten okunur. Aralık, son N seans ve as-of sorguları sıralı tarih
+    indeksinde ikili arama (``np.searchsorted``) ile O(log n) sürede sınır
+    bulur ve kopyasız dilim döndürür.
+
+    Örnek:
+        store = DateIndexedStore(DATE_STORE_DIR / "THYAO")
+        window = store.range("2020-03-01", "2020-06-30")
+        closes = window.column("CLOSING PRICE")
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        meta = read_store_meta(self.directory)
+        if meta is None:
+            raise FileNotFoundError(f"Tarih deposu bulunamadı: {self.directory}")
+        self.meta = meta
+        self.columns: List[str] = meta['columns']
+        self.dates: np.ndarray = np.load(self.directory / DATES_FILE, mmap_mode='r')
+        self.values: np.ndarray = np.load(self.directory / VALUES_FILE, mmap_mode='r')
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def first_date(self) -> pd.Timestamp:
+        return pd.Timestamp(int(self.dates[0]))
+
+    @property
+    def last_date(self) -> pd.Timestamp:
+        return pd.Timestamp(int(self.dates[-1]))
+
+    def _window(self, lo: int, hi: int) -> DateWindow:
+        return DateWindow(self.dates[lo:hi], self.values[:, lo:hi], self.columns)
+
+    def range(self, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> DateWindow:
+        """[start, end] kapalı aralığındaki seanslar (None: sınırsız)."""
+        lo = 0 if start is None else int(np.searchsorted(self.dates, _to_ns(start), side='left'))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, _to_ns(end), side='right'))
+        return self._window(lo, max(lo, hi))
+
+    def last(self, n: int, as_of: Optional[DateLike] = None) -> DateWindow:
+        """as_of tarihine kadarki (dahil) son n seans (as_of None ise depodaki son n seans)."""
+        hi = len(self.dates) if as_of is None else int(np.searchsorted(self.dates, _to_ns(as_of), side='right'))
+        return self._window(max(0, hi - n), hi)
+
+    def asof_index(self, date: DateLike) -> int:
+        """Tarihte veya öncesindeki son seansın konumu (önceki seans yoksa -1)."""
+        return int(np.searchsorted(self.dates, _to_ns(date), side='right')) - 1
+
+    def asof(self, date: DateLike) -> Optional[Dict[str, float]]:
+        """Tarihte veya öncesindeki son seansın değerleri (tarih dahil); önceki seans yoksa None."""
+        i = self.asof_index(date)
+        if i < 0:
+            return None
+        row = self.values[:, i]
+        return {'date': pd.Timestamp(int(self.dates[i])), **dict(zip(self.columns, row.tolist()))}
@@ -0,0 +1,216 @@
+import pickle
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Referans kantil kutusu sayısı (ondalıklar)
+DEFAULT_BINS = 10
+
+# Kayan izleme penceresi (gün)
+DEFAULT_WINDOW = 60
+
+# PSI > 0.25 genellikle belirgin dağılım kayması kabul edilir
+DEFAULT_PSI_THRESHOLD = 0.25
+
+# İki örneklemli KS kritik değer katsayısı (alfa = 0.05)
+KS_ALPHA_COEFFICIENT = 1.358
+
+# Karar vermeden önce pencerede olması gereken en az gün
+DEFAULT_MIN_ROWS = 20
+
+# Boş kutularda log(0) olmaması için alt sınır
+_PSI_EPSILON = 1e-4
+
+
+class DriftMonitor:
+    """
+    Yeni işlem günlerini eğitim dağılımlarıyla karşılaştıran akış tabanlı izleyici.
+
+    Eğitim verisinden özellik başına kompakt bir özet saklanır: kantil kutu
+    sınırları (sketch) ve kutu oranları, Welford ile ortalama/varyans. Her
+    yeni satır, son ``window`` günlük kayan penceredeki kutu sayaçlarını ve
+    Welford istatistiklerini günceller; pencereden çıkan gün geri alınır.
+    Güncelleme maliyeti özellik x kutu sayısıdır, geçmiş gün sayısından
+    bağımsızdır (satır başına O(1)).
+
+    Kayma ölçütleri:
+        - PSI: referans ve pencere kutu oranları arasındaki popülasyon kararlılık indeksi
+        - KS: kutu sınırlarındaki kümülatif dağılım farklarının en büyüğü
+          (iki örneklemli KS yaklaşımı), alfa=0.05 kritik değeriyle
+        - Ortalama kayması: pencere ortalamasının referanstan farkı (referans std cinsinden)
+
+    Args:
+        bins: Kantil kutusu sayısı
+        window: Kayan pencere (gün)
+        psi_threshold: Özellik başına PSI eşiği
+        min_rows: Karar için gereken en az pencere günü
+    """
+
+    def __init__(
+        self,
+        bins: int = DEFAULT_BINS,
+        window: int = DEFAULT_WINDOW,
+        psi_threshold: float = DEFAULT_PSI_THRESHOLD,
+        min_rows: int = DEFAULT_MIN_ROWS,
+    ):
+        self.bins = bins
+        self.window = window
+        self.psi_threshold = psi_threshold
+        self.min_rows = min_rows
+
+        self.features: List[str] = []
+        self.edges = np.empty((0, bins - 1))
+        self.reference_props = np.empty((0, bins))
+        self.reference_count = np.empty(0)
+        self.reference_mean = np.empty(0)
+        self.reference_std = np.empty(0)
+
+        self._recent: Deque[np.ndarray] = deque()
+        self.rows_seen = 0
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        p = len(self.features)
+        self.counts = np.zeros((p, self.bins))
+        self.count = np.zeros(p)
+        self.mean = np.zeros(p)
+        self.m2 = np.zeros(p)
+        self._recent.clear()
+
+    def _bin(self, values: np.ndarray) -> np.ndarray:
+        """(..., p) değerlerin özellik başına kutu indeksi; NaN için -1."""
+        bins = (values[..., :, None] > self.edges).sum(axis=-1)
+        return np.where(np.isnan(values), -1, bins)
+
+    def fit(self, X: pd.DataFrame) -> "DriftMonitor":
+        """Eğitim özelliklerinden referans özetini çıkarır ve pencereyi sıfırlar."""
+        values = X.to_numpy(dtype='float64')
+        self.features = list(X.columns)
+        quantiles = np.linspace(0, 1, self.bins + 1)[1:-1]
+        self.edges = np.nanquantile(values, quantiles, axis=0).T  # (p, bins-1)
+
+        # Kutu oranları aynı kutulama fonksiyonuyla (tekrarlı sınırlar dahil) hesaplanır
+        binned = self._bin(values)
+        counts = np.stack([(binned == b).sum(axis=0) for b in range(self.bins)], axis=1)
+        self.reference_count = counts.sum(axis=1).astype('float64')
+        self.reference_props = counts / np.maximum(self.reference_count, 1)[:, None]
+
+        # Referans ortalama/std (Welford ile aynı örneklem varyansı)
+        self.reference_mean = np.nanmean(values, axis=0)
+        self.reference_std = np.nanstd(values, axis=0, ddof=1)
+        self.rows_seen = 0
+        self._reset_window()
+        return self
+
+    def update(self, row: Sequence[float]) -> None:
+        """Yeni günü pencereye ekler; pencere doluysa en eski gün çıkarılır."""
+        x = np.asarray(row, dtype='float64')
+        binned = self._bin(x)
+        valid = binned >= 0
+        positions = np.flatnonzero(valid)
+        self.counts[positions, binned[valid]] += 1
+
+        # Welford: yeni değeri ekle
+        self.count[valid] += 1
+        delta = np.where(valid, x - self.mean, 0.0)
+        self.mean[valid] += delta[valid] / self.count[valid]
+        self.m2[valid] += delta[valid] * (x[valid] - self.mean[valid])
+
+        self._recent.append(x)
+        self.rows_seen += 1
+        if len(self._recent) > self.window:
+            self._remove(self._recent.popleft())
+
+    def _remove(self, x: np.ndarray) -> None:
+        binned = self._bin(x)
+        valid = binned >= 0
+        positions = np.flatnonzero(valid)
+        self.counts[positions, binned[valid]] -= 1
+
+        # Welford: pencereden çıkan değeri geri al
+        self.count[valid] -= 1
+        empty = valid & (self.count == 0)
+        keep = valid & ~empty
+        delta = np.where(keep, x - self.mean, 0.0)
+        self.mean[keep] -= delta[keep] / self.count[keep]
+        self.m2[keep] -= delta[keep] * (x[keep] - self.mean[keep])
+        self.mean[empty] = 0.0
+        self.m2[empty] = 0.0
+
+    def update_many(self, X: pd.DataFrame) -> pd.DataFrame:
+        """
+        Günleri sırayla işler ve her günden sonraki yeniden eğitim bayrağını döndürür.
+
+        Returns:
+            pd.DataFrame: X indeksli, gün başına kayan özellik sayısı ve bayrak
+        """
+        values = X[self.features].to_numpy(dtype='float64')
+        history = []
+        for x in values:
+            self.update(x)
+            drifted = self.drifted_features()
+            history.append({'drifted_features': len(drifted), 'retrain': bool(drifted)})
+        return pd.DataFrame(history, index=X.index)
+
+    def _statistics(self) -> dict:
+        n = self.count
+        props = self.counts / np.maximum(n, 1)[:, None]
+        ref = np.maximum(self.reference_props, _PSI_EPSILON)
+        cur = np.maximum(props, _PSI_EPSILON)
+        psi = ((cur - ref) * np.log(cur / ref)).sum(axis=1)
+
+        ks = np.abs(np.cumsum(props, axis=1) - np.cumsum(self.reference_props, axis=1)).max(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ks_critical = KS_ALPHA_COEFFICIENT * np.sqrt((n + self.reference_count) / (n * self.reference_count))
+            mean_shift = (self.mean - self.reference_mean) / self.reference_std
+        std = np.sqrt(np.where(n > 1, self.m2 / np.maximum(n - 1, 1), np.nan))
+        return {'n': n, 'psi': psi, 'ks': ks, 'ks_critical': ks_critical, 'mean_shift': mean_shift, 'std': std}
+
+    def drifted_features(self) -> List[str]:
+        """PSI eşiğini veya KS kritik değerini aşan özellikler (pencere yeterince doluysa)."""
+        stats = self._statistics()
+        ready = stats['n'] >= self.min_rows
+        drifted = ready & ((stats['psi'] > self.psi_threshold) | (stats['ks'] > stats['ks_critical']))
+        return [feature for feature, flag in zip(self.features, drifted) if flag]
+
+    @property
+    def retrain_needed(self) -> bool:
+        """Herhangi bir özellikte kayma varsa yeniden eğitim gerekir."""
+        return bool(self.drifted_features())
+
+    def status(self) -> pd.DataFrame:
+        """Özellik başına güncel kayma istatistikleri (PSI'ye göre azalan)."""
+        stats = self._statistics()
+        report = pd.DataFrame({
+            'feature': self.features,
+            'window_rows': stats['n'].astype(int),
+            'psi': stats['psi'],
+            'ks': stats['ks'],
+            'ks_critical': stats['ks_critical'],
+            'mean_shift_std': stats['mean_shift'],
+            'reference_mean': self.reference_mean,
+            'window_mean': np.where(stats['n'] > 0, self.mean, np.nan),
+            'reference_std': self.reference_std,
+            'window_std': stats['std'],
+        })
+        report['drifted'] = report['feature'].isin(self.drifted_features())
+        return report.sort_values('psi', ascending=False).reset_index(drop=True)
+
+    def save(self, path: Path) -> None:
+        """İzleyiciyi (referans özeti + pencere durumu) diske kaydeder."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path: Path) -> Optional["DriftMonitor"]:
+        """Kaydedilmiş izleyiciyi yükler (dosya yoksa None)."""
+        path = Path(path)
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)
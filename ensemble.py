@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+# Rejim etiketleri (volatilite eşiğinin altı / üstü)
+REGIME_NAMES = ('düşük volatilite', 'yüksek volatilite')
+
+
+def compute_oof_predictions(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    model_factories: Dict[str, Callable[[], Any]],
+    n_splits: int = 5,
+) -> pd.DataFrame:
+    """
+    Temel modellerin zaman sıralı katlamalarla out-of-fold (OOF) tahminlerini üretir.
+
+    TimeSeriesSplit ile her katlamada model yalnızca geçmiş satırlarla
+    eğitilir ve sonraki bloğu tahmin eder; böylece meta-öğrenici gelecekten
+    bilgi sızdırmayan tahminlerle eğitilir. İlk blok için tahmin yoktur (NaN).
+
+    Args:
+        X_train: Eğitim özellikleri (zaman sırasına göre)
+        y_train: Eğitim hedefi
+        model_factories: Model adı -> yeni (eğitilmemiş) model döndüren fonksiyon
+        n_splits: Katlama sayısı
+
+    Returns:
+        pd.DataFrame: X_train indeksli, model başına bir sütunluk OOF tahminleri
+    """
+    from sklearn.model_selection import TimeSeriesSplit
+
+    oof = pd.DataFrame(np.nan, index=X_train.index, columns=list(model_factories))
+    for train_idx, valid_idx in TimeSeriesSplit(n_splits=n_splits).split(X_train):
+        for name, factory in model_factories.items():
+            model = factory()
+            model.fit(X_train.iloc[train_idx], y_train.iloc[train_idx])
+            oof.iloc[valid_idx, oof.columns.get_loc(name)] = model.predict(X_train.iloc[valid_idx])
+    return oof
+
+
+def blend_weights(predictions: np.ndarray, y: np.ndarray, method: str = 'inverse_mse') -> np.ndarray:
+    """
+    Tahmin matrisi (n_gün, n_model) için toplamı 1 olan birleştirme ağırlıkları.
+
+    Args:
+        predictions: OOF tahminleri
+        y: Gerçek değerler
+        method: 'equal' (eşit), 'inverse_mse' (1/MSE ile orantılı) veya
+            'nnls' (negatif olmayan en küçük kareler, normalize)
+
+    Returns:
+        np.ndarray: Model başına ağırlık
+    """
+    n_models = predictions.shape[1]
+    if method == 'equal' or len(y) == 0:
+        return np.full(n_models, 1.0 / n_models)
+
+    if method == 'inverse_mse':
+        mse = np.mean((predictions - y[:, None]) ** 2, axis=0)
+        weights = 1.0 / np.maximum(mse, 1e-12)
+    elif method == 'nnls':
+        from scipy.optimize import nnls
+
+        weights, _ = nnls(predictions, y)
+    else:
+        raise ValueError(f"Desteklenmeyen birleştirme yöntemi: {method}")
+
+    total = weights.sum()
+    return weights / total if total > 0 else np.full(n_models, 1.0 / n_models)
+
+
+def assign_regimes(volatility: np.ndarray, threshold: float) -> np.ndarray:
+    """Volatilite eşiğine göre rejim etiketi (0: düşük, 1: yüksek); NaN düşük kabul edilir."""
+    return (np.nan_to_num(np.asarray(volatility, dtype='float64'), nan=-np.inf) > threshold).astype(np.int64)
+
+
+def _metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
+    mse = mean_squared_error(y_true, y_pred)
+    return {
+        'mse': mse,
+        'rmse': float(np.sqrt(mse)),
+        'mae': mean_absolute_error(y_true, y_pred),
+        'r2': r2_score(y_true, y_pred),
+    }
+
+
+def run_ensembles(
+    oof: pd.DataFrame,
+    y_train: pd.Series,
+    test_predictions: pd.DataFrame,
+    y_test: pd.Series,
+    train_regimes: np.ndarray,
+    test_regimes: np.ndarray,
+    ridge_alpha: float = 1.0,
+) -> Tuple[pd.DataFrame, Dict[str, np.ndarray], Dict[str, Any]]:
+    """
+    Önbellekteki OOF tahminleri üzerinde birleştirme yöntemlerini eğitip test eder.
+
+    Temel modeller yeniden eğitilmez: meta-modeller yalnızca OOF tahmin
+    matrisine, test değerlendirmesi ise temel modellerin mevcut test
+    tahminlerine uygulanır.
+
+    Yöntemler:
+        - Ortalama: eşit ağırlıklı birleştirme
+        - Ters MSE / NNLS: OOF hatasına göre ağırlıklandırma
+        - Ridge stacking: OOF tahminleri üzerinde Ridge meta-öğrenici
+        - Rejim bazlı: her volatilite rejimi için ayrı ters MSE ağırlıkları
+
+    Args:
+        oof: compute_oof_predictions çıktısı (sütunlar test_predictions ile aynı)
+        y_train: Eğitim hedefi (oof ile hizalı)
+        test_predictions: Temel modellerin test tahminleri
+        y_test: Test hedefi
+        train_regimes: Eğitim satırlarının rejim etiketleri
+        test_regimes: Test satırlarının rejim etiketleri
+        ridge_alpha: Ridge düzenlileştirme katsayısı
+
+    Returns:
+        Tuple:
+        - pd.DataFrame: Yöntem başına test metrikleri (temel modeller dahil)
+        - Dict[str, np.ndarray]: Yöntem başına test tahminleri
+        - Dict[str, Any]: Öğrenilen ağırlıklar / meta-model katsayıları
+    """
+    from sklearn.linear_model import Ridge
+
+    columns = list(test_predictions.columns)
+    has_oof = oof[columns].notna().all(axis=1).to_numpy()
+    P = oof[columns].to_numpy()[has_oof]
+    y = y_train.to_numpy(dtype='float64')[has_oof]
+    regimes = np.asarray(train_regimes)[has_oof]
+    T = test_predictions[columns].to_numpy(dtype='float64')
+    y_true = y_test.to_numpy(dtype='float64')
+
+    predictions: Dict[str, np.ndarray] = {name: T[:, j] for j, name in enumerate(columns)}
+    learned: Dict[str, Any] = {}
+
+    for label, method in [('Ortalama', 'equal'), ('Ters MSE ağırlıklı', 'inverse_mse'), ('NNLS ağırlıklı', 'nnls')]:
+        weights = blend_weights(P, y, method)
+        predictions[label] = T @ weights
+        learned[label] = dict(zip(columns, weights.round(6).tolist()))
+
+    stacker = Ridge(alpha=ridge_alpha).fit(P, y)
+    predictions['Ridge stacking'] = stacker.predict(T)
+    learned['Ridge stacking'] = {
+        'intercept': float(stacker.intercept_),
+        **dict(zip(columns, stacker.coef_.round(6).tolist())),
+    }
+
+    # Rejim bazlı ağırlıklar: rejimde yeterli OOF yoksa genel ağırlıklar kullanılır
+    global_weights = blend_weights(P, y, 'inverse_mse')
+    regime_blend = np.empty(len(T))
+    learned['Rejim bazlı'] = {}
+    for regime, name in enumerate(REGIME_NAMES):
+        in_regime = regimes == regime
+        weights = blend_weights(P[in_regime], y[in_regime], 'inverse_mse') if in_regime.sum() >= 2 else global_weights
+        test_mask = np.asarray(test_regimes) == regime
+        regime_blend[test_mask] = T[test_mask] @ weights
+        learned['Rejim bazlı'][name] = dict(zip(columns, weights.round(6).tolist()))
+    predictions['Rejim bazlı'] = regime_blend
+
+    report = pd.DataFrame([{'model': name, **_metrics(y_true, pred)} for name, pred in predictions.items()])
+    return report, predictions, learned
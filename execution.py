@@ -0,0 +1,189 @@
+import argparse
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Worker süreçlerinde native iş parçacığı sayısını belirleyen ortam değişkenleri
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "BLIS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+# Worker süreçlerinde etkin threadpool_limits nesnesi (süreç boyunca tutulur)
+_WORKER_LIMITER: Any = None
+
+
+class ExecutionConfig:
+    """
+    Merkezi paralellik ayarı: süreç sayısı x süreç başına native iş parçacığı.
+
+    BLAS (LinearRegression çözümü) ve OpenMP (KNN, HistGradientBoosting)
+    iş parçacığı havuzları her süreçte ``threads_per_process`` ile
+    sınırlandırılır; böylece süreç havuzu çekirdek sayısını aşmaz.
+
+    Args:
+        processes: Süreç sayısı (<= 0: 1)
+        threads_per_process: Süreç başına iş parçacığı (<= 0: çekirdek / süreç)
+    """
+
+    def __init__(self, processes: int = 1, threads_per_process: int = 0):
+        self.cpu_count = os.cpu_count() or 1
+        self.processes = max(1, processes)
+        self.threads_per_process = (
+            threads_per_process if threads_per_process > 0 else max(1, self.cpu_count // self.processes)
+        )
+
+    @property
+    def effective_parallelism(self) -> int:
+        return self.processes * self.threads_per_process
+
+    @property
+    def serial_threads(self) -> int:
+        """Süreç havuzu yokken ana süreçte kullanılacak iş parçacığı (çekirdek sayısıyla sınırlı)."""
+        return min(self.cpu_count, self.effective_parallelism)
+
+    @property
+    def oversubscribed(self) -> bool:
+        return self.effective_parallelism > self.cpu_count
+
+    def apply(self, threads: Optional[int] = None) -> Any:
+        """
+        Bulunulan süreçte native iş parçacığı sınırını uygular.
+
+        Args:
+            threads: Sınır (None: threads_per_process)
+
+        Returns:
+            threadpool_limits nesnesi; sınır, nesne ``restore_original_limits()``
+            ile geri alınana kadar geçerlidir
+        """
+        from threadpoolctl import threadpool_limits
+
+        return threadpool_limits(limits=threads or self.threads_per_process)
+
+    def summary(self) -> Dict[str, Any]:
+        """Çalıştırma kaydı için etkin paralellik ve yüklü native iş parçacığı havuzları."""
+        from threadpoolctl import threadpool_info
+
+        return {
+            'processes': self.processes,
+            'threads_per_process': self.threads_per_process,
+            'effective_parallelism': self.effective_parallelism,
+            'serial_threads': self.serial_threads,
+            'cpu_count': self.cpu_count,
+            'oversubscribed': self.oversubscribed,
+            'threadpools': [
+                {'user_api': info['user_api'], 'internal_api': info['internal_api'], 'num_threads': info['num_threads']}
+                for info in threadpool_info()
+            ],
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ExecutionConfig(processes={self.processes}, threads_per_process={self.threads_per_process}, "
+            f"cpu_count={self.cpu_count})"
+        )
+
+
+def init_worker_threads(threads: int) -> None:
+    """Worker başlatıcısı: süreç boyunca geçerli native iş parçacığı sınırını uygular."""
+    global _WORKER_LIMITER
+    from threadpoolctl import threadpool_limits
+
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    _WORKER_LIMITER = threadpool_limits(limits=threads)
+
+
+def benchmark_parallelism(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    combinations: Sequence[Tuple[int, int]],
+    tasks: Sequence[Tuple[str, Optional[int]]],
+    repeats: int = 1,
+) -> pd.DataFrame:
+    """
+    Süreç x iş parçacığı kombinasyonlarında LR/KNN değerlendirme hacmini ölçer.
+
+    Args:
+        X_train, y_train, X_test, y_test: Eğitim/test dizileri
+        combinations: (süreç, süreç başına iş parçacığı) çiftleri
+        tasks: ('lr', None) / ('knn', k) görevleri
+        repeats: Görev listesinin tekrar sayısı
+
+    Returns:
+        pd.DataFrame: Kombinasyon başına süre, görev/sn ve aşırı abonelik bayrağı
+    """
+    from shared_matrices import evaluate_models_parallel
+
+    all_tasks = list(tasks) * repeats
+    rows: List[Dict[str, Any]] = []
+    for processes, threads in combinations:
+        config = ExecutionConfig(processes, threads)
+        start = time.perf_counter()
+        # Tek süreçli kombinasyon da havuzla çalışır; havuz kurulum maliyeti tüm satırlarda aynıdır
+        evaluate_models_parallel(X_train, y_train, X_test, y_test, all_tasks, processes, threads)
+        seconds = time.perf_counter() - start
+        rows.append({
+            'processes': processes,
+            'threads_per_process': threads,
+            'effective_parallelism': config.effective_parallelism,
+            'oversubscribed': config.oversubscribed,
+            'seconds': seconds,
+            'tasks_per_second': len(all_tasks) / seconds if seconds > 0 else np.inf,
+        })
+    return pd.DataFrame(rows)
+
+
+def default_combinations(cpu_count: Optional[int] = None) -> List[Tuple[int, int]]:
+    """1, 2, 4, ... süreç için çekirdekleri paylaştıran ve bilinçli olarak aşırı abone olan kombinasyonlar."""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    combinations = []
+    processes = 1
+    while processes <= cpu_count:
+        combinations.append((processes, max(1, cpu_count // processes)))
+        if processes > 1:
+            combinations.append((processes, cpu_count))  # aşırı abonelik (karşılaştırma için)
+        processes *= 2
+    if cpu_count == 1:
+        combinations.append((2, 1))
+    return combinations
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Komut satırı: THYAO_train.csv / THYAO_test.csv üzerinde paralellik benchmark'ı."""
+    parser = argparse.ArgumentParser(description="Süreç x iş parçacığı paralellik benchmark'ı")
+    parser.add_argument("--train", type=Path, default=Path("THYAO_train.csv"))
+    parser.add_argument("--test", type=Path, default=Path("THYAO_test.csv"))
+    parser.add_argument("--k-values", type=int, nargs="+", default=[3, 5, 7, 9, 11, 15, 20])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", type=Path, default=Path("THYAO_parallelism_benchmark.csv"))
+    args = parser.parse_args(argv)
+
+    # Son sütun hedef (yarının kapanış fiyatı), diğerleri özellikler
+    train = pd.read_csv(args.train, encoding="utf-8-sig")
+    test = pd.read_csv(args.test, encoding="utf-8-sig")
+    tasks = [('lr', None)] + [('knn', k) for k in args.k_values]
+
+    result = benchmark_parallelism(
+        train.iloc[:, :-1].to_numpy(), train.iloc[:, -1].to_numpy(),
+        test.iloc[:, :-1].to_numpy(), test.iloc[:, -1].to_numpy(),
+        default_combinations(), tasks, args.repeats,
+    )
+    print(result.to_string(index=False))
+    result.to_csv(args.output, index=False, encoding="utf-8-sig")
+    print(f"[OK] Benchmark kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional, Tuple
+
+# Özellik başına permütasyon tekrarı
+DEFAULT_PERMUTATION_REPEATS = 10
+
+
+def squared_distances(X_test: np.ndarray, X_train: np.ndarray) -> np.ndarray:
+    """Test x eğitim öklid uzaklık kareleri (tek matris çarpımı, negatif yuvarlama hataları kırpılır)."""
+    d2 = (X_test ** 2).sum(axis=1)[:, None] + (X_train ** 2).sum(axis=1)[None, :] - 2.0 * X_test @ X_train.T
+    return np.maximum(d2, 0.0)
+
+
+def knn_predict_from_distances(d2: np.ndarray, y_train: np.ndarray, k: int) -> np.ndarray:
+    """Uzaklık matrisinden k en yakın komşunun hedef ortalaması (KNeighborsRegressor, uniform ağırlık)."""
+    neighbors = np.argpartition(d2, k - 1, axis=1)[:, :k]
+    return y_train[neighbors].mean(axis=1)
+
+
+def _r2(y_true: np.ndarray, y_pred: np.ndarray) -> np.ndarray:
+    """Son eksen boyunca R² (tahmin matrisleri için vektörel)."""
+    ss_res = ((y_pred - y_true) ** 2).sum(axis=-1)
+    ss_tot = ((y_true - y_true.mean()) ** 2).sum()
+    return 1.0 - ss_res / ss_tot
+
+
+def permutation_scores(
+    feature: int,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    d2: np.ndarray,
+    lr_coef: np.ndarray,
+    lr_pred: np.ndarray,
+    k: int,
+    repeats: int,
+    seed: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Tek özellik için LR ve KNN permütasyon R² skorları.
+
+    Modeller yeniden tahmin ettirilmez:
+        - LR doğrusal olduğundan permütasyonlu tahmin
+          ``pred + coef_j * (x_perm_j - x_j)`` ile tüm tekrarlar için tek
+          matris işlemiyle bulunur.
+        - KNN için önceden hesaplanmış uzaklık matrisinde yalnızca j.
+          özelliğin katkısı değiştirilir:
+          ``d2 - (x_j - t_j)² + (x_perm_j - t_j)²``; ardından k en yakın
+          komşu seçilir.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Tekrar başına (LR R², KNN R²)
+    """
+    rng = np.random.default_rng(seed)
+    column = X_test[:, feature]
+    permutations = np.stack([rng.permutation(len(column)) for _ in range(repeats)])
+    permuted = column[permutations]  # (tekrar, n_test)
+
+    lr_permuted = lr_pred[None, :] + lr_coef[feature] * (permuted - column[None, :])
+    lr_scores = _r2(y_test, lr_permuted)
+
+    train_column = X_train[:, feature]
+    base = d2 - (column[:, None] - train_column[None, :]) ** 2
+    knn_scores = np.empty(repeats)
+    for r in range(repeats):
+        d2_permuted = base + (permuted[r][:, None] - train_column[None, :]) ** 2
+        knn_scores[r] = _r2(y_test, knn_predict_from_distances(d2_permuted, y_train, k))
+    return lr_scores, knn_scores
+
+
+def _permutation_task(task: Tuple[int, int, int, int]) -> Tuple[int, np.ndarray, np.ndarray]:
+    """Worker görevi: paylaşılan bellekteki matrislerle tek özelliğin permütasyon skorları."""
+    from shared_matrices import worker_array
+
+    feature, k, repeats, seed = task
+    lr_scores, knn_scores = permutation_scores(
+        feature, worker_array('X_train'), worker_array('y_train'), worker_array('X_test'),
+        worker_array('y_test'), worker_array('d2'), worker_array('lr_coef'), worker_array('lr_pred'),
+        k, repeats, seed,
+    )
+    return feature, lr_scores, knn_scores
+
+
+def explain_models(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    lr_model: Any,
+    k: int,
+    repeats: int = DEFAULT_PERMUTATION_REPEATS,
+    max_workers: int = 1,
+    threads_per_worker: Optional[int] = None,
+    random_state: int = 42,
+) -> pd.DataFrame:
+    """
+    Tüm özellikler için LR ve KNN permütasyon önemi ile standartlaştırılmış LR katsayıları.
+
+    Test x eğitim uzaklık matrisi (KNN komşu indeksi) bir kez hesaplanır.
+    ``max_workers`` > 1 ise matrisler paylaşılan belleğe bir kez yayınlanır
+    ve özellikler süreç havuzunda dağıtılır (bkz. shared_matrices.py).
+
+    Args:
+        X_train, y_train, X_test, y_test: Eğitim/test verisi
+        lr_model: Eğitilmiş LinearRegression
+        k: KNN komşu sayısı (en iyi k)
+        repeats: Özellik başına permütasyon tekrarı
+        max_workers: Süreç sayısı (1: seri)
+        threads_per_worker: Worker başına BLAS/OpenMP iş parçacığı sınırı
+        random_state: Rastgelelik tohumu (özellik başına farklı tohum türetilir)
+
+    Returns:
+        pd.DataFrame: Özellik başına önem (R² düşüşü ortalaması/std), LR
+        katsayısı, standartlaştırılmış katsayı ve sıra; LR önemine göre azalan
+    """
+    columns = list(X_train.columns)
+    arrays: Dict[str, np.ndarray] = {
+        'X_train': X_train.to_numpy(dtype='float64'),
+        'y_train': y_train.to_numpy(dtype='float64'),
+        'X_test': X_test.to_numpy(dtype='float64'),
+        'y_test': y_test.to_numpy(dtype='float64'),
+    }
+    arrays['d2'] = squared_distances(arrays['X_test'], arrays['X_train'])
+    arrays['lr_coef'] = np.asarray(lr_model.coef_, dtype='float64')
+    arrays['lr_pred'] = np.asarray(lr_model.predict(X_test), dtype='float64')
+
+    lr_baseline = float(_r2(arrays['y_test'], arrays['lr_pred']))
+    knn_baseline = float(_r2(arrays['y_test'], knn_predict_from_distances(arrays['d2'], arrays['y_train'], k)))
+
+    tasks = [(j, k, repeats, random_state + j) for j in range(len(columns))]
+    if max_workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        from shared_matrices import SharedMatrixStore, _init_worker
+
+        with SharedMatrixStore() as store:
+            for name, array in arrays.items():
+                store.publish(name, array)
+            with ProcessPoolExecutor(
+                max_workers=max_workers, initializer=_init_worker, initargs=(dict(store.specs), threads_per_worker)
+            ) as pool:
+                results: List[Tuple[int, np.ndarray, np.ndarray]] = list(pool.map(_permutation_task, tasks))
+    else:
+        results = [
+            (j, *permutation_scores(j, arrays['X_train'], arrays['y_train'], arrays['X_test'], arrays['y_test'],
+                                    arrays['d2'], arrays['lr_coef'], arrays['lr_pred'], k, repeats, seed))
+            for j, k, repeats, seed in tasks
+        ]
+
+    train_std = arrays['X_train'].std(axis=0)
+    target_std = arrays['y_train'].std()
+    rows = []
+    for j, lr_scores, knn_scores in results:
+        lr_drop = lr_baseline - lr_scores
+        knn_drop = knn_baseline - knn_scores
+        rows.append({
+            'feature': columns[j],
+            'lr_importance': lr_drop.mean(),
+            'lr_importance_std': lr_drop.std(),
+            'knn_importance': knn_drop.mean(),
+            'knn_importance_std': knn_drop.std(),
+            'lr_coef': arrays['lr_coef'][j],
+            # 1 standart sapmalık özellik değişiminin hedefin standart sapması cinsinden etkisi
+            'lr_standardized_coef': arrays['lr_coef'][j] * train_std[j] / target_std if target_std > 0 else np.nan,
+        })
+
+    report = pd.DataFrame(rows)
+    report['lr_rank'] = report['lr_importance'].rank(ascending=False, method='min').astype(int)
+    report['knn_rank'] = report['knn_importance'].rank(ascending=False, method='min').astype(int)
+    return report.sort_values('lr_importance', ascending=False).reset_index(drop=True)
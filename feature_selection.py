@@ -0,0 +1,138 @@
+import numpy as np
+import pandas as pd
+from typing import List, Tuple
+
+# Ortak bilgi (MI) tahmini için kantil kutu sayısı
+DEFAULT_MI_BINS = 16
+
+
+def correlation_matrix(values: np.ndarray) -> np.ndarray:
+    """Sütunlar arası Pearson korelasyon matrisi (standartlaştırılmış matris çarpımı)."""
+    centered = values - values.mean(axis=0)
+    std = centered.std(axis=0)
+    z = centered / np.where(std > 0, std, 1.0)
+    return (z.T @ z) / len(values)
+
+
+def variance_inflation_factors(corr: np.ndarray) -> np.ndarray:
+    """
+    Tüm sütunların VIF değerlerini işaretli korelasyon matrisinin tek tersiyle hesaplar.
+
+    VIF_j = 1 / (1 - R²_j) değeri, korelasyon matrisinin tersinin j. köşegen
+    elemanına eşittir; sütun başına ayrı regresyon gerekmez. Tekil matrisler
+    için sözde ters (pinv) kullanılır. Mutlak korelasyon matrisi geçerli bir
+    korelasyon matrisi değildir (tersi negatif VIF verebilir), işaretli matris
+    verilmelidir.
+    """
+    return np.diag(np.linalg.pinv(corr))
+
+
+def _quantile_bins(values: np.ndarray, bins: int) -> np.ndarray:
+    """Her sütunu sıralarına göre eşit frekanslı kutulara ayırır (n, p) -> tamsayı."""
+    ranks = values.argsort(axis=0, kind='stable').argsort(axis=0, kind='stable')
+    return (ranks * bins // len(values)).astype(np.int64)
+
+
+def mutual_information(values: np.ndarray, target: np.ndarray, bins: int = DEFAULT_MI_BINS) -> np.ndarray:
+    """
+    Her sütunun hedefle ortak bilgisini (nat) kantil kutularıyla vektörel hesaplar.
+
+    Tüm sütunların ortak histogramları tek bir ``np.bincount`` çağrısıyla
+    (sütun, x kutusu, y kutusu) üçlü indeksinden elde edilir.
+    """
+    n, p = values.shape
+    x_bins = _quantile_bins(values, bins)
+    y_bins = _quantile_bins(np.asarray(target, dtype='float64')[:, None], bins)[:, 0]
+
+    flat = (np.arange(p)[None, :] * bins + x_bins) * bins + y_bins[:, None]
+    joint = np.bincount(flat.ravel(), minlength=p * bins * bins).reshape(p, bins, bins) / n
+
+    px = joint.sum(axis=2, keepdims=True)
+    py = joint.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = joint * np.log(joint / (px * py))
+    return np.nansum(terms, axis=(1, 2))
+
+
+def select_features(
+    X: pd.DataFrame,
+    y: pd.Series,
+    correlation_threshold: float = 0.98,
+    vif_threshold: float = 50.0,
+    mi_bins: int = DEFAULT_MI_BINS,
+) -> Tuple[List[str], pd.DataFrame]:
+    """
+    Gereksiz (yüksek korelasyonlu / çoklu doğrusal) özellikleri eler.
+
+    Adımlar:
+        1. Sabit sütunlar çıkarılır.
+        2. Sütunlar hedefle ortak bilgiye göre azalan sırada gezilir; daha
+           önce tutulan bir sütunla |korelasyonu| eşiği aşan sütun elenir
+           (çiftten hedefle daha çok bilgi taşıyan kalır).
+        3. En yüksek VIF eşiği aşıyorsa o sütun elenir ve VIF yeniden
+           hesaplanır.
+
+    Yalnızca eğitim verisi üzerinde çalıştırılmalıdır (test sızıntısı olmaması için).
+
+    Args:
+        X: Özellik matrisi
+        y: Hedef
+        correlation_threshold: Mutlak korelasyon eşiği
+        vif_threshold: VIF eşiği
+        mi_bins: Ortak bilgi için kutu sayısı
+
+    Returns:
+        Tuple[List[str], pd.DataFrame]:
+        - Tutulan sütunlar (orijinal sırayla)
+        - Sütun başına mi, max_corr, corr_with, vif ve eleme nedeni raporu
+    """
+    columns = list(X.columns)
+    values = X.to_numpy(dtype='float64')
+
+    mi = mutual_information(values, y.to_numpy(dtype='float64'), mi_bins)
+    # VIF işaretli korelasyon matrisinden; ikili eleme mutlak korelasyondan
+    signed_corr = correlation_matrix(values)
+    corr = np.abs(signed_corr)
+    constant = values.std(axis=0) == 0
+
+    reason = {col: '' for col in columns}
+    corr_with = {col: '' for col in columns}
+    for j in np.flatnonzero(constant):
+        reason[columns[j]] = 'sabit'
+
+    # Korelasyon elemesi: ortak bilgi sırasına göre açgözlü seçim
+    kept: List[int] = []
+    for j in np.argsort(-mi, kind='stable'):
+        if constant[j]:
+            continue
+        if kept:
+            kept_corr = corr[j, kept]
+            worst = int(np.argmax(kept_corr))
+            if kept_corr[worst] > correlation_threshold:
+                reason[columns[j]] = 'korelasyon'
+                corr_with[columns[j]] = columns[kept[worst]]
+                continue
+        kept.append(int(j))
+
+    # VIF elemesi: en yüksek VIF eşiğin altına inene kadar
+    vif_values = np.full(len(columns), np.nan)
+    while len(kept) > 1:
+        vif = variance_inflation_factors(signed_corr[np.ix_(kept, kept)])
+        vif_values[kept] = vif
+        worst = int(np.argmax(vif))
+        if vif[worst] <= vif_threshold:
+            break
+        reason[columns[kept[worst]]] = 'vif'
+        kept.pop(worst)
+
+    masked = np.where(np.eye(len(columns), dtype=bool), 0.0, corr)
+    report = pd.DataFrame({
+        'column': columns,
+        'mutual_information': mi,
+        'max_abs_corr': masked.max(axis=1) if len(columns) > 1 else np.zeros(len(columns)),
+        'corr_with': [corr_with[col] for col in columns],
+        'vif': vif_values,
+        'dropped': [reason[col] for col in columns],
+    })
+    selected = [col for col in columns if not reason[col]]
+    return selected, report
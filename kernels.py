@@ -0,0 +1,329 @@
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Numba isteğe bağlıdır; kurulu değilse aynı sonuçları veren NumPy/SciPy yolu kullanılır
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Desteklenen arka uçlar
+BACKENDS = ('numba', 'numpy')
+
+# Benchmark'ta çekirdek sonucunun referansla aynı sayılacağı en büyük mutlak fark
+PARITY_TOLERANCE = 1e-8
+
+# NumPy KNN yolunda sorgu parçası başına uzaklık matrisi eleman sınırı (~8 MB float64, önbellekte kalır)
+KNN_CHUNK_ELEMENTS = 1_000_000
+
+
+def resolve_backend(backend: Optional[str] = None) -> str:
+    """Arka ucu seçer: None ise Numba kuruluysa 'numba', değilse 'numpy'."""
+    if backend is None:
+        return 'numba' if NUMBA_AVAILABLE else 'numpy'
+    if backend not in BACKENDS:
+        raise ValueError(f"Desteklenmeyen çekirdek arka ucu: {backend}")
+    if backend == 'numba' and not NUMBA_AVAILABLE:
+        raise ImportError("'numba' arka ucu için numba paketi gerekli")
+    return backend
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _smooth_numba(x, alpha):
+        out = np.empty_like(x)
+        if len(x) == 0:
+            return out
+        out[0] = x[0]
+        for i in range(1, len(x)):
+            out[i] = alpha * x[i] + (1.0 - alpha) * out[i - 1]
+        return out
+
+    @njit(cache=True)
+    def _rsi_numba(close, window):
+        # Fark, kazanç/kayıp ve Wilder yumuşatması tek döngüde
+        n = len(close)
+        out = np.empty(n)
+        alpha = 1.0 / window
+        avg_gain = 0.0
+        avg_loss = 0.0
+        for i in range(n):
+            delta = close[i] - close[i - 1] if i > 0 else 0.0
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            if i == 0:
+                avg_gain, avg_loss = gain, loss
+            else:
+                avg_gain = alpha * gain + (1.0 - alpha) * avg_gain
+                avg_loss = alpha * loss + (1.0 - alpha) * avg_loss
+            if avg_loss == 0.0:
+                out[i] = 100.0 if avg_gain > 0.0 else 50.0
+            else:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        return out
+
+    @njit(cache=True)
+    def _atr_numba(high, low, close, window):
+        # Gerçek aralık ve Wilder yumuşatması tek döngüde
+        n = len(close)
+        out = np.empty(n)
+        alpha = 1.0 / window
+        for i in range(n):
+            tr = high[i] - low[i]
+            if i > 0:
+                tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+                out[i] = alpha * tr + (1.0 - alpha) * out[i - 1]
+            else:
+                out[i] = tr
+        return out
+
+    @njit(parallel=True, cache=True)
+    def _knn_topk_numba(X_query, X_train, k):
+        # Sorgu başına uzaklıklar hesaplanırken en yakın k sıralı tutulur (tam sıralama yok)
+        n_query, n_features = X_query.shape
+        n_train = X_train.shape[0]
+        distances = np.empty((n_query, k))
+        indices = np.empty((n_query, k), dtype=np.int64)
+        for q in prange(n_query):
+            best_d = np.full(k, np.inf)
+            best_i = np.full(k, -1, dtype=np.int64)
+            for t in range(n_train):
+                d = 0.0
+                for f in range(n_features):
+                    diff = X_query[q, f] - X_train[t, f]
+                    d += diff * diff
+                if d < best_d[k - 1]:
+                    pos = k - 1
+                    while pos > 0 and best_d[pos - 1] > d:
+                        best_d[pos] = best_d[pos - 1]
+                        best_i[pos] = best_i[pos - 1]
+                        pos -= 1
+                    best_d[pos] = d
+                    best_i[pos] = t
+            distances[q] = np.sqrt(best_d)
+            indices[q] = best_i
+        return distances, indices
+
+
+def _smooth_numpy(x: np.ndarray, alpha: float) -> np.ndarray:
+    """``y_t = alpha·x_t + (1-alpha)·y_{t-1}``, ``y_0 = x_0`` özyinelemesi (SciPy lfilter, C döngüsü)."""
+    from scipy.signal import lfilter
+
+    if len(x) == 0:
+        return x.copy()
+    return lfilter([alpha], [1.0, alpha - 1.0], x, zi=[(1.0 - alpha) * x[0]])[0]
+
+
+def ema(values: np.ndarray, span: int, backend: Optional[str] = None) -> np.ndarray:
+    """
+    Üstel hareketli ortalama; ``Series.ewm(span=span, adjust=False).mean()`` ile aynı.
+
+    Girdi sonlu olmalıdır (temizlenmiş seri).
+    """
+    x = np.ascontiguousarray(values, dtype='float64')
+    alpha = 2.0 / (span + 1.0)
+    if resolve_backend(backend) == 'numba':
+        return _smooth_numba(x, alpha)
+    return _smooth_numpy(x, alpha)
+
+
+def rsi(close: np.ndarray, window: int = 14, backend: Optional[str] = None) -> np.ndarray:
+    """
+    Wilder RSI: kazanç ve kayıplar ``ewm(alpha=1/window, adjust=False)`` ile yumuşatılır.
+
+    İlk günün farkı 0 kabul edilir; ortalama kayıp 0 ise RSI 100 (kazanç da
+    0 ise 50) olur, böylece sonlu girdide NaN üretilmez.
+    """
+    x = np.ascontiguousarray(close, dtype='float64')
+    if resolve_backend(backend) == 'numba':
+        return _rsi_numba(x, window)
+
+    delta = np.diff(x, prepend=x[:1])
+    avg_gain = _smooth_numpy(np.maximum(delta, 0.0), 1.0 / window)
+    avg_loss = _smooth_numpy(np.maximum(-delta, 0.0), 1.0 / window)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return np.where(avg_loss == 0.0, np.where(avg_gain > 0.0, 100.0, 50.0), out)
+
+
+def atr(high: np.ndarray, low: np.ndarray, close: np.ndarray, window: int = 14,
+        backend: Optional[str] = None) -> np.ndarray:
+    """
+    Wilder ATR: gerçek aralığın ``ewm(alpha=1/window, adjust=False)`` ortalaması.
+
+    İlk günün gerçek aralığı en yüksek - en düşük fiyattır.
+    """
+    h = np.ascontiguousarray(high, dtype='float64')
+    l = np.ascontiguousarray(low, dtype='float64')
+    c = np.ascontiguousarray(close, dtype='float64')
+    if resolve_backend(backend) == 'numba':
+        return _atr_numba(h, l, c, window)
+
+    prev_close = np.r_[c[:1], c[:-1]]
+    true_range = np.maximum.reduce([h - l, np.abs(h - prev_close), np.abs(l - prev_close)])
+    true_range[:1] = h[:1] - l[:1]
+    return _smooth_numpy(true_range, 1.0 / window)
+
+
+def knn_topk(X_query: np.ndarray, X_train: np.ndarray, k: int,
+             backend: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Kaba kuvvet öklid KNN: sorgu başına en yakın k eğitim satırı (yakından uzağa).
+
+    NumPy yolunda uzaklık kareleri sorgu parçaları halinde tek matris
+    çarpımıyla hesaplanır ve ``argpartition`` ile yalnızca k aday
+    sıralanır; Numba yolunda sorgular paralel döngüde, uzaklıklar
+    hesaplanırken en iyi k listesi güncellenerek bulunur (matris yok).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (n_query, k) uzaklıklar ve eğitim indeksleri
+    """
+    Q = np.ascontiguousarray(X_query, dtype='float64')
+    T = np.ascontiguousarray(X_train, dtype='float64')
+    if resolve_backend(backend) == 'numba':
+        return _knn_topk_numba(Q, T, k)
+
+    train_sq = (T ** 2).sum(axis=1)
+    chunk = max(1, KNN_CHUNK_ELEMENTS // max(len(T), 1))
+    distances = np.empty((len(Q), k))
+    indices = np.empty((len(Q), k), dtype=np.int64)
+    for start in range(0, len(Q), chunk):
+        block = Q[start:start + chunk]
+        # Sorgu normu satır içi sıralamayı değiştirmez; yalnızca seçilen k adaya eklenir
+        scores = block @ T.T
+        scores *= -2.0
+        scores += train_sq
+        candidates = np.argpartition(scores, k - 1, axis=1)[:, :k]
+        candidate_d2 = np.maximum(
+            np.take_along_axis(scores, candidates, axis=1) + (block ** 2).sum(axis=1)[:, None], 0.0
+        )
+        order = np.argsort(candidate_d2, axis=1, kind='stable')
+        indices[start:start + chunk] = np.take_along_axis(candidates, order, axis=1)
+        distances[start:start + chunk] = np.sqrt(np.take_along_axis(candidate_d2, order, axis=1))
+    return distances, indices
+
+
+def _time(func: Callable[[], Any], repeats: int) -> Tuple[float, Any]:
+    """En iyi süre (ilk çağrı JIT derlemesini ölçüme katmaz) ve son sonuç."""
+    result = func()
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_kernels(
+    n_rows: int = 1_000_000,
+    n_train: int = 20_000,
+    n_query: int = 2_000,
+    n_features: int = 20,
+    k: int = 20,
+    repeats: int = 3,
+    backends: Optional[Sequence[str]] = None,
+    seed: int = 42,
+) -> pd.DataFrame:
+    """
+    Çekirdekleri mevcut pandas/sklearn yoluyla süre ve sonuç farkı açısından karşılaştırır.
+
+    Referanslar: ``ewm(adjust=False)`` ile EMA/RSI/ATR ve brute-force
+    ``NearestNeighbors.kneighbors``. Fark sütunu çekirdek ile referans
+    arasındaki en büyük mutlak farktır (KNN için uzaklıklar ve k komşu
+    hedef ortalaması).
+
+    Returns:
+        pd.DataFrame: Çekirdek ve arka uç başına süre, referans süresi, hızlanma, en büyük fark ve parity (fark <= PARITY_TOLERANCE)
+    """
+    from sklearn.neighbors import NearestNeighbors
+
+    backends = list(backends) if backends is not None else [b for b in BACKENDS if b != 'numba' or NUMBA_AVAILABLE]
+    rng = np.random.default_rng(seed)
+    close = 10.0 + np.cumsum(rng.normal(0.0, 0.1, n_rows))
+    spread = np.abs(rng.normal(0.0, 0.05, n_rows))
+    high, low = close + spread, close - spread
+    s_close, s_high, s_low = pd.Series(close), pd.Series(high), pd.Series(low)
+
+    def pandas_rsi() -> np.ndarray:
+        delta = s_close.diff().fillna(0.0)
+        avg_gain = delta.clip(lower=0.0).ewm(alpha=1 / 14, adjust=False).mean()
+        avg_loss = (-delta).clip(lower=0.0).ewm(alpha=1 / 14, adjust=False).mean()
+        return (100.0 - 100.0 / (1.0 + avg_gain / avg_loss)).to_numpy()
+
+    def pandas_atr() -> np.ndarray:
+        prev_close = s_close.shift(1)
+        true_range = pd.concat([s_high - s_low, (s_high - prev_close).abs(), (s_low - prev_close).abs()],
+                               axis=1).max(axis=1)
+        return true_range.ewm(alpha=1 / 14, adjust=False).mean().to_numpy()
+
+    X_train = rng.normal(size=(n_train, n_features))
+    X_query = rng.normal(size=(n_query, n_features))
+    y_train = rng.normal(size=n_train)
+    neighbors = NearestNeighbors(n_neighbors=k, algorithm='brute').fit(X_train)
+
+    def sklearn_knn() -> np.ndarray:
+        distances, indices = neighbors.kneighbors(X_query)
+        return np.column_stack([distances, y_train[indices].mean(axis=1)])
+
+    def kernel_knn(backend: str) -> np.ndarray:
+        distances, indices = knn_topk(X_query, X_train, k, backend)
+        return np.column_stack([distances, y_train[indices].mean(axis=1)])
+
+    cases: Dict[str, Tuple[Callable[[], np.ndarray], Callable[[str], np.ndarray]]] = {
+        'ema_12': (lambda: s_close.ewm(span=12, adjust=False).mean().to_numpy(),
+                   lambda backend: ema(close, 12, backend)),
+        'rsi_14': (pandas_rsi, lambda backend: rsi(close, 14, backend)),
+        'atr_14': (pandas_atr, lambda backend: atr(high, low, close, 14, backend)),
+        f'knn_top{k}': (sklearn_knn, kernel_knn),
+    }
+
+    rows: List[Dict[str, Any]] = []
+    for name, (reference, kernel) in cases.items():
+        reference_seconds, expected = _time(reference, repeats)
+        for backend in backends:
+            seconds, result = _time(lambda: kernel(backend), repeats)
+            rows.append({
+                'kernel': name,
+                'backend': backend,
+                'seconds': seconds,
+                'reference_seconds': reference_seconds,
+                'speedup': reference_seconds / seconds if seconds > 0 else np.inf,
+                'max_abs_diff': float(np.nanmax(np.abs(result - expected))),
+            })
+    report = pd.DataFrame(rows)
+    report['parity'] = report['max_abs_diff'] <= PARITY_TOLERANCE
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Komut satırı: çekirdek benchmark'ı (sentetik seri ve KNN matrisleri)."""
+    parser = argparse.ArgumentParser(description="JIT/NumPy çekirdekleri ile pandas/sklearn karşılaştırması")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Gösterge serisi uzunluğu")
+    parser.add_argument("--train", type=int, default=20_000, help="KNN eğitim satırı")
+    parser.add_argument("--query", type=int, default=2_000, help="KNN sorgu satırı")
+    parser.add_argument("--features", type=int, default=20)
+    parser.add_argument("--k", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", type=Path, default=Path("THYAO_kernel_benchmark.csv"))
+    args = parser.parse_args(argv)
+
+    print(f"Arka uç: {resolve_backend()} (numba {'kurulu' if NUMBA_AVAILABLE else 'kurulu değil'})")
+    result = benchmark_kernels(args.rows, args.train, args.query, args.features, args.k, args.repeats)
+    print(result.to_string(index=False))
+    for _, row in result[result['speedup'] < 1.0].iterrows():
+        print(f"  [UYARI] {row['kernel']} ({row['backend']}) referanstan yavaş: {row['speedup']:.2f}x")
+    for _, row in result[~result['parity']].iterrows():
+        print(f"  ✗ {row['kernel']} ({row['backend']}) referansla uyuşmuyor: en büyük fark {row['max_abs_diff']:.3g}")
+    result.to_csv(args.output, index=False, encoding="utf-8-sig")
+    print(f"[OK] Benchmark kaydedildi: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Zaman sıralı doğrulama dilimi: eğitim setinin son kısmı
+DEFAULT_VALIDATION_FRACTION = 0.2
+
+# Erken durdurma: bu kadar adım iyileşme olmazsa eğitim durur
+DEFAULT_PATIENCE = 3
+
+# Her erken durdurma adımında eklenen iterasyon / ağaç sayısı
+DEFAULT_GROWTH_STEP = 25
+
+# Model adı -> ModelSpec
+MODEL_REGISTRY: Dict[str, "ModelSpec"] = {}
+
+
+class ModelSpec:
+    """
+    Kayıt defterindeki bir model ailesi.
+
+    Args:
+        name: Raporlarda görünen ad
+        factory: (n_jobs, random_state) -> eğitilmemiş model
+        growth_param: Erken durdurmada artırılan parametre (örn. max_iter,
+            n_estimators); None ise erken durdurma yapılmaz
+        max_growth: growth_param için üst sınır
+    """
+
+    def __init__(
+        self,
+        name: str,
+        factory: Callable[[int, int], Any],
+        growth_param: Optional[str] = None,
+        max_growth: int = 500,
+    ):
+        self.name = name
+        self.factory = factory
+        self.growth_param = growth_param
+        self.max_growth = max_growth
+
+
+def register_model(key: str, spec: ModelSpec) -> None:
+    """Yeni bir model ailesini kayıt defterine ekler."""
+    MODEL_REGISTRY[key] = spec
+
+
+def _linear_regression(n_jobs: int, random_state: int):
+    from sklearn.linear_model import LinearRegression
+
+    return LinearRegression()
+
+
+def _knn(n_jobs: int, random_state: int, n_neighbors: int = 5):
+    from sklearn.neighbors import KNeighborsRegressor
+
+    return KNeighborsRegressor(n_neighbors=n_neighbors, n_jobs=n_jobs)
+
+
+def _hist_gradient_boosting(n_jobs: int, random_state: int):
+    from sklearn.ensemble import HistGradientBoostingRegressor
+
+    # Erken durdurma burada zaman sıralı dilimle yapılır; sklearn'ün rastgele
+    # doğrulama ayrımı kapatılır
+    return HistGradientBoostingRegressor(
+        learning_rate=0.05, max_leaf_nodes=15, min_samples_leaf=10,
+        early_stopping=False, warm_start=True, max_iter=DEFAULT_GROWTH_STEP,
+        random_state=random_state,
+    )
+
+
+def _random_forest(n_jobs: int, random_state: int):
+    from sklearn.ensemble import RandomForestRegressor
+
+    return RandomForestRegressor(
+        n_estimators=DEFAULT_GROWTH_STEP, min_samples_leaf=3, max_features=0.5,
+        warm_start=True, n_jobs=n_jobs, random_state=random_state,
+    )
+
+
+register_model('linear_regression', ModelSpec('Linear Regression', _linear_regression))
+register_model('knn', ModelSpec('KNN Regressor', _knn))
+register_model(
+    'hist_gradient_boosting',
+    ModelSpec('HistGradientBoosting', _hist_gradient_boosting, 'max_iter', max_growth=500),
+)
+register_model('random_forest', ModelSpec('Random Forest', _random_forest, 'n_estimators', max_growth=400))
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """-1 veya 0 için mevcut çekirdek sayısını döndürür."""
+    if n_jobs is None or n_jobs <= 0:
+        return os.cpu_count() or 1
+    return n_jobs
+
+
+def _mse(y_true: np.ndarray, y_pred: np.ndarray) -> float:
+    return float(np.mean((np.asarray(y_true) - y_pred) ** 2))
+
+
+def fit_with_early_stopping(
+    spec: ModelSpec,
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    n_jobs: int,
+    random_state: int = 42,
+    validation_fraction: float = DEFAULT_VALIDATION_FRACTION,
+    patience: int = DEFAULT_PATIENCE,
+    growth_step: int = DEFAULT_GROWTH_STEP,
+    params: Optional[Dict[str, Any]] = None,
+) -> Tuple[Any, Optional[int]]:
+    """
+    Modeli zaman sıralı doğrulama dilimiyle erken durdurarak eğitir.
+
+    Eğitim setinin ilk ``1 - validation_fraction`` kısmıyla warm_start
+    kullanılarak model adım adım büyütülür (önceki ağaçlar yeniden eğitilmez)
+    ve son dilimdeki MSE izlenir. ``patience`` adım iyileşme olmazsa durulur;
+    ardından model en iyi boyutla tüm eğitim setinde yeniden eğitilir.
+
+    Args:
+        params: Fabrika varsayılanlarını geçersiz kılan model parametreleri
+
+    Returns:
+        Tuple[Any, Optional[int]]: (eğitilmiş model, seçilen iterasyon/ağaç sayısı)
+    """
+    def build():
+        return spec.factory(n_jobs, random_state).set_params(**(params or {}))
+
+    model = build()
+    if spec.growth_param is None:
+        return model.fit(X_train, y_train), None
+
+    split = int(len(X_train) * (1.0 - validation_fraction))
+    X_fit, y_fit = X_train.iloc[:split], y_train.iloc[:split]
+    X_val, y_val = X_train.iloc[split:], y_train.iloc[split:]
+
+    best_size, best_score, stale = growth_step, np.inf, 0
+    size = growth_step
+    while size <= spec.max_growth:
+        model.set_params(**{spec.growth_param: size})
+        model.fit(X_fit, y_fit)
+        score = _mse(y_val, model.predict(X_val))
+        if score < best_score - 1e-12:
+            best_size, best_score, stale = size, score, 0
+        else:
+            stale += 1
+            if stale >= patience:
+                break
+        size += growth_step
+
+    final_model = build()
+    final_model.set_params(**{spec.growth_param: best_size, 'warm_start': False})
+    return final_model.fit(X_train, y_train), best_size
+
+
+def train_registered_models(
+    model_keys: Sequence[str],
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    n_jobs: int = -1,
+    random_state: int = 42,
+    validation_fraction: float = DEFAULT_VALIDATION_FRACTION,
+    patience: int = DEFAULT_PATIENCE,
+    params: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Tuple[pd.DataFrame, Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Kayıt defterindeki modelleri eğitir, değerlendirir ve eğitim süresini ölçer.
+
+    OpenMP kullanan modeller (HistGradientBoosting) threadpoolctl ile,
+    diğerleri ``n_jobs`` ile aynı iş parçacığı sayısına sınırlandırılır.
+
+    Args:
+        model_keys: MODEL_REGISTRY anahtarları
+        X_train, y_train: Eğitim verisi (zaman sırasına göre)
+        X_test, y_test: Test verisi
+        n_jobs: İş parçacığı sayısı (-1: tüm çekirdekler)
+        random_state: Rastgelelik tohumu
+        validation_fraction: Erken durdurma için eğitim setinin son dilimi
+        patience: Erken durdurma sabrı (adım)
+        params: Model anahtarı -> parametre geçersiz kılmaları (örn. {'knn': {'n_neighbors': 20}})
+
+    Returns:
+        Tuple:
+        - pd.DataFrame: Model başına fit/predict süresi, seçilen boyut ve test metrikleri
+        - Dict[str, Any]: Eğitilmiş modeller
+        - Dict[str, np.ndarray]: Test tahminleri
+    """
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    from threadpoolctl import threadpool_limits
+
+    threads = resolve_n_jobs(n_jobs)
+    rows: List[Dict[str, Any]] = []
+    models: Dict[str, Any] = {}
+    predictions: Dict[str, np.ndarray] = {}
+
+    for key in model_keys:
+        spec = MODEL_REGISTRY[key]
+        with threadpool_limits(limits=threads, user_api='openmp'):
+            start = time.perf_counter()
+            model, best_size = fit_with_early_stopping(
+                spec, X_train, y_train, threads, random_state, validation_fraction, patience,
+                params=(params or {}).get(key),
+            )
+            fit_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            test_pred = model.predict(X_test)
+            predict_seconds = time.perf_counter() - start
+
+        test_mse = mean_squared_error(y_test, test_pred)
+        rows.append({
+            'model': spec.name,
+            'n_jobs': threads,
+            'fit_seconds': fit_seconds,
+            'predict_seconds': predict_seconds,
+            'best_size': best_size,
+            'test_mse': test_mse,
+            'test_rmse': float(np.sqrt(test_mse)),
+            'test_mae': mean_absolute_error(y_test, test_pred),
+            'test_r2': r2_score(y_test, test_pred),
+        })
+        models[spec.name] = model
+        predictions[spec.name] = test_pred
+
+    return pd.DataFrame(rows), models, predictions
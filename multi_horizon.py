@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+from typing import Dict, Sequence, Tuple
+
+
+def build_horizon_targets(
+    price: pd.Series, horizons: Sequence[int]
+) -> pd.DataFrame:
+    """
+    Tüm tahmin ufukları için hedef matrisini tek vektörel geçişte oluşturur.
+
+    Her ufuk h için hedef, h işlem günü sonraki kapanış fiyatıdır
+    (``price.shift(-h)`` ile aynı sonuç). Ufuk başına ayrı ``shift``
+    çağrısı yerine satır/ufuk indeks matrisi tek seferde çözülür.
+
+    Args:
+        price: Tarihe göre sıralanmış kapanış fiyatı serisi
+        horizons: Tahmin ufukları (gün), örn. [1, 5, 10, 20]
+
+    Returns:
+        pd.DataFrame: Satırları ``price`` ile hizalı, sütunları
+        ``target_h{h}`` olan hedef matrisi (geleceği olmayan günler NaN)
+    """
+    values = price.to_numpy(dtype='float64')
+    steps = np.asarray(horizons, dtype=np.int64)
+    n = len(values)
+
+    # (n, H) boyutlu hedef indeksleri: satır i için i + h
+    target_idx = np.arange(n)[:, None] + steps[None, :]
+    valid = target_idx < n
+    targets = np.where(valid, values[np.minimum(target_idx, n - 1)], np.nan)
+
+    columns = [f"target_h{h}" for h in steps]
+    return pd.DataFrame(targets, index=price.index, columns=columns)
+
+
+def horizon_metrics(
+    y_true: np.ndarray, y_pred: np.ndarray, horizons: Sequence[int]
+) -> pd.DataFrame:
+    """
+    MSE, RMSE, MAE ve R² metriklerini tüm ufuklar için tek seferde hesaplar.
+
+    Args:
+        y_true: Gerçek değerler, (n_örnek, n_ufuk)
+        y_pred: Tahminler, (n_örnek, n_ufuk)
+        horizons: Sütunlara karşılık gelen ufuklar
+
+    Returns:
+        pd.DataFrame: Ufuk başına bir satır içeren metrik tablosu
+    """
+    y_true = np.asarray(y_true, dtype='float64')
+    y_pred = np.asarray(y_pred, dtype='float64')
+
+    errors = y_true - y_pred
+    mse = np.mean(errors ** 2, axis=0)
+    mae = np.mean(np.abs(errors), axis=0)
+    sst = np.sum((y_true - y_true.mean(axis=0)) ** 2, axis=0)
+    sse = np.sum(errors ** 2, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r2 = np.where(sst > 0, 1.0 - sse / sst, np.nan)
+
+    return pd.DataFrame({
+        'horizon': list(horizons),
+        'mse': mse,
+        'rmse': np.sqrt(mse),
+        'mae': mae,
+        'r2': r2,
+    })
+
+
+def knn_predict_for_k_values(
+    knn_model, X_query: pd.DataFrame, Y_train: np.ndarray, k_values: Sequence[int]
+) -> Dict[int, np.ndarray]:
+    """
+    Tek bir komşu sorgusunu tüm k değerleri ve tüm ufuklar için kullanır.
+
+    Model en büyük k ile eğitilmiş olmalıdır. ``kneighbors`` komşuları
+    mesafeye göre sıralı döndürdüğü için ilk k komşu, n_neighbors=k ile
+    yapılan ayrı bir sorgunun komşularıdır.
+
+    Args:
+        knn_model: max(k_values) komşu ile eğitilmiş KNeighborsRegressor
+        X_query: Tahmin yapılacak özellikler
+        Y_train: Eğitim hedef matrisi, (n_eğitim, n_ufuk)
+        k_values: Denenecek k değerleri
+
+    Returns:
+        Dict[int, np.ndarray]: k -> (n_sorgu, n_ufuk) tahmin matrisi
+    """
+    max_k = max(k_values)
+    _, neighbor_idx = knn_model.kneighbors(X_query, n_neighbors=max_k)
+
+    # (n_sorgu, max_k, n_ufuk) komşu hedefleri; kümülatif toplam ile her k
+    # için ortalama tek geçişte elde edilir
+    neighbor_targets = Y_train[neighbor_idx]
+    cumulative = np.cumsum(neighbor_targets, axis=1)
+
+    return {k: cumulative[:, k - 1, :] / k for k in k_values}
+
+
+def run_multi_horizon(
+    X_train: pd.DataFrame,
+    Y_train: pd.DataFrame,
+    X_test: pd.DataFrame,
+    Y_test: pd.DataFrame,
+    horizons: Sequence[int],
+    k_values: Sequence[int],
+) -> Tuple[pd.DataFrame, Dict[str, np.ndarray], int]:
+    """
+    Linear Regression ve KNN modellerini tüm ufuklar için birlikte eğitir.
+
+    Linear Regression çok çıktılı regresyon olarak tek bir en küçük kareler
+    çözümüyle eğitilir. KNN için tek bir komşu sorgusu yapılır ve tüm k
+    değerleri ile ufuklar bu sorgudan türetilir.
+
+    Args:
+        X_train: Eğitim özellikleri
+        Y_train: Eğitim hedef matrisi (build_horizon_targets çıktısı)
+        X_test: Test özellikleri
+        Y_test: Test hedef matrisi
+        horizons: Tahmin ufukları
+        k_values: KNN için denenecek k değerleri
+
+    Returns:
+        Tuple[pd.DataFrame, Dict[str, np.ndarray], int]:
+        - Model ve ufuk başına test metrikleri
+        - Model adı -> test tahmin matrisi
+        - Ortalama R²'ye göre seçilen en iyi k
+    """
+    from sklearn.linear_model import LinearRegression
+    from sklearn.neighbors import KNeighborsRegressor
+
+    Y_train_values = Y_train.to_numpy(dtype='float64')
+    Y_test_values = Y_test.to_numpy(dtype='float64')
+
+    # Linear Regression: tüm ufuklar için tek çözüm
+    lr_model = LinearRegression()
+    lr_model.fit(X_train, Y_train_values)
+    lr_pred = lr_model.predict(X_test)
+    lr_metrics = horizon_metrics(Y_test_values, lr_pred, horizons)
+    lr_metrics.insert(0, 'model', 'Linear Regression')
+
+    # KNN: en büyük k ile tek sorgu, tüm k ve ufuklar için tekrar kullanılır
+    knn_model = KNeighborsRegressor(n_neighbors=max(k_values))
+    knn_model.fit(X_train, Y_train_values)
+    knn_preds = knn_predict_for_k_values(knn_model, X_test, Y_train_values, k_values)
+
+    best_k = max(
+        k_values,
+        key=lambda k: np.nanmean(horizon_metrics(Y_test_values, knn_preds[k], horizons)['r2']),
+    )
+    knn_metrics = horizon_metrics(Y_test_values, knn_preds[best_k], horizons)
+    knn_metrics.insert(0, 'model', f'KNN Regressor (k={best_k})')
+
+    report = pd.concat([lr_metrics, knn_metrics], ignore_index=True)
+    predictions = {'Linear Regression': lr_pred, 'KNN Regressor': knn_preds[best_k]}
+    return report, predictions, best_k
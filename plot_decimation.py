@@ -0,0 +1,102 @@
+import numpy as np
+from typing import Tuple
+
+# Yatay piksel başına çizilecek nokta sayısı (min/max için 2 yeterlidir)
+DEFAULT_POINTS_PER_PIXEL = 2
+
+# Bu kadar noktadan yoğun saçılım grafikleri hexbin ile çizilir
+DEFAULT_HEXBIN_MIN_POINTS = 5000
+
+
+def target_point_count(width_inches: float, dpi: int, points_per_pixel: int = DEFAULT_POINTS_PER_PIXEL) -> int:
+    """Şekil genişliğine göre çizgi başına hedef nokta sayısı (piksel sütunu x points_per_pixel)."""
+    return max(3, int(width_inches * dpi * points_per_pixel))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets ile seçilen noktaların indeksleri.
+
+    İlk ve son nokta korunur; aradaki noktalar ``n_out - 2`` kovaya bölünür
+    ve her kovadan, önceki seçilen nokta ile sonraki kovanın ortalamasıyla
+    en büyük üçgeni oluşturan nokta seçilir. Tepe ve dipler korunur.
+    Kova içi hesap vektöreldir; döngü yalnızca çıktı noktası kadar döner.
+
+    Args:
+        x, y: Sıralı x değerleri ve seri (sonlu)
+        n_out: Hedef nokta sayısı
+
+    Returns:
+        np.ndarray: Artan sıralı indeksler (n <= n_out ise tüm indeksler)
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def minmax_indices(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Min/max kovalarıyla seçilen noktaların indeksleri.
+
+    Seri ``n_out // 2`` eşit kovaya bölünür ve her kovanın en küçük ve en
+    büyük noktası tutulur; ilk ve son nokta her zaman dahildir. Tek
+    ``np.lexsort`` çağrısıyla (kova, değer) sırası bulunur.
+
+    Returns:
+        np.ndarray: Artan sıralı indeksler
+    """
+    n = len(y)
+    if n_out >= n or n_out < 2:
+        return np.arange(n)
+
+    buckets = n_out // 2
+    bucket = (np.arange(n) * buckets) // n
+    order = np.lexsort((y, bucket))
+    starts = np.searchsorted(bucket[order], np.arange(buckets))
+    ends = np.r_[starts[1:], n] - 1
+    return np.unique(np.r_[0, order[starts], order[ends], n - 1])
+
+
+def decimate(x: np.ndarray, y: np.ndarray, n_out: int, method: str = 'lttb') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Çizim için seriyi şeklini koruyarak seyreltir.
+
+    NaN olmayan noktalar üzerinde çalışır (hareketli ortalamaların başındaki
+    NaN'lar çizilmez, dolayısıyla görünüm değişmez).
+
+    Args:
+        x, y: Seri (x artan sıralı, sayısal)
+        n_out: Hedef nokta sayısı
+        method: 'lttb' veya 'minmax'
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Seyreltilmiş (x, y)
+    """
+    x = np.asarray(x)
+    y = np.asarray(y, dtype='float64')
+    finite = np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+
+    if method == 'lttb':
+        idx = lttb_indices(x.astype('float64'), y, n_out)
+    elif method == 'minmax':
+        idx = minmax_indices(y, n_out)
+    else:
+        raise ValueError(f"Desteklenmeyen seyreltme yöntemi: {method}")
+    return x[idx], y[idx]
@@ -0,0 +1,458 @@
+import argparse
+import json
+import os
+import pickle
+import socketserver
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+# Aynı toplu tahmine alınacak en fazla istek sayısı
+DEFAULT_MAX_BATCH_SIZE = 256
+
+# İlk istekten sonra diğer isteklerin beklendiği süre (saniye)
+DEFAULT_MAX_WAIT_SECONDS = 0.005
+
+# (hisse, tarih) yanıt önbelleğinin geçerlilik süresi (saniye) ve boyutu
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+DEFAULT_CACHE_MAX_ENTRIES = 10_000
+
+# Gecikme yüzdelikleri için saklanan son ölçüm sayısı
+LATENCY_WINDOW = 10_000
+
+
+def save_model_bundle(
+    output_path: Path,
+    ticker: str,
+    lr_model: Any,
+    knn_model: Any,
+    features: pd.DataFrame,
+    closing_prices: Optional[pd.Series] = None,
+) -> None:
+    """
+    Sunucunun yükleyeceği model paketini kaydeder.
+
+    Args:
+        output_path: Hedef .pkl dosyası
+        ticker: Hisse kodu
+        lr_model: Eğitilmiş LinearRegression
+        knn_model: Eğitilmiş KNeighborsRegressor
+        features: TRADE DATE indeksli özellik satırları (modelin sütun sırasıyla)
+        closing_prices: TRADE DATE indeksli kapanış fiyatları (yanıtta gösterilir)
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    bundle = {
+        'ticker': ticker,
+        'lr_model': lr_model,
+        'knn_model': knn_model,
+        'feature_columns': list(features.columns),
+        'features': features,
+        'closing_prices': closing_prices,
+        'created': time.time(),
+    }
+    tmp_path = output_path.with_suffix(".tmp")
+    with open(tmp_path, "wb") as f:
+        pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, output_path)
+
+
+class TickerModels:
+    """Bir hissenin modelleri ve bellekte tutulan özellik satırları."""
+
+    def __init__(self, bundle: Dict[str, Any]):
+        self.ticker = bundle['ticker']
+        self.lr_model = bundle['lr_model']
+        self.knn_model = bundle['knn_model']
+        features = bundle['features'].sort_index()
+        self.feature_columns = bundle['feature_columns']
+        self.dates = pd.DatetimeIndex(features.index)
+        self.matrix = features[self.feature_columns].to_numpy(dtype='float64')
+        closing = bundle.get('closing_prices')
+        self.closing = closing.reindex(self.dates).to_numpy(dtype='float64') if closing is not None else None
+
+    @property
+    def latest_date(self) -> pd.Timestamp:
+        return self.dates[-1]
+
+    def row_position(self, date: Optional[str]) -> int:
+        """Tarihin satır konumunu döndürür; tarih yoksa en son satır (as-of değil, tam eşleşme)."""
+        if date is None:
+            return len(self.dates) - 1
+        position = self.dates.get_indexer([pd.Timestamp(date)])[0]
+        if position < 0:
+            raise KeyError(f"{self.ticker} için {date} tarihli özellik satırı yok")
+        return int(position)
+
+
+class TTLCache:
+    """Süre sınırlı (TTL) ve boyut sınırlı yanıt önbelleği; en eski girdiler önce silinir."""
+
+    def __init__(self, ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def put(self, key: Tuple[str, str], value: Dict[str, Any]) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._entries[key] = (now + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            # Süresi dolanlar ekleme sırasıyla baştadır
+            while self._entries and (
+                len(self._entries) > self.max_entries or next(iter(self._entries.values()))[0] < now
+            ):
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ServerMetrics:
+    """İstek sayısı, önbellek isabeti, toplu tahmin ve gecikme sayaçları."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.batches = 0
+        self.batched_rows = 0
+        self.predict_calls = 0
+        self.latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self._lock = threading.Lock()
+
+    def record_request(self, latency: float, cache_hit: bool, error: bool = False) -> None:
+        with self._lock:
+            self.requests += 1
+            self.cache_hits += int(cache_hit)
+            self.errors += int(error)
+            self.latencies.append(latency)
+
+    def record_batch(self, rows: int, predict_calls: int) -> None:
+        with self._lock:
+            self.batches += 1
+            self.batched_rows += rows
+            self.predict_calls += predict_calls
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            uptime = time.monotonic() - self.started
+            latencies_ms = np.asarray(self.latencies) * 1000.0
+            percentiles = (
+                np.percentile(latencies_ms, [50, 95, 99]).round(3).tolist() if len(latencies_ms) else [None] * 3
+            )
+            return {
+                'uptime_seconds': round(uptime, 3),
+                'requests': self.requests,
+                'requests_per_second': round(self.requests / uptime, 3) if uptime > 0 else 0.0,
+                'cache_hits': self.cache_hits,
+                'errors': self.errors,
+                'batches': self.batches,
+                'predict_calls': self.predict_calls,
+                'mean_batch_size': round(self.batched_rows / self.batches, 3) if self.batches else 0.0,
+                'latency_ms': dict(zip(['p50', 'p95', 'p99'], percentiles)),
+            }
+
+
+class PredictionService:
+    """
+    Modelleri bellekte tutan ve eşzamanlı istekleri toplu tahmine çeviren servis.
+
+    İstekler bir kuyruğa alınır; toplayıcı iş parçacığı ilk istekten sonra
+    ``max_wait_seconds`` kadar bekleyerek en fazla ``max_batch_size`` isteği
+    toplar. Toplanan istekler hisseye göre gruplanır ve her hisse için LR ve
+    KNN'nin ``predict`` metodu tek bir matrisle bir kez çağrılır. Yanıtlar
+    (hisse, tarih) anahtarıyla TTL önbelleğinde tutulur.
+    """
+
+    def __init__(
+        self,
+        models: Dict[str, TickerModels],
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+        cache_ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS,
+        cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ):
+        self.models = models
+        self.max_batch_size = max_batch_size
+        self.max_wait_seconds = max_wait_seconds
+        self.cache = TTLCache(cache_ttl_seconds, cache_max_entries)
+        self.metrics = ServerMetrics()
+        self._pending: deque = deque()
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._worker = threading.Thread(target=self._batch_loop, name="prediction-batcher", daemon=True)
+        self._worker.start()
+
+    @classmethod
+    def from_bundle_dir(cls, bundle_dir: Path, **kwargs: Any) -> "PredictionService":
+        """Klasördeki tüm *_model_bundle.pkl paketlerini yükler."""
+        models = {}
+        for path in sorted(Path(bundle_dir).glob("*_model_bundle.pkl")):
+            with open(path, "rb") as f:
+                ticker_models = TickerModels(pickle.load(f))
+            models[ticker_models.ticker] = ticker_models
+        return cls(models, **kwargs)
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._worker.join()
+
+    def predict(self, ticker: str, date: Optional[str] = None) -> Dict[str, Any]:
+        """Tek istek: önbellekte yoksa toplu tahmin kuyruğuna eklenir ve sonucu beklenir."""
+        return self.predict_many([(ticker, date)])[0]
+
+    def predict_many(self, requests: Sequence[Tuple[str, Optional[str]]]) -> List[Dict[str, Any]]:
+        """
+        Birden fazla (hisse, tarih) isteği için tahmin döndürür.
+
+        Hatalı istekler için sonuçta 'error' alanı bulunur.
+        """
+        start = time.perf_counter()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        waiting: List[Tuple[int, Future]] = []
+        hits = [False] * len(requests)
+
+        for i, (ticker, date) in enumerate(requests):
+            ticker = str(ticker).strip().upper()
+            models = self.models.get(ticker)
+            if models is None:
+                results[i] = {'ticker': ticker, 'date': date, 'error': f"{ticker} için model yok"}
+                continue
+            try:
+                position = models.row_position(date)
+            except (KeyError, ValueError) as e:
+                results[i] = {'ticker': ticker, 'date': date, 'error': str(e).strip("'\"")}
+                continue
+
+            key = (ticker, str(models.dates[position].date()))
+            cached = self.cache.get(key)
+            if cached is not None:
+                results[i] = dict(cached, cached=True)
+                hits[i] = True
+                continue
+
+            future: Future = Future()
+            waiting.append((i, future))
+            with self._condition:
+                self._pending.append((ticker, position, future))
+                self._condition.notify()
+
+        for i, future in waiting:
+            results[i] = dict(future.result(), cached=False)
+
+        latency = (time.perf_counter() - start) / max(len(requests), 1)
+        for result, hit in zip(results, hits):
+            self.metrics.record_request(latency, hit, 'error' in result)
+        return results
+
+    def _batch_loop(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._stopped:
+                    self._condition.wait()
+                if self._stopped and not self._pending:
+                    return
+                # İlk istekten sonra kısa süre bekleyerek eşzamanlı istekleri topla
+                deadline = time.monotonic() + self.max_wait_seconds
+                while len(self._pending) < self.max_batch_size and not self._stopped:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch = [self._pending.popleft() for _ in range(min(len(self._pending), self.max_batch_size))]
+            self._run_batch(batch)
+
+    def _run_batch(self, batch: List[Tuple[str, int, Future]]) -> None:
+        by_ticker: Dict[str, List[Tuple[int, Future]]] = {}
+        for ticker, position, future in batch:
+            by_ticker.setdefault(ticker, []).append((position, future))
+
+        predict_calls = 0
+        for ticker, items in by_ticker.items():
+            models = self.models[ticker]
+            positions = np.array([position for position, _ in items])
+            try:
+                # Hisse başına tek vektörel predict çağrısı (tekrarlanan satırlar bir kez)
+                unique_positions, inverse = np.unique(positions, return_inverse=True)
+                rows = pd.DataFrame(models.matrix[unique_positions], columns=models.feature_columns)
+                lr_pred = models.lr_model.predict(rows)[inverse]
+                knn_pred = models.knn_model.predict(rows)[inverse]
+                predict_calls += 2
+            except Exception as e:
+                for _, future in items:
+                    future.set_result({'ticker': ticker, 'error': f"Tahmin hatası: {e}"})
+                continue
+
+            for j, (position, future) in enumerate(items):
+                date = str(models.dates[position].date())
+                response = {
+                    'ticker': ticker,
+                    'date': date,
+                    'close': float(models.closing[position]) if models.closing is not None else None,
+                    'lr_prediction': float(lr_pred[j]),
+                    'knn_prediction': float(knn_pred[j]),
+                }
+                self.cache.put((ticker, date), response)
+                future.set_result(response)
+
+        self.metrics.record_batch(len(batch), predict_calls)
+
+
+class PredictionRequestHandler(BaseHTTPRequestHandler):
+    """
+    HTTP uç noktaları:
+        GET  /predict?ticker=THYAO[&date=YYYY-MM-DD]
+        POST /predict  {"requests": [{"ticker": "THYAO", "date": null}, ...]}
+        GET  /tickers, /metrics, /health
+    """
+
+    service: PredictionService = None  # serve() tarafından atanır
+
+    def _send_json(self, payload: Any, status: int = 200) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/predict":
+            query = parse_qs(url.query)
+            if "ticker" not in query:
+                self._send_json({'error': "ticker parametresi gerekli"}, 400)
+                return
+            result = self.service.predict(query["ticker"][0], query.get("date", [None])[0])
+            self._send_json(result, 404 if 'error' in result else 200)
+        elif url.path == "/tickers":
+            self._send_json({
+                ticker: {'latest_date': str(models.latest_date.date()), 'rows': len(models.dates)}
+                for ticker, models in self.service.models.items()
+            })
+        elif url.path == "/metrics":
+            payload = self.service.metrics.snapshot()
+            payload['cache_entries'] = len(self.service.cache)
+            self._send_json(payload)
+        elif url.path == "/health":
+            self._send_json({'status': 'ok', 'tickers': len(self.service.models)})
+        else:
+            self._send_json({'error': "bulunamadı"}, 404)
+
+    def do_POST(self) -> None:
+        if urlparse(self.path).path != "/predict":
+            self._send_json({'error': "bulunamadı"}, 404)
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            requests = [(item["ticker"], item.get("date")) for item in payload["requests"]]
+        except (ValueError, KeyError, TypeError) as e:
+            self._send_json({'error': f"Geçersiz istek: {e}"}, 400)
+            return
+        self._send_json({'results': self.service.predict_many(requests)})
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Her isteği yazdırmak gecikmeyi artırır; sayaçlar /metrics'te
+        pass
+
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix soketi üzerinden HTTP (yalnızca yerel süreçler erişebilir)."""
+
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler adres olarak (host, port) bekler
+        return request, ("unix", 0)
+
+
+def serve(
+    service: PredictionService,
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    unix_socket: Optional[Path] = None,
+) -> None:
+    """
+    Servisi HTTP (varsayılan 127.0.0.1) veya Unix soketi üzerinden çalıştırır.
+
+    Sunucu yalnızca yerel arayüze bağlanır ve dış ağ erişimi gerektirmez.
+    """
+    handler = type("BoundPredictionRequestHandler", (PredictionRequestHandler,), {'service': service})
+    if unix_socket is not None:
+        unix_socket = Path(unix_socket)
+        if unix_socket.exists():
+            unix_socket.unlink()
+        server = ThreadingUnixHTTPServer(str(unix_socket), handler)
+        address = f"unix:{unix_socket}"
+    else:
+        server = ThreadingHTTPServer((host, port), handler)
+        address = f"http://{host}:{port}"
+
+    print(f"Tahmin sunucusu çalışıyor: {address} ({len(service.models)} hisse)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+        if unix_socket is not None and unix_socket.exists():
+            unix_socket.unlink()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Komut satırı: model paketlerini yükleyip tahmin sunucusunu başlatır."""
+    parser = argparse.ArgumentParser(description="Yerel toplu tahmin sunucusu")
+    parser.add_argument("--bundle-dir", type=Path, default=Path("models"), help="*_model_bundle.pkl klasörü")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix-socket", type=Path, default=None, help="HTTP yerine Unix soketi kullan")
+    parser.add_argument("--max-batch-size", type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument("--max-wait-ms", type=float, default=DEFAULT_MAX_WAIT_SECONDS * 1000.0)
+    parser.add_argument("--cache-ttl", type=float, default=DEFAULT_CACHE_TTL_SECONDS, help="saniye")
+    args = parser.parse_args(argv)
+
+    service = PredictionService.from_bundle_dir(
+        args.bundle_dir,
+        max_batch_size=args.max_batch_size,
+        max_wait_seconds=args.max_wait_ms / 1000.0,
+        cache_ttl_seconds=args.cache_ttl,
+    )
+    if not service.models:
+        print(f"Model paketi bulunamadı: {args.bundle_dir}")
+        service.stop()
+        return
+    serve(service, args.host, args.port, args.unix_socket)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+import argparse
+import base64
+import html
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# Desteklenen rapor biçimleri (dosya uzantısı)
+REPORT_FORMATS = ('md', 'html', 'ipynb')
+
+# Toplu özette sütunu olan modeller (model adı öneki -> sütun öneki); diğer aileler atlanır
+SUMMARY_MODEL_PREFIXES: Dict[str, str] = {'Linear Regression': 'lr', 'KNN Regressor': 'knn'}
+
+# Grafik başlıkları (run manifest'teki figür anahtarı -> başlık)
+FIGURE_TITLES: Dict[str, str] = {
+    'closing_price_trend': 'Kapanış Fiyatı Trendi',
+    'daily_return_distribution': 'Günlük Getiri Dağılımı',
+    'real_vs_prediction': 'Gerçek vs. Tahmin',
+    'knn_k_comparison': 'KNN k Değerleri Karşılaştırması',
+    'feature_importance': 'Özellik Önemi',
+}
+
+# Rapor bölümü öğesi: ('text', str) | ('table', DataFrame) | ('image', başlık, yol)
+ReportItem = Tuple[Any, ...]
+
+
+def load_run_manifest(path: Path) -> Dict[str, Any]:
+    """thyao_dataset.main() tarafından yazılan çalıştırma özetini okur."""
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.4f}"
+    if value is None:
+        return "-"
+    return str(value)
+
+
+def build_report_sections(manifest: Dict[str, Any]) -> List[Tuple[str, List[ReportItem]]]:
+    """
+    Çalıştırma özetinden biçimden bağımsız rapor bölümlerini oluşturur.
+
+    Hiçbir hesaplama yeniden yapılmaz; yalnızca manifest'teki metrikler,
+    aşama süreleri ve önbellekteki grafik yolları kullanılır.
+
+    Args:
+        manifest: load_run_manifest çıktısı
+
+    Returns:
+        List[Tuple[str, List[ReportItem]]]: (bölüm başlığı, öğeler) listesi
+    """
+    sections: List[Tuple[str, List[ReportItem]]] = []
+
+    summary = [
+        f"Hisse: **{manifest.get('ticker', '-')}**",
+        f"Çalıştırma zamanı: {manifest.get('created', '-')}",
+        f"Girdi: `{manifest.get('input', '-')}`",
+    ]
+    if manifest.get('best_model'):
+        summary.append(f"En iyi model: **{manifest['best_model']}**")
+    sections.append(("Özet", [('text', line) for line in summary]))
+
+    quality = manifest.get('data_quality')
+    if quality:
+        quality_df = pd.DataFrame(
+            [(key, value if not isinstance(value, list) else " - ".join(value)) for key, value in quality.items()],
+            columns=['Ölçüt', 'Değer'],
+        )
+        sections.append(("Veri Kalitesi", [('table', quality_df)]))
+
+    if manifest.get('corporate_actions'):
+        sections.append(("Bölünme / Bedelsiz Düzeltmesi", [('table', pd.DataFrame(manifest['corporate_actions']))]))
+
+    timeframes = manifest.get('multi_timeframe')
+    if timeframes:
+        timeframe_df = pd.DataFrame(
+            [(name, info['bars'], info['reused']) for name, info in timeframes.items()],
+            columns=['Zaman dilimi', 'Çubuk', 'Önbellekten'],
+        )
+        sections.append(("Çoklu Zaman Dilimi", [('table', timeframe_df)]))
+
+    selection = manifest.get('feature_selection')
+    if selection:
+        items: List[ReportItem] = [('text', f"Tutulan özellik sayısı: {len(selection['selected'])}")]
+        if selection['dropped']:
+            items.append(('table', pd.DataFrame(list(selection['dropped'].items()), columns=['Özellik', 'Eleme nedeni'])))
+        sections.append(("Özellik Seçimi", items))
+
+    if manifest.get('metrics'):
+        metrics_df = pd.DataFrame(manifest['metrics'])
+        columns = [c for c in ['model', 'test_r2', 'test_rmse', 'test_mae', 'train_r2', 'train_rmse'] if c in metrics_df]
+        items: List[ReportItem] = [('table', metrics_df[columns])]
+        split = manifest.get('split')
+        if split:
+            items.insert(0, ('text', f"Eğitim: {split['train_rows']} satır, Test: {split['test_rows']} satır, "
+                                     f"Özellik: {split['features']}"))
+        sections.append(("Model Performansı", items))
+
+    if manifest.get('knn_k_results'):
+        sections.append(("KNN k Değerleri", [('table', pd.DataFrame(manifest['knn_k_results']))]))
+
+    if manifest.get('feature_importance'):
+        importance_df = pd.DataFrame(manifest['feature_importance'])
+        columns = [c for c in ['feature', 'lr_importance', 'knn_importance', 'lr_standardized_coef',
+                               'lr_rank', 'knn_rank'] if c in importance_df]
+        sections.append(("Özellik Önemi (Permütasyon, İlk 10)", [('table', importance_df[columns].head(10))]))
+
+    if manifest.get('prediction_intervals'):
+        sections.append(("Tahmin Aralıkları (Test Kapsaması)", [('table', pd.DataFrame(manifest['prediction_intervals']))]))
+
+    drift = manifest.get('drift')
+    if drift:
+        verdict = "Yeniden eğitim önerilir" if drift['retrain_needed'] else "Belirgin kayma yok"
+        drift_df = pd.DataFrame(drift['features'])
+        columns = [c for c in ['feature', 'psi', 'ks', 'ks_critical', 'mean_shift_std', 'drifted'] if c in drift_df]
+        sections.append(("Dağılım Kayması", [
+            ('text', f"İzlenen gün: {drift['rows_monitored']} (pencere {drift['window']}), "
+                     f"kayan özellik: {len(drift['drifted_features'])} — {verdict}"),
+            ('table', drift_df[columns].head(10)),
+        ]))
+
+    if manifest.get('model_benchmark'):
+        benchmark_df = pd.DataFrame(manifest['model_benchmark'])
+        sections.append(("Model Ailesi Karşılaştırması (Eğitim Süresi)", [('table', benchmark_df)]))
+
+    if manifest.get('ensemble'):
+        sections.append(("Ensemble (Model Birleştirme)", [('table', pd.DataFrame(manifest['ensemble']))]))
+
+    if manifest.get('multi_horizon'):
+        sections.append(("Çoklu Ufuk Tahmini", [('table', pd.DataFrame(manifest['multi_horizon']))]))
+
+    if manifest.get('backtest_best'):
+        backtest_df = pd.DataFrame(manifest['backtest_best'])
+        columns = [c for c in ['model', 'long_threshold', 'short_threshold', 'cost_bps', 'slippage_bps',
+                               'total_return', 'sharpe', 'max_drawdown', 'hit_rate'] if c in backtest_df]
+        sections.append(("Backtest (En İyi Sharpe)", [('table', backtest_df[columns])]))
+
+    figures = manifest.get('figures') or {}
+    if figures:
+        sections.append((
+            "Grafikler",
+            [('image', FIGURE_TITLES.get(name, name), path) for name, path in figures.items()],
+        ))
+
+    timings = manifest.get('stage_timings')
+    if timings:
+        timings_df = pd.DataFrame(
+            [(stage, t['seconds'], 'evet' if t['cache_hit'] else 'hayır') for stage, t in timings.items()],
+            columns=['Aşama', 'Süre (sn)', 'Önbellek'],
+        )
+        sections.append(("Aşama Süreleri", [('table', timings_df)]))
+
+    execution = manifest.get('execution')
+    if execution:
+        items: List[ReportItem] = [(
+            'text',
+            f"{execution['processes']} süreç x {execution['threads_per_process']} iş parçacığı "
+            f"(etkin {execution['effective_parallelism']}, çekirdek {execution['cpu_count']})",
+        )]
+        if execution.get('threadpools'):
+            items.append(('table', pd.DataFrame(execution['threadpools'])))
+        sections.append(("Paralellik", items))
+
+    return sections
+
+
+def _markdown_table(frame: pd.DataFrame) -> str:
+    header = "| " + " | ".join(str(c) for c in frame.columns) + " |"
+    separator = "| " + " | ".join("---" for _ in frame.columns) + " |"
+    rows = ["| " + " | ".join(_format_value(v) for v in row) + " |" for row in frame.itertuples(index=False)]
+    return "\n".join([header, separator] + rows)
+
+
+def _relative_path(path: str, output_dir: Path) -> str:
+    try:
+        return Path(os.path.relpath(path, output_dir)).as_posix()
+    except ValueError:
+        # Farklı sürücüdeki dosyalar (Windows) için mutlak yol kullanılır
+        return Path(path).as_posix()
+
+
+def _markdown_blocks(title: str, items: List[ReportItem], output_dir: Path) -> str:
+    blocks = [f"## {title}"]
+    for i, item in enumerate(items):
+        if item[0] == 'text':
+            # Ardışık metin satırları tek madde listesinde toplanır
+            if i > 0 and items[i - 1][0] == 'text':
+                blocks[-1] += f"\n- {item[1]}"
+            else:
+                blocks.append(f"- {item[1]}")
+        elif item[0] == 'table':
+            blocks.append(_markdown_table(item[1]))
+        elif item[0] == 'image':
+            blocks.append(f"### {item[1]}\n\n![{item[1]}]({_relative_path(item[2], output_dir)})")
+    return "\n\n".join(blocks)
+
+
+def render_markdown(manifest: Dict[str, Any], output_dir: Path) -> str:
+    """Raporu Markdown olarak üretir (grafikler göreli yol ile bağlanır)."""
+    sections = build_report_sections(manifest)
+    parts = [f"# {manifest.get('ticker', '')} Hisse Senedi Tahmin Raporu"]
+    parts += [_markdown_blocks(title, items, output_dir) for title, items in sections]
+    return "\n\n".join(parts) + "\n"
+
+
+def render_html(manifest: Dict[str, Any], output_dir: Path, embed_images: bool = True) -> str:
+    """
+    Raporu tek dosyalık HTML olarak üretir.
+
+    Args:
+        manifest: Çalıştırma özeti
+        output_dir: Raporun yazılacağı klasör (göreli grafik yolları için)
+        embed_images: True ise PNG'ler base64 olarak gömülür
+
+    Returns:
+        str: HTML içeriği
+    """
+    title = f"{manifest.get('ticker', '')} Hisse Senedi Tahmin Raporu"
+    body = [f"<h1>{html.escape(title)}</h1>"]
+    for section_title, items in build_report_sections(manifest):
+        body.append(f"<h2>{html.escape(section_title)}</h2>")
+        for item in items:
+            if item[0] == 'text':
+                text = html.escape(item[1])
+                # **kalın** ve `kod` işaretlerini HTML'e çevir
+                for marker, tag in (("**", "b"), ("`", "code")):
+                    while text.count(marker) >= 2:
+                        text = text.replace(marker, f"<{tag}>", 1).replace(marker, f"</{tag}>", 1)
+                body.append(f"<p>{text}</p>")
+            elif item[0] == 'table':
+                body.append(item[1].to_html(index=False, float_format=lambda v: f"{v:.4f}", border=0))
+            elif item[0] == 'image':
+                path = Path(item[2])
+                if embed_images and path.exists():
+                    src = "data:image/png;base64," + base64.b64encode(path.read_bytes()).decode("ascii")
+                else:
+                    src = html.escape(_relative_path(item[2], output_dir))
+                body.append(f"<h3>{html.escape(item[1])}</h3><img src=\"{src}\" alt=\"{html.escape(item[1])}\">")
+
+    style = (
+        "body{font-family:sans-serif;max-width:1100px;margin:auto;padding:1em}"
+        "table{border-collapse:collapse;margin:0.5em 0}"
+        "th,td{border:1px solid #ccc;padding:4px 8px;text-align:right}"
+        "img{max-width:100%}"
+    )
+    return (
+        "<!DOCTYPE html>\n<html lang=\"tr\">\n<head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(title)}</title><style>{style}</style></head>\n<body>\n"
+        + "\n".join(body)
+        + "\n</body>\n</html>\n"
+    )
+
+
+def render_notebook(manifest: Dict[str, Any], output_dir: Path) -> Dict[str, Any]:
+    """
+    Raporu Jupyter notebook (nbformat 4) olarak üretir.
+
+    Her bölüm bir Markdown hücresidir; kod hücresi yoktur, açıldığında
+    hiçbir hesaplama çalıştırılmaz.
+    """
+    sections = build_report_sections(manifest)
+    sources = [f"# {manifest.get('ticker', '')} Hisse Senedi Tahmin Raporu"]
+    sources += [_markdown_blocks(title, items, output_dir) for title, items in sections]
+    cells = [
+        {"cell_type": "markdown", "metadata": {}, "source": source.splitlines(keepends=True)}
+        for source in sources
+    ]
+    return {
+        "cells": cells,
+        "metadata": {
+            "kernelspec": {"display_name": "Python 3", "language": "python", "name": "python3"},
+            "language_info": {"name": "python"},
+        },
+        "nbformat": 4,
+        "nbformat_minor": 4,
+    }
+
+
+def build_cross_ticker_summary(manifests: Sequence[Dict[str, Any]]) -> pd.DataFrame:
+    """
+    Toplu çalıştırmalar için hisse başına tek satırlık özet tablosu oluşturur.
+
+    Args:
+        manifests: Hisse başına çalıştırma özetleri
+
+    Returns:
+        pd.DataFrame: Hisse, satır sayıları, en iyi model, test metrikleri,
+        en iyi backtest Sharpe oranı, toplam süre ve önbellek isabetleri
+    """
+    rows = []
+    for manifest in manifests:
+        quality = manifest.get('data_quality') or {}
+        row: Dict[str, Any] = {
+            'ticker': manifest.get('ticker'),
+            'rows': quality.get('rows'),
+            'clean_rows': quality.get('clean_rows'),
+            'best_model': manifest.get('best_model'),
+        }
+        for result in manifest.get('metrics') or []:
+            prefix = next(
+                (short for name, short in SUMMARY_MODEL_PREFIXES.items() if result['model'].startswith(name)), None
+            )
+            if prefix is None:
+                continue
+            row[f'{prefix}_test_r2'] = result.get('test_r2')
+            row[f'{prefix}_test_rmse'] = result.get('test_rmse')
+
+        backtest_best = manifest.get('backtest_best') or []
+        row['best_sharpe'] = max((r['sharpe'] for r in backtest_best), default=None)
+
+        timings = manifest.get('stage_timings') or {}
+        row['total_seconds'] = round(sum(t['seconds'] for t in timings.values()), 4)
+        row['cache_hits'] = f"{sum(1 for t in timings.values() if t['cache_hit'])}/{len(timings)}"
+        rows.append(row)
+
+    return pd.DataFrame(rows)
+
+
+def generate_report(
+    manifest: Dict[str, Any], output_dir: Path, formats: Sequence[str] = REPORT_FORMATS
+) -> List[Path]:
+    """
+    Tek çalıştırma için istenen biçimlerde rapor dosyalarını yazar.
+
+    Args:
+        manifest: Çalıştırma özeti
+        output_dir: Raporların yazılacağı klasör
+        formats: REPORT_FORMATS içinden biçimler
+
+    Returns:
+        List[Path]: Yazılan dosyalar
+    """
+    unknown = set(formats) - set(REPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"Desteklenmeyen rapor biçimi: {sorted(unknown)}")
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{manifest.get('ticker') or 'run'}_report"
+
+    written = []
+    for fmt in formats:
+        path = output_dir / f"{stem}.{fmt}"
+        if fmt == 'md':
+            path.write_text(render_markdown(manifest, output_dir), encoding="utf-8")
+        elif fmt == 'html':
+            path.write_text(render_html(manifest, output_dir), encoding="utf-8")
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(render_notebook(manifest, output_dir), f, ensure_ascii=False, indent=1)
+        written.append(path)
+    return written
+
+
+def generate_reports(
+    manifest_paths: Sequence[Path], output_dir: Path, formats: Sequence[str] = REPORT_FORMATS
+) -> List[Path]:
+    """
+    Birden fazla çalıştırma özeti için raporları ve hisseler arası özeti yazar.
+
+    Args:
+        manifest_paths: *_run_manifest.json dosyaları
+        output_dir: Raporların yazılacağı klasör
+        formats: Rapor biçimleri
+
+    Returns:
+        List[Path]: Yazılan dosyalar
+    """
+    output_dir = Path(output_dir)
+    manifests = [load_run_manifest(path) for path in manifest_paths]
+
+    written: List[Path] = []
+    for manifest in manifests:
+        written += generate_report(manifest, output_dir, formats)
+
+    if len(manifests) > 1:
+        summary = build_cross_ticker_summary(manifests)
+        summary_csv = output_dir / "cross_ticker_summary.csv"
+        summary.to_csv(summary_csv, index=False, encoding="utf-8-sig")
+        written.append(summary_csv)
+        if 'md' in formats:
+            summary_md = output_dir / "cross_ticker_summary.md"
+            summary_md.write_text("# Hisseler Arası Özet\n\n" + _markdown_table(summary) + "\n", encoding="utf-8")
+            written.append(summary_md)
+        if 'html' in formats:
+            summary_html = output_dir / "cross_ticker_summary.html"
+            summary_html.write_text(
+                "<!DOCTYPE html>\n<html lang=\"tr\">\n<head><meta charset=\"utf-8\"><title>Hisseler Arası Özet</title></head>\n"
+                "<body>\n<h1>Hisseler Arası Özet</h1>\n"
+                + summary.to_html(index=False, float_format=lambda v: f"{v:.4f}", border=1)
+                + "\n</body>\n</html>\n",
+                encoding="utf-8",
+            )
+            written.append(summary_html)
+
+    return written
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Komut satırı: çalıştırma özetlerinden rapor üretir (pipeline yeniden çalıştırılmaz)."""
+    parser = argparse.ArgumentParser(description="Önbellekteki çalıştırma çıktılarından rapor üretir")
+    parser.add_argument("manifests", nargs="*", type=Path,
+                        help="*_run_manifest.json dosyaları (varsayılan: bulunulan klasördekiler)")
+    parser.add_argument("--output-dir", type=Path, default=Path("reports"), help="Rapor klasörü")
+    parser.add_argument("--formats", nargs="+", default=list(REPORT_FORMATS), choices=REPORT_FORMATS)
+    args = parser.parse_args(argv)
+
+    manifest_paths = args.manifests or sorted(Path.cwd().glob("*_run_manifest.json"))
+    if not manifest_paths:
+        print("Çalıştırma özeti bulunamadı (*_run_manifest.json)")
+        return
+
+    for path in generate_reports(manifest_paths, args.output_dir, args.formats):
+        print(f"[OK] Rapor kaydedildi: {path}")
+
+
+if __name__ == "__main__":
+    main()
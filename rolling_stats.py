@@ -0,0 +1,253 @@
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Desteklenen istatistikler (rolling_stats içindeki sütun adlarının öneki)
+SUPPORTED_STATS = ('mean', 'std', 'var', 'min', 'max', 'zscore')
+
+
+def _min_periods_for(window: int, min_periods: Optional[int]) -> int:
+    """pandas ile aynı varsayılan: min_periods verilmezse pencere boyu kullanılır."""
+    return window if min_periods is None else min(min_periods, window)
+
+
+def _window_moments(x: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Her konumda bitişli (trailing) pencerenin geçerli gözlem sayısı, ortalaması ve kare sapma toplamı.
+
+    Seri pencere boyunda bloklara bölünür ve her blok kendi ortalamasına göre
+    merkezlenir; toplamlar yalnızca blok içi kümülatif toplamlardan alınır.
+    Bir pencere en fazla iki bloğa yayıldığından önceki bloğun payı güncel
+    bloğun merkezine kaydırılarak eklenir. Böylece kümülatif toplamın
+    büyüklüğü seri boyuyla değil pencere boyuyla sınırlı kalır ve büyük
+    değerlerde de sonuçlar pandas ile sayısal hassasiyette aynıdır.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (sayı, ortalama, kare sapma toplamı)
+    """
+    n = len(x)
+    blocks = -(-n // window)
+    padded = np.full(blocks * window, np.nan)
+    padded[:n] = x
+    block_values = padded.reshape(blocks, window)
+    block_valid = ~np.isnan(block_values)
+
+    block_count = block_valid.sum(axis=1)
+    center = np.nansum(block_values, axis=1) / np.maximum(block_count, 1)
+    # Tamamı NaN bloklar önceki dolu bloğun merkezini alır (kaydırma farkı küçük kalsın)
+    filled = np.maximum.accumulate(np.where(block_count > 0, np.arange(blocks), 0))
+    center = center[filled]
+    d =np.where(block_valid, block_values - center[:, None], 0.0)
+
+    # Blok içi kapsayıcı (inclusive) ve dışlayıcı (exclusive) kümülatif toplamlar
+    incl = [np.cumsum(a, axis=1) for a in (block_valid.astype('float64'), d, d * d)]
+    excl = [np.concatenate((np.zeros((blocks, 1)), a[:, :-1]), axis=1).ravel() for a in incl]
+    totals = [a[:, -1] for a in incl]
+    incl = [a.ravel() for a in incl]
+
+    i = np.arange(n)
+    s = np.maximum(i - window + 1, 0)
+    bi = i // window
+    bs = s // window
+    split = bs != bi
+
+    # Güncel bloktaki pay
+    count, s1, s2 = (np.where(split, a[i], a[i] - e[s]) for a, e in zip(incl, excl))
+    # Önceki bloktaki pay (yalnızca pencere iki bloğa yayılıyorsa), güncel merkeze kaydırılır
+    p0, p1, p2 = (np.where(split, t[bs] - e[s], 0.0) for t, e in zip(totals, excl))
+    delta = center[bs] - center[bi]
+    count = count + p0
+    s1 = s1 + p1 + p0 * delta
+    s2 = s2 + p2 + 2.0 * delta * p1 + p0 * delta * delta
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = center[bi] + s1 / count
+        m2 = np.maximum(s2 - s1 * s1 / count, 0.0)
+    return count, mean, m2
+
+
+def _sliding_extreme(x: np.ndarray, window: int, ufunc: np.ufunc) -> np.ndarray:
+    """
+    Bitişli pencere minimumu/maksimumu (van Herk / Gil-Werman).
+
+    Seri pencere boyunda bloklara bölünür; blok içi ileri ve geri birikimli
+    ``np.fmin``/``np.fmax`` ile her pencere bir sonek ve bir önek değerinin
+    birleşimidir. Pencere boyundan bağımsız O(n); NaN değerler atlanır.
+    """
+    n = len(x)
+    blocks = -(-(n + window - 1) // window)
+    padded = np.full(blocks * window, np.nan)
+    padded[window - 1:window - 1 + n] = x
+    block_values = padded.reshape(blocks, window)
+    prefix = ufunc.accumulate(block_values, axis=1).ravel()
+    suffix = ufunc.accumulate(block_values[:, ::-1], axis=1)[:, ::-1].ravel()
+    i = np.arange(n)
+    return ufunc(suffix[i], prefix[i + window - 1])
+
+
+def _rolling_quantiles(x: np.ndarray, window: int, quantiles: Sequence[float], min_req: int) -> np.ndarray:
+    """Sıralı pencere listesi + ikili arama ile kantiller (pandas ile aynı doğrusal interpolasyon)."""
+    n = len(x)
+    q_out = np.full((len(quantiles), n), np.nan)
+    sw: List[float] = []
+    for i in range(n):
+        lp = i - window
+        if lp >= 0 and not np.isnan(x[lp]):
+            del sw[bisect_left(sw, x[lp])]
+        if not np.isnan(x[i]):
+            insort(sw, x[i])
+        m = len(sw)
+        if m and m >= min_req:
+            for qi, q in enumerate(quantiles):
+                pos = q * (m - 1)
+                lo = int(pos)
+                hi = min(lo + 1, m - 1)
+                q_out[qi, i] = sw[lo] + (sw[hi] - sw[lo]) * (pos - lo)
+    return q_out
+
+
+def rolling_mean_multi(
+    values: np.ndarray, windows: Sequence[int], min_periods: Optional[int] = None
+) -> Dict[int, np.ndarray]:
+    """
+    Birden fazla pencere için hareketli ortalamayı blok içi kümülatif toplam ile hesaplar.
+
+    Her pencere O(n) maliyetlidir ve pencere boyundan bağımsızdır. NaN değerler
+    pandas'taki gibi atlanır; penceredeki geçerli gözlem sayısı min_periods
+    değerinden azsa sonuç NaN olur. Toplamlar blok ortalamasına göre merkezlenir
+    (bkz. ``_window_moments``), büyük değerlerde de hata birikmez.
+
+    Args:
+        values: Zaman sırasına göre değerler (örn. kapanış fiyatı)
+        windows: Pencere boyları, örn. [5, 20, 50, 100, 200]
+        min_periods: Sonuç için gereken minimum geçerli gözlem sayısı
+
+    Returns:
+        Dict[int, np.ndarray]: pencere -> hareketli ortalama dizisi
+    """
+    x = np.asarray(values, dtype='float64')
+    result = {}
+    for window in windows:
+        count, mean, _ = _window_moments(x, window)
+        result[window] = np.where((count > 0) & (count >= _min_periods_for(window, min_periods)), mean, np.nan)
+    return result
+
+
+def rolling_stats(
+    values: np.ndarray,
+    windows: Sequence[int],
+    stats: Sequence[str] = ('mean', 'std', 'min', 'max', 'zscore'),
+    quantiles: Sequence[float] = (),
+    min_periods: Optional[int] = None,
+    index: Optional[pd.Index] = None,
+) -> pd.DataFrame:
+    """
+    Tüm pencere boyları için hareketli istatistikleri vektörel olarak hesaplar.
+
+    Her pencere O(n) maliyetlidir:
+        - mean/var/std/zscore: blok ortalamasına göre merkezlenmiş blok içi
+          kümülatif toplamlar (``_window_moments``)
+        - min/max: blok içi ileri/geri birikimli fmin/fmax (``_sliding_extreme``)
+        - kantiller: sıralı pencere listesi + ikili arama (tek Python döngüsü),
+          pandas ile aynı doğrusal interpolasyon
+
+    Sonuçlar pandas ``rolling(window, min_periods)`` (std/var için ddof=1)
+    ile kayan nokta hassasiyetinde aynıdır; pandas'taki gibi tüm değerleri
+    eşit pencerelerin varyansı tam olarak 0'dır.
+
+    Args:
+        values: Zaman sırasına göre değerler
+        windows: Pencere boyları
+        stats: Hesaplanacak istatistikler (SUPPORTED_STATS içinden)
+        quantiles: Hesaplanacak kantiller, örn. (0.05, 0.5, 0.95)
+        min_periods: Sonuç için gereken minimum geçerli gözlem sayısı
+        index: Sonuç DataFrame'inin indeksi (örn. df.index)
+
+    Returns:
+        pd.DataFrame: ``rolling_{stat}_{window}`` ve ``rolling_q{q}_{window}`` sütunları
+    """
+    unknown = set(stats) - set(SUPPORTED_STATS)
+    if unknown:
+        raise ValueError(f"Desteklenmeyen istatistik: {sorted(unknown)}")
+
+    x = np.asarray(values, dtype='float64')
+    need_var = any(s in stats for s in ('std', 'var', 'zscore'))
+
+    out: Dict[str, np.ndarray] = {}
+    for window in windows:
+        min_req = _min_periods_for(window, min_periods)
+        count, mean, m2 = _window_moments(x, window)
+        enough = (count > 0) & (count >= min_req)
+        mean = np.where(enough, mean, np.nan)
+
+        lo = _sliding_extreme(x, window, np.fmin) if need_var or 'min' in stats else None
+        hi = _sliding_extreme(x, window, np.fmax) if need_var or 'max' in stats else None
+
+        if need_var:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                var = np.where(lo == hi, 0.0, m2 / (count - 1))
+            var = np.where(enough & (count >= 2), var, np.nan)
+
+        if 'mean' in stats:
+            out[f"rolling_mean_{window}"] = mean
+        if 'var' in stats:
+            out[f"rolling_var_{window}"] = var
+        if 'std' in stats:
+            out[f"rolling_std_{window}"] = np.sqrt(var)
+        if 'zscore' in stats:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                out[f"rolling_zscore_{window}"] = (x - mean) / np.sqrt(var)
+        if 'min' in stats:
+            out[f"rolling_min_{window}"] = np.where(enough, lo, np.nan)
+        if 'max' in stats:
+            out[f"rolling_max_{window}"] = np.where(enough, hi, np.nan)
+        if quantiles:
+            q_out = _rolling_quantiles(x, window, quantiles, min_req)
+            for qi, q in enumerate(quantiles):
+                out[f"rolling_q{q:g}_{window}"] = q_out[qi]
+
+    return pd.DataFrame(out, index=index)
+
+
+def compare_with_pandas(
+    values: np.ndarray,
+    windows: Sequence[int],
+    quantiles: Sequence[float] = (0.5,),
+    min_periods: Optional[int] = None,
+) -> pd.Series:
+    """
+    rolling_stats sonuçlarını pandas rolling referansı ile karşılaştırır.
+
+    Args:
+        values: Karşılaştırılacak seri
+        windows: Pencere boyları
+        quantiles: Karşılaştırılacak kantiller
+        min_periods: Minimum geçerli gözlem sayısı
+
+    Returns:
+        pd.Series: Sütun başına maksimum mutlak fark (NaN konumları farklıysa inf)
+    """
+    series = pd.Series(np.asarray(values, dtype='float64'))
+    ours = rolling_stats(series.to_numpy(), windows, SUPPORTED_STATS, quantiles, min_periods)
+
+    diffs = {}
+    for column in ours.columns:
+        _, stat, window = column.split('_')
+        roll = series.rolling(int(window), min_periods=min_periods)
+        if stat == 'zscore':
+            reference = (series - roll.mean()) / roll.std()
+        elif stat.startswith('q'):
+            reference = roll.quantile(float(stat[1:]))
+        else:
+            reference = getattr(roll, stat)()
+
+        a = ours[column].to_numpy()
+        b = reference.to_numpy()
+        if not np.array_equal(np.isnan(a), np.isnan(b)):
+            diffs[column] = np.inf
+        else:
+            mask = ~np.isnan(a)
+            diffs[column] = float(np.max(np.abs(a[mask] - b[mask]))) if mask.any() else 0.0
+    return pd.Series(diffs)
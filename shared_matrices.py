@@ -0,0 +1,160 @@
+import atexit
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Worker sürecinde bağlanılmış diziler: ad -> (dizi görünümü, SharedMemory)
+_WORKER_ARRAYS: Dict[str, Tuple[np.ndarray, shared_memory.SharedMemory]] = {}
+
+
+class SharedArraySpec:
+    """Paylaşılan bellek segmentini tanımlayan küçük, pickle'lanabilir tanımlayıcı."""
+
+    def __init__(self, segment: str, shape: Tuple[int, ...], dtype: str):
+        self.segment = segment
+        self.shape = shape
+        self.dtype = dtype
+
+    def __repr__(self) -> str:
+        return f"SharedArraySpec({self.segment!r}, {self.shape}, {self.dtype})"
+
+
+class SharedMatrixStore:
+    """
+    Özellik matrislerini ve hedefleri bir kez paylaşılan belleğe yayınlar.
+
+    Worker süreçleri dizileri pickle ile kopyalamak yerine segment adıyla
+    sıfır kopya bağlanır. Segmentler ``close()`` (veya ``with`` bloğunun
+    sonu) ile ve beklenmedik çıkışta atexit ile silinir.
+
+    Örnek:
+        with SharedMatrixStore() as store:
+            specs = {'X_train': store.publish('X_train', X_train.to_numpy())}
+            ...  # specs worker'lara gönderilir
+    """
+
+    def __init__(self):
+        self._segments: Dict[str, shared_memory.SharedMemory] = {}
+        self.specs: Dict[str, SharedArraySpec] = {}
+        atexit.register(self.close)
+
+    def publish(self, name: str, array: np.ndarray) -> SharedArraySpec:
+        """Diziyi yeni bir paylaşılan bellek segmentine kopyalar ve tanımlayıcısını döndürür."""
+        array = np.ascontiguousarray(array)
+        segment = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+        self._segments[name] = segment
+        spec = SharedArraySpec(segment.name, array.shape, array.dtype.str)
+        self.specs[name] = spec
+        return spec
+
+    def close(self) -> None:
+        """Tüm segmentleri kapatır ve siler (birden fazla çağrılabilir)."""
+        for segment in self._segments.values():
+            try:
+                segment.close()
+                segment.unlink()
+            except FileNotFoundError:
+                pass
+        self._segments.clear()
+        self.specs.clear()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> "SharedMatrixStore":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def attach(spec: SharedArraySpec) -> Tuple[np.ndarray, shared_memory.SharedMemory]:
+    """
+    Segmente kopyasız bağlanır ve salt okunur NumPy görünümü döndürür.
+
+    Segmentin sahibi yayınlayan süreçtir; bağlanan süreç segmenti silmez.
+    """
+    if sys.version_info >= (3, 13):
+        segment = shared_memory.SharedMemory(name=spec.segment, track=False)
+    else:
+        # Python < 3.13: havuz worker'ları yayınlayan sürecin kaynak izleyicisini
+        # paylaşır; kayıt tekrarlanır ama silme yalnızca sahibin unlink'iyle olur
+        segment = shared_memory.SharedMemory(name=spec.segment)
+    view = np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=segment.buf)
+    view.flags.writeable = False
+    return view, segment
+
+
+def _init_worker(specs: Dict[str, SharedArraySpec], threads: Optional[int] = None) -> None:
+    """Worker başlatıcısı: native iş parçacığı sınırını uygular ve segmentlere süreç başına bir kez bağlanır."""
+    if threads:
+        from execution import init_worker_threads
+
+        init_worker_threads(threads)
+    for name, spec in specs.items():
+        _WORKER_ARRAYS[name] = attach(spec)
+
+
+def worker_array(name: str) -> np.ndarray:
+    """Worker içinde yayınlanmış diziye erişim."""
+    return _WORKER_ARRAYS[name][0]
+
+
+def _evaluate_task(task: Tuple[str, Optional[int]]) -> Dict[str, Any]:
+    """Worker görevi: ('lr', None) veya ('knn', k) modelini paylaşılan matrislerle eğitip test eder."""
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    from sklearn.neighbors import KNeighborsRegressor
+
+    X_train, y_train = worker_array('X_train'), worker_array('y_train')
+    X_test, y_test = worker_array('X_test'), worker_array('y_test')
+
+    kind, k = task
+    model = LinearRegression() if kind == 'lr' else KNeighborsRegressor(n_neighbors=k)
+    model.fit(X_train, y_train)
+    pred = model.predict(X_test)
+    mse = mean_squared_error(y_test, pred)
+    return {
+        'model': kind,
+        'k': k,
+        'r2': r2_score(y_test, pred),
+        'mse': mse,
+        'rmse': float(np.sqrt(mse)),
+        'mae': mean_absolute_error(y_test, pred),
+        'pred': pred,
+    }
+
+
+def evaluate_models_parallel(
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    tasks: Sequence[Tuple[str, Optional[int]]],
+    max_workers: int,
+    threads_per_worker: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    LR/KNN değerlendirmelerini süreç havuzunda paylaşılan matrislerle çalıştırır.
+
+    Matrisler bir kez yayınlanır; her worker başlangıçta segmentlere bağlanır,
+    görevlerle birlikte yalnızca (model türü, k) gönderilir. Bellek kullanımı
+    worker sayısıyla artmaz.
+
+    Args:
+        X_train, y_train, X_test, y_test: Eğitim/test dizileri
+        tasks: ('lr', None) ve ('knn', k) görevleri
+        max_workers: Süreç sayısı
+        threads_per_worker: Worker başına BLAS/OpenMP iş parçacığı sınırı
+            (None: sınırlama yok)
+
+    Returns:
+        List[Dict[str, Any]]: Görev sırasıyla metrikler ve test tahminleri
+    """
+    with SharedMatrixStore() as store:
+        for name, array in (('X_train', X_train), ('y_train', y_train), ('X_test', X_test), ('y_test', y_test)):
+            store.publish(name, np.asarray(array, dtype='float64'))
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(dict(store.specs), threads_per_worker)) as pool:
+            return list(pool.map(_evaluate_task, tasks))
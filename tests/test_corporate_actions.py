@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from corporate_actions import adjust_frame, detect_corporate_actions, price_columns, volume_columns
+
+COLUMNS = [
+    'CLOSING PRICE', 'VWAP', 'REMAINING BID',
+    'TOTAL TRADED VOLUME', 'TRADED VOLUME OF TRADES AT CLOSING PRICE',
+    'TOTAL TRADED VALUE', 'TRADED VALUE OF TRADES AT CLOSING PRICE',
+    'NUMBER OF CONTRACTS OF TRADES AT CLOSING PRICE',
+]
+
+
+def test_price_and_volume_columns_are_disjoint():
+    prices = price_columns(COLUMNS)
+    volumes = volume_columns(COLUMNS)
+    assert prices == ['CLOSING PRICE', 'VWAP', 'REMAINING BID']
+    assert volumes == ['TOTAL TRADED VOLUME', 'TRADED VOLUME OF TRADES AT CLOSING PRICE']
+    assert not set(prices) & set(volumes)
+
+
+def test_adjust_frame_leaves_value_columns_unchanged():
+    df = pd.DataFrame(100.0, index=range(3), columns=COLUMNS)
+    adjusted = adjust_frame(df, np.array([0.5, 0.5, 1.0]))
+
+    np.testing.assert_array_equal(adjusted['CLOSING PRICE'], [50.0, 50.0, 100.0])
+    np.testing.assert_array_equal(adjusted['TRADED VOLUME OF TRADES AT CLOSING PRICE'], [200.0, 200.0, 100.0])
+    for col in ('TOTAL TRADED VALUE', 'TRADED VALUE OF TRADES AT CLOSING PRICE',
+                'NUMBER OF CONTRACTS OF TRADES AT CLOSING PRICE'):
+        np.testing.assert_array_equal(adjusted[col], df[col])
+
+
+def test_dropped_session_move_is_not_a_split():
+    # Salı satırı eksik: Salı %4 düştü (100 -> 96), Çarşamba değişimi Salı kapanışına göredir;
+    # Pazartesi ile karşılaştırılırsa oran 0.96 olur ve bölünme sanılır
+    dates = np.array(['2024-01-08', '2024-01-10', '2024-01-11'], dtype='datetime64[ns]')
+    close = np.array([100.0, 95.5, 96.0])
+    change_pct = np.array([0.0, 95.5 / 96.0 * 100.0 - 100.0, 96.0 / 95.5 * 100.0 - 100.0])
+
+    assert detect_corporate_actions(dates, close, change_pct) == []
+
+
+def test_split_between_consecutive_sessions_is_detected():
+    # Cuma -> Pazartesi ardışık seanstır; 2:1 bölünme (önceki kapanış 100 -> 50 düzeltilmiş)
+    dates = np.array(['2024-01-04', '2024-01-05', '2024-01-08', '2024-01-09'], dtype='datetime64[ns]')
+    close = np.array([101.0, 100.0, 51.0, 51.5])
+    change_pct = np.array([0.0, 100.0 / 101.0 * 100.0 - 100.0, 2.0, 51.5 / 51.0 * 100.0 - 100.0])
+
+    events = detect_corporate_actions(dates, close, change_pct)
+    assert [(event.ex_date, round(event.factor, 6)) for event in events] == [(pd.Timestamp('2024-01-08'), 0.5)]
+
+    # Cuma borsa tatiliyse Perşembe -> Pazartesi da ardışık seanstır
+    holiday_dates = np.array(['2024-01-03', '2024-01-04', '2024-01-08', '2024-01-09'], dtype='datetime64[ns]')
+    assert detect_corporate_actions(holiday_dates, close, change_pct) == []
+    assert len(detect_corporate_actions(holiday_dates, close, change_pct, holidays=['2024-01-05'])) == 1
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from feature_selection import correlation_matrix, select_features, variance_inflation_factors
+
+
+def make_frame(n: int = 500, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    a = rng.normal(size=n)
+    b = 0.5 * a + np.sqrt(0.75) * rng.normal(size=n)
+    c = rng.normal(size=n)
+    # a ile pozitif, b ile negatif korelasyonlu; |r| eşiğin altında ama a ve b'nin doğrusal birleşimi.
+    # İşaretler sütun çevirmeyle giderilemediğinden mutlak korelasyon matrisi VIF'i yanlış verir.
+    combo = a - b + 0.05 * rng.normal(size=n)
+    return pd.DataFrame({'a': a, 'b': b, 'c': c, 'combo': combo})
+
+
+def test_vif_matches_auxiliary_regression():
+    X = make_frame()
+    values = X.to_numpy()
+    vif = variance_inflation_factors(correlation_matrix(values))
+
+    for j in range(values.shape[1]):
+        others = np.column_stack([np.ones(len(values)), np.delete(values, j, axis=1)])
+        fitted = others @ np.linalg.lstsq(others, values[:, j], rcond=None)[0]
+        r2 = 1.0 - ((values[:, j] - fitted) ** 2).sum() / ((values[:, j] - values[:, j].mean()) ** 2).sum()
+        np.testing.assert_allclose(vif[j], 1.0 / (1.0 - r2), rtol=1e-8)
+    assert (vif >= 1.0).all()
+
+
+def test_linear_combination_is_dropped_by_vif():
+    X = make_frame()
+    y = pd.Series(X['a'] + X['c'], index=X.index)
+    selected, report = select_features(X, y, correlation_threshold=0.98, vif_threshold=50.0)
+
+    report = report.set_index('column')
+    assert report['max_abs_corr'].max() < 0.98
+    assert report['dropped'].value_counts().get('vif', 0) == 1
+    dropped = report.index[report['dropped'] == 'vif'][0]
+    assert report.loc[dropped, 'vif'] > 50.0
+    assert dropped not in selected
+    assert (report['vif'].dropna() >= 1.0).all()
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.neighbors import NearestNeighbors
+
+from kernels import NUMBA_AVAILABLE, atr, ema, knn_topk, rsi
+
+BACKENDS = ['numpy', 'numba'] if NUMBA_AVAILABLE else ['numpy']
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(0)
+    close = 10.0 + np.cumsum(rng.normal(0.0, 0.1, 2_000))
+    spread = np.abs(rng.normal(0.0, 0.05, 2_000))
+    return close, close + spread, close - spread
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_indicators_match_pandas_ewm(prices, backend):
+    close, high, low = prices
+    s_close, s_high, s_low = pd.Series(close), pd.Series(high), pd.Series(low)
+
+    np.testing.assert_allclose(ema(close, 12, backend), s_close.ewm(span=12, adjust=False).mean(), rtol=1e-12)
+
+    delta = s_close.diff().fillna(0.0)
+    avg_gain = delta.clip(lower=0.0).ewm(alpha=1 / 14, adjust=False).mean()
+    avg_loss = (-delta).clip(lower=0.0).ewm(alpha=1 / 14, adjust=False).mean()
+    ours = rsi(close, 14, backend)
+    # İlk gün kazanç ve kayıp 0: pandas NaN verir, çekirdek 50 (nötr) döndürür
+    assert ours[0] == 50.0
+    np.testing.assert_allclose(ours[1:], (100.0 - 100.0 / (1.0 + avg_gain / avg_loss))[1:], rtol=1e-10)
+
+    prev_close = s_close.shift(1)
+    true_range = pd.concat([s_high - s_low, (s_high - prev_close).abs(), (s_low - prev_close).abs()],
+                           axis=1).max(axis=1)
+    np.testing.assert_allclose(atr(high, low, close, 14, backend),
+                               true_range.ewm(alpha=1 / 14, adjust=False).mean(), rtol=1e-12)
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_knn_topk_matches_sklearn_kneighbors(backend):
+    rng = np.random.default_rng(1)
+    X_train = rng.normal(size=(3_000, 8))
+    X_query = rng.normal(size=(300, 8))
+
+    expected_d, expected_i = NearestNeighbors(n_neighbors=10, algorithm='brute').fit(X_train).kneighbors(X_query)
+    distances, indices = knn_topk(X_query, X_train, 10, backend)
+
+    np.testing.assert_allclose(distances, expected_d, rtol=1e-9, atol=1e-9)
+    np.testing.assert_array_equal(indices, expected_i)
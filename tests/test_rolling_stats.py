@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from rolling_stats import rolling_mean_multi, rolling_stats
+
+WINDOWS = [5, 50, 100, 200]
+
+
+def make_series(level: float, n: int = 20_000, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    x = level + np.cumsum(rng.normal(0.0, 1e-3 * level, n))
+    x[rng.choice(n, 300, replace=False)] = np.nan
+    x[7000:7300] = np.nan
+    return x
+
+
+def two_pass_var(x: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """Her pencerede ortalama ayrı hesaplanan (iki geçişli) referans varyans."""
+    padded = np.r_[np.full(window - 1, np.nan), x]
+    views = np.lib.stride_tricks.sliding_window_view(padded, window)
+    count = (~np.isnan(views)).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.nansum(views, axis=1) / count
+        var = np.nansum((views - mean[:, None]) ** 2, axis=1) / (count - 1)
+    return np.where((count >= max(min_periods, 2)), var, np.nan)
+
+
+@pytest.mark.parametrize('min_periods', [None, 1, 3])
+@pytest.mark.parametrize('level', [1e2, 1e7])
+def test_mean_min_max_quantile_match_pandas(level, min_periods):
+    x = make_series(level)
+    series = pd.Series(x)
+    ours = rolling_stats(x, WINDOWS, ('mean', 'min', 'max'), (0.1, 0.5, 0.9), min_periods)
+    means = rolling_mean_multi(x, WINDOWS, min_periods)
+
+    for window in WINDOWS:
+        roll = series.rolling(window, min_periods=min_periods)
+        np.testing.assert_allclose(ours[f'rolling_mean_{window}'], roll.mean(), rtol=1e-13, atol=0)
+        np.testing.assert_allclose(means[window], roll.mean(), rtol=1e-13, atol=0)
+        np.testing.assert_array_equal(ours[f'rolling_min_{window}'], roll.min())
+        np.testing.assert_array_equal(ours[f'rolling_max_{window}'], roll.max())
+        for q in (0.1, 0.5, 0.9):
+            np.testing.assert_allclose(ours[f'rolling_q{q:g}_{window}'], roll.quantile(q), rtol=1e-13, atol=0)
+
+
+@pytest.mark.parametrize('min_periods', [None, 1, 3])
+@pytest.mark.parametrize('level', [1e2, 1e7])
+def test_var_std_zscore_match_two_pass(level, min_periods):
+    # pandas'ın çevrimiçi varyansı NaN boşluklarının kenarında ~1e-6 göreli sapar;
+    # referans her pencerede ayrı hesaplanan iki geçişli varyanstır
+    x = make_series(level)
+    series = pd.Series(x)
+    ours = rolling_stats(x, WINDOWS, ('var', 'std', 'zscore'), (), min_periods)
+
+    for window in WINDOWS:
+        var = two_pass_var(x, window, window if min_periods is None else min(min_periods, window))
+        mean = series.rolling(window, min_periods=min_periods).mean().to_numpy()
+        np.testing.assert_allclose(ours[f'rolling_var_{window}'], var, rtol=1e-10, atol=0)
+        np.testing.assert_allclose(ours[f'rolling_std_{window}'], np.sqrt(var), rtol=1e-10, atol=0)
+        np.testing.assert_allclose(
+            ours[f'rolling_zscore_{window}'], (x - mean) / np.sqrt(var), rtol=1e-8, atol=1e-12
+        )
+
+
+def test_constant_window_has_zero_variance():
+    x = np.full(50, 1e7 + 0.1)
+    ours = rolling_stats(x, [5], ('std', 'min', 'max'))
+    np.testing.assert_array_equal(ours['rolling_std_5'].to_numpy()[4:], 0.0)
+    np.testing.assert_array_equal(ours['rolling_min_5'].to_numpy()[4:], 1e7 + 0.1)
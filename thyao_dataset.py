@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 # Matplotlib backend ayarı - grafiklerin ekranda açılması için
 import matplotlib
@@ -9,6 +9,9 @@ matplotlib.use('TkAgg')  # Windows için TkAgg backend kullan
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+from archive_source import ArchiveMember, CsvSource, find_csv_sources, list_csv_members, read_csv_source
+from plot_decimation import decimate, target_point_count
+
 # KONFIGÜRASYON VE SABİTLER
 
 # Dosya yolları - merkezi konfigürasyon
@@ -16,6 +19,150 @@ DESKTOP_PATH = Path(r"C:\Users\Administrator\Desktop")
 INPUT_CSV_PATH = DESKTOP_PATH / "THYAO.csv"
 OUTPUT_CSV_PATH = DESKTOP_PATH / "THYAO_clean.csv"
 
+# KNN için denenecek k değerleri (n_neighbors)
+KNN_K_VALUES: List[int] = [3, 5, 7, 9, 11, 15, 20]
+
+# Merkezi paralellik ayarı (execution.ExecutionConfig): süreç sayısı x süreç başına
+# BLAS/OpenMP iş parçacığı (0: çekirdekler süreçlere bölünür). Süreçler KNN k
+# taramasında kullanılır (matrisler shared_memory ile paylaşılır); ana süreçteki
+# aşamalar süreç x iş parçacığı kadar, en fazla çekirdek sayısı kadar iş parçacığı alır
+EXECUTION_PROCESSES = 1
+EXECUTION_THREADS_PER_PROCESS = 0
+
+# Çoklu ufuk tahmini - 1, 5, 10 ve 20 gün sonraki kapanış fiyatı
+# Tüm ufuklar tek çalıştırmada, aynı özellik matrisiyle eğitilir
+MULTI_HORIZON_MODE = True
+FORECAST_HORIZONS: List[int] = [1, 5, 10, 20]
+MULTI_HORIZON_OUTPUT_PATH = DESKTOP_PATH / "THYAO_multi_horizon_metrics.csv"
+
+# Backtest (al-sat simülasyonu) ayarları
+# Beklenen getiri = tahmin / bugünkü kapanış - 1; eşiklerle long/flat/short sinyali üretilir
+BACKTEST_LONG_THRESHOLDS: List[float] = list(np.round(np.linspace(0.0, 0.03, 31), 4))
+BACKTEST_SHORT_THRESHOLDS: List[float] = [-np.inf] + list(np.round(-np.linspace(0.0, 0.03, 31), 4))
+BACKTEST_COST_BPS: List[float] = [0.0, 5.0, 10.0, 20.0]  # Komisyon (baz puan)
+BACKTEST_SLIPPAGE_BPS: List[float] = [0.0, 5.0, 10.0]  # Kayma (baz puan)
+BACKTEST_OUTPUT_PATH = DESKTOP_PATH / "THYAO_backtest_grid.csv"
+
+# Kesitsel (piyasa geneli) özellikler - tüm BIST hisse CSV'lerinin bulunduğu klasör
+# Klasör yoksa veya tek hisse içeriyorsa bu adım atlanır
+MARKET_DATA_DIR = DESKTOP_PATH / "BIST"
+MARKET_PANEL_CACHE_PATH = DESKTOP_PATH / "cache" / "market_panel.pkl"
+
+# Sıkıştırılmış BIST arşivleri (.zip/.gz/.zst): CSV üyeleri diske açılmadan akıştan okunur.
+# INPUT_ARCHIVE_PATH verilirse girdi, arşivdeki INPUT_CSV_PATH adlı hisse üyesinden okunur;
+# MARKET_ARCHIVE_PATHS (ve MARKET_DATA_DIR içindeki arşivler) kesitsel panele eklenir
+INPUT_ARCHIVE_PATH: Optional[Path] = None
+MARKET_ARCHIVE_PATHS: List[Path] = []
+ARCHIVE_READ_WORKERS = 4  # üyeleri paralel açan iş parçacığı sayısı (1: seri)
+CROSS_SECTIONAL_FEATURES: List[str] = [
+    "bist100_return", "bist30_return", "bist100_breadth", "excess_return_bist100",
+    "return_rank", "volume_zscore", "relative_volume_rank",
+]
+
+# Çoklu zaman dilimi: günlük veriden haftalık/aylık OHLCV çubukları ve çubuk özellikleri; her gün
+# önceki tamamlanmış çubuğa hizalanır (ileriye bakma yok), tamamlanmış çubuklar hisse başına önbelleklenir
+MULTI_TIMEFRAME_ENABLED = True
+MULTI_TIMEFRAMES: Dict[str, str] = {'weekly': 'W-FRI', 'monthly': 'M'}
+MULTI_TIMEFRAME_MA_BARS = 4
+BAR_CACHE_DIR = DESKTOP_PATH / "cache" / "bars"
+MULTI_TIMEFRAME_BARS_PATH = DESKTOP_PATH / "THYAO_bars.csv"
+
+# Kritik sayısal sütunlar için doğrulama kuralları (sütun adında geçen desen -> kural)
+VALIDATION_RULES: Dict[str, Dict[str, Any]] = {
+    'PRICE': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
+    'VOLUME': {'min_value': 0, 'allow_zero': False, 'fill_method': 'interpolate'},
+    'VALUE': {'min_value': 0, 'allow_zero': False, 'fill_method': 'interpolate'},
+    'CHANGE': {'min_value': None, 'allow_zero': True, 'fill_method': 'forward'},
+    'PERCENT': {'min_value': None, 'allow_zero': True, 'fill_method': 'forward'},
+    'OPEN': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
+    'CLOSE': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
+    'HIGH': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
+    'LOW': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'}
+}
+
+# Özyinelemeli göstergeler (EMA, Wilder RSI/ATR) kernels.py çekirdekleriyle hesaplanır;
+# None: numba kuruluysa JIT, değilse NumPy/SciPy yolu ('numba' / 'numpy' ile zorlanabilir).
+# Açıldığında ema/rsi/atr sütunları model özelliklerine eklenir (tüm modellerin girdisi ve metrikleri değişir)
+KERNEL_INDICATORS_ENABLED = False
+KERNEL_BACKEND: Optional[str] = None
+EMA_SPAN = 12
+RSI_WINDOW = 14
+ATR_WINDOW = 14
+
+# Bölünme / bedelsiz sermaye artırımı düzeltmesi: olaylar CHANGE TO PREVIOUS CLOSING (%) ile ham kapanış
+# oranından tespit edilir veya elle girilir (hisse -> [(hak kullanım tarihi, fiyat çarpanı)], örn. 2:1 için 0.5);
+# hisse başına kümülatif çarpanlar önbelleklenir ve göstergelerden önce fiyat/hacim sütunlarına uygulanır
+CORPORATE_ACTION_ADJUSTMENT_ENABLED = True
+CORPORATE_ACTION_TOLERANCE = 0.03
+CORPORATE_ACTION_EVENTS: Dict[str, List[Tuple[str, float]]] = {}
+# Tespit yalnızca ardışık seanslar arasında yapılır; hafta içi borsa tatilleri ('YYYY-MM-DD') buraya eklenir
+CORPORATE_ACTION_HOLIDAYS: List[str] = []
+CORPORATE_ACTION_CACHE_DIR = DESKTOP_PATH / "cache" / "corporate_actions"
+
+# Veri kalitesi raporu (eksik/geçersiz/aykırı değerler, tarih boşlukları)
+DATA_QUALITY_REPORT_PATH = DESKTOP_PATH / "THYAO_data_quality.json"
+
+# Aşama önbelleği: her aşamanın çıktısı girdi/konfigürasyon/kod hash'i ile saklanır
+ARTIFACT_CACHE_ENABLED = True
+ARTIFACT_CACHE_DIR = DESKTOP_PATH / "cache" / "artifacts"
+ARTIFACT_CACHE_MAX_BYTES = 2 * 1024 ** 3  # 2 GB, aşılırsa en eski erişimli girdiler silinir
+RUN_MANIFEST_PATH = DESKTOP_PATH / "THYAO_run_manifest.json"
+
+# Temizlenmiş verinin tarih indeksli, bellek eşlemli deposu (hisse başına bir klasör)
+DATE_STORE_DIR = DESKTOP_PATH / "cache" / "date_store"
+
+# Çalıştırma özetinden üretilen raporlar (md/html/ipynb)
+REPORT_OUTPUT_DIR = DESKTOP_PATH / "reports"
+
+# Tahmin sunucusunun yüklediği model paketleri (prediction_server.py)
+MODEL_BUNDLE_DIR = DESKTOP_PATH / "models"
+
+# Grafikler: uzun seriler şekil genişliğine göre seyreltilir (piksel başına 2 nokta),
+# yoğun saçılım grafikleri hexbin ile çizilir; çizim süresi satır sayısından bağımsızdır
+PLOT_DPI = 300
+PLOT_DECIMATION_METHOD: Optional[str] = 'lttb'  # 'lttb', 'minmax' veya None (seyreltme yok)
+PLOT_HEXBIN_MIN_POINTS = 5000
+
+# Ensemble: zaman sıralı OOF katlama sayısı, Ridge meta-öğrenici ve volatilite rejimi penceresi
+ENSEMBLE_OOF_SPLITS = 5
+ENSEMBLE_RIDGE_ALPHA = 1.0
+ENSEMBLE_REGIME_WINDOW = 20
+ENSEMBLE_OUTPUT_PATH = DESKTOP_PATH / "THYAO_ensemble_metrics.csv"
+
+# Ek model aileleri (model_registry.MODEL_REGISTRY anahtarları); iş parçacığı sayısı EXECUTION_* ayarından gelir
+EXTRA_MODEL_FAMILIES: List[str] = ['hist_gradient_boosting', 'random_forest']
+EARLY_STOPPING_VALIDATION_FRACTION = 0.2  # eğitim setinin son %20'si, zaman sıralı
+EARLY_STOPPING_PATIENCE = 3
+MODEL_BENCHMARK_OUTPUT_PATH = DESKTOP_PATH / "THYAO_model_benchmark.csv"
+
+# Özellik seçimi: yüksek korelasyonlu / çoklu doğrusal sütunlar eğitim verisine göre elenir
+FEATURE_SELECTION_ENABLED = True
+FEATURE_CORRELATION_THRESHOLD = 0.98
+FEATURE_VIF_THRESHOLD = 50.0
+FEATURE_MI_BINS = 16
+FEATURE_SELECTION_REPORT_PATH = DESKTOP_PATH / "THYAO_feature_selection.csv"
+
+# Açıklanabilirlik: LR/KNN permütasyon önemi (EXECUTION_PROCESSES ile paralel) ve standartlaştırılmış LR katsayıları
+EXPLAINABILITY_ENABLED = True
+PERMUTATION_REPEATS = 10
+FEATURE_IMPORTANCE_OUTPUT_PATH = DESKTOP_PATH / "THYAO_feature_importance.csv"
+
+# Tahmin aralıkları: LR/KNN için artık bootstrap ve zaman sıralı split conformal
+PREDICTION_INTERVALS_ENABLED = True
+PREDICTION_INTERVAL_LEVEL = 0.9
+BOOTSTRAP_REPLICATES = 1000
+PREDICTION_INTERVAL_COVERAGE_PATH = DESKTOP_PATH / "THYAO_interval_coverage.csv"
+PREDICTION_INTERVALS_PATH = DESKTOP_PATH / "THYAO_prediction_intervals.csv"
+
+# Kayma izleme: eğitim dağılımlarının kompakt özeti (kantil kutuları + Welford) ile yeni günlerin PSI/KS karşılaştırması
+DRIFT_MONITOR_ENABLED = True
+DRIFT_BINS = 10
+DRIFT_WINDOW = 60
+DRIFT_PSI_THRESHOLD = 0.25
+DRIFT_MIN_ROWS = 20
+DRIFT_MONITOR_PATH = DESKTOP_PATH / "models" / "drift_monitor.pkl"
+DRIFT_REPORT_PATH = DESKTOP_PATH / "THYAO_drift_report.csv"
+
 # Veri temizleme için kaldırılacak sütunlar
 # Bu sütunlar analiz için gerekli olmayan veya tekrarlayan bilgiler içerir
 COLUMNS_TO_REMOVE: List[str] = [
@@ -100,30 +247,36 @@ def remove_columns_from_dataframe(
     return new_df, matched_originals, missing_columns
 
 
-def main() -> None:
+def load_and_clean_data(input_path: CsvSource) -> Optional[Tuple[pd.DataFrame, str, Dict[str, Any]]]:
     """
-    THYAO hisse senedi veri analizi ve makine öğrenmesi ana fonksiyonu.
+    CSV dosyasını yükler, temizler ve teknik göstergeleri hesaplar.
     
-    Bu fonksiyon şu adımları gerçekleştirir:
-    1. CSV veri dosyasını yükle
-    2. Tarih sütununu işle ve sırala
-    3. Veri temizleme ve filtreleme
-    4. Teknik göstergeler hesapla
-    5. Model eğitimi ve değerlendirme
-    6. Sonuçları görselleştir ve kaydet
+    Adımlar: veri yükleme, tarih işleme, askıya alınan işlemleri filtreleme,
+    sayısal dönüşüm, veri kalitesi raporu, doğrulama, teknik göstergeler,
+    eksik veri temizliği ve veri türü düzenleme.
+    
+    Args:
+        input_path: Ham hisse CSV dosyası veya arşiv üyesi (archive_source.ArchiveMember)
+    
+    Returns:
+        Optional[Tuple[pd.DataFrame, str, Dict[str, Any]]]:
+        - Temizlenmiş DataFrame
+        - TRADE DATE sütun adı
+        - Veri kalitesi raporu
+        Hata durumunda None
     """
     # 1. VERİ YÜKLEME
     
     # CSV dosyasını yükle
     try:
-        df = pd.read_csv(INPUT_CSV_PATH, encoding="utf-8-sig")
+        df = read_csv_source(input_path, encoding="utf-8-sig")
         print(f"Veri yüklendi: {len(df)} kayıt, {len(df.columns)} sütun")
     except FileNotFoundError:
-        print(f"Dosya bulunamadı: {INPUT_CSV_PATH}")
-        return
+        print(f"Dosya bulunamadı: {input_path}")
+        return None
     except Exception as e:
         print(f"CSV yüklenirken hata oluştu: {e}")
-        return
+        return None
 
     # 2. TARİH SÜTUNU İŞLEME
     
@@ -138,21 +291,23 @@ def main() -> None:
         
         if trade_date_col is None:
             print("TRADE DATE sütunu bulunamadı!")
-            return
+            return None
         
         # Datetime tipine çevir ve tarihe göre sırala
         df[trade_date_col] = pd.to_datetime(df[trade_date_col], errors='coerce')
         df = df.sort_values(by=trade_date_col)
         
         # Tekrarlanan tarihleri kaldır (ilk kaydı tut)
+        rows_before_dedup = len(df)
         df = df.drop_duplicates(subset=[trade_date_col], keep='first')
+        duplicate_dates_removed = rows_before_dedup - len(df)
         
         print(f"Tarih sütunu işlendi ve sıralandı")
         print(f"Tekrarlanan tarihler kaldırıldı. Toplam kayıt sayısı: {len(df)}")
         
     except Exception as e:
         print(f"Tarih sütunu işlenirken hata oluştu: {e}")
-        return
+        return None
 
     # 3. ASKIYA ALINAN İŞLEMLERİ FİLTRELEME
     
@@ -182,7 +337,7 @@ def main() -> None:
             
     except Exception as e:
         print(f"SUSPENDED sütunu işlenirken hata oluştu: {e}")
-        return
+        return None
 
     # 4. SAYISAL SÜTUNLARI TEMİZLEME VE DÖNÜŞTÜRME
     
@@ -233,24 +388,85 @@ def main() -> None:
         
     except Exception as e:
         print(f"Sayısal sütunlar işlenirken hata oluştu: {e}")
-        return
+        return None
+
+    # VERİ KALİTESİ RAPORU
+
+    # Eksik değerler, kural bazında geçersiz değerler, aykırı değerler ve takvim
+    # boşlukları tek vektörel geçişte hesaplanır
+    try:
+        from data_quality import profile_data_quality
+
+        quality_report = profile_data_quality(df, trade_date_col, VALIDATION_RULES, suspended_col)
+        quality_report['duplicate_dates_removed'] = duplicate_dates_removed
+
+        print(f"\nVeri kalitesi raporu:")
+        print(f"  Eksik değer: {quality_report['missing_total']}, Geçersiz satır: {quality_report['invalid_rows']}")
+        print(f"  Aykırı değer içeren satır: {quality_report['outlier_rows']}, Tekrarlanan tarih: {duplicate_dates_removed}")
+        if 'calendar_gaps' in quality_report:
+            print(f"  Takvim boşlukları: {quality_report['calendar_gaps']['count']} "
+                  f"({quality_report['calendar_gaps']['missing_business_days']} iş günü)")
+        missing_counts = dict(zip(df.columns, (quality_report['missing'][str(col)] for col in df.columns)))
+
+    except Exception as e:
+        print(f"  ✗ Veri kalitesi raporu oluşturulamadı: {e}")
+        quality_report = {}
+        missing_counts = df.isna().sum().to_dict()
+
+    # BÖLÜNME / BEDELSİZ DÜZELTMESİ
+
+    # Olay tespiti ardışık ham satırlarda (doğrulama filtresinden önce) yapılır;
+    # kümülatif çarpan vektörü hisse başına önbellekten artımlı güncellenir ve
+    # fiyat/hacim sütunlarına tek vektörel çarpımla uygulanır
+    if CORPORATE_ACTION_ADJUSTMENT_ENABLED:
+        try:
+            from corporate_actions import AdjustmentFactorCache, CorporateAction, adjust_frame
+
+            close_col = next((col for col in df.columns if col.strip().upper() == 'CLOSING PRICE'), None)
+            change_col = next((col for col in df.columns if col.strip().upper() == 'CHANGE TO PREVIOUS CLOSING (%)'), None)
+            code_col = next((col for col in df.columns if col.strip().upper() == 'INSTRUMENT SERIES CODE'), None)
+
+            ticker = input_path.stem.upper()
+            if code_col is not None and df[code_col].notna().any():
+                ticker = str(df[code_col].dropna().iloc[0]).strip().upper()
+            manual_events = [
+                CorporateAction(pd.Timestamp(ex_date), float(factor))
+                for ex_date, factor in CORPORATE_ACTION_EVENTS.get(ticker, [])
+            ]
+
+            if close_col is None or change_col is None:
+                print("Düzeltme için CLOSING PRICE / CHANGE TO PREVIOUS CLOSING (%) bulunamadı, yalnızca elle girilen olaylar kullanılacak")
+                change_values = np.full(len(df), np.nan)
+            else:
+                change_values = df[change_col].to_numpy(dtype='float64')
+            close_values = df[close_col].to_numpy(dtype='float64') if close_col is not None else np.full(len(df), np.nan)
+
+            factors, actions, incremental = AdjustmentFactorCache(CORPORATE_ACTION_CACHE_DIR).factors(
+                ticker, df[trade_date_col].to_numpy(), close_values, change_values, manual_events,
+                CORPORATE_ACTION_TOLERANCE, CORPORATE_ACTION_HOLIDAYS,
+            )
+            df = adjust_frame(df, factors)
+            quality_report['corporate_actions'] = [
+                {'ex_date': str(event.ex_date.date()), 'factor': event.factor, 'source': event.source}
+                for event in actions
+            ]
+
+            if actions:
+                print(f"Bölünme/bedelsiz düzeltmesi ({ticker}, {'artımlı' if incremental else 'tam'} güncelleme):")
+                for event in actions:
+                    print(f"  {event.ex_date.date()}: çarpan {event.factor:.4f} ({event.source})")
+            else:
+                print(f"Bölünme/bedelsiz olayı bulunamadı ({ticker}), fiyatlar değiştirilmedi")
+
+        except Exception as e:
+            print(f"  ✗ Bölünme/bedelsiz düzeltmesi yapılamadı: {e}")
 
     # 5. VERİ DOĞRULAMA VE TEMİZLEME
     
     # Eksik değerleri işle ve hatalı değerleri filtrele
     try:
         # Kritik sayısal sütunlar için doğrulama kuralları
-        critical_columns = {
-            'PRICE': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
-            'VOLUME': {'min_value': 0, 'allow_zero': False, 'fill_method': 'interpolate'},
-            'VALUE': {'min_value': 0, 'allow_zero': False, 'fill_method': 'interpolate'},
-            'CHANGE': {'min_value': None, 'allow_zero': True, 'fill_method': 'forward'},
-            'PERCENT': {'min_value': None, 'allow_zero': True, 'fill_method': 'forward'},
-            'OPEN': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
-            'CLOSE': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
-            'HIGH': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'},
-            'LOW': {'min_value': 0, 'allow_zero': False, 'fill_method': 'forward'}
-        }
+        critical_columns = VALIDATION_RULES
         
         initial_count = len(df)
         removed_rows = 0
@@ -261,8 +477,8 @@ def main() -> None:
             
             for col in matching_cols:
                 try:
-                    # Eksik değerleri tespit et ve doldur
-                    missing_count = df[col].isna().sum()
+                    # Eksik değerleri tespit et ve doldur (kalite raporundaki sayımlar)
+                    missing_count = missing_counts.get(col, 0)
                     
                     if missing_count > 0:
                         # Eksik değerleri doldur (forward fill veya interpolate)
@@ -270,6 +486,7 @@ def main() -> None:
                             df[col] = df[col].fillna(method='ffill').fillna(method='bfill')
                         elif rules['fill_method'] == 'interpolate':
                             df[col] = df[col].interpolate(method='linear').fillna(method='ffill').fillna(method='bfill')
+                        missing_counts[col] = 0
                     
                     # Hatalı değerleri filtrele
                     if rules['min_value'] is not None:
@@ -309,7 +526,7 @@ def main() -> None:
         
     except Exception as e:
         print(f"Veri doğrulama ve temizleme sırasında hata oluştu: {e}")
-        return
+        return None
 
     # YORUM: Teknik göstergeleri hesapla ve yeni sütunlar olarak ekle
     try:
@@ -348,7 +565,7 @@ def main() -> None:
         # Eğer bulunamazsa, hata ver
         if closing_price_col is None:
             print(f"Kapanış fiyatı sütunu bulunamadı!")
-            return
+            return None
         
         if opening_price_col is None:
             print(f"Açılış fiyatı sütunu bulunamadı, daily_return hesaplanamayacak!")
@@ -383,22 +600,42 @@ def main() -> None:
             print(f"  [HATA] pct_change hesaplanamadı: {e}")
             df['pct_change'] = np.nan
         
-        # 3. Moving Average 5: closing_price.rolling(window=5).mean()
+        # 3-4. Moving Average 5 ve 20: tüm pencereler kapanış dizisi üzerinde tek geçişte
+        # (rolling(window, min_periods=1).mean() ile aynı sonuç)
         try:
-            df['moving_average_5'] = df[closing_price_col].rolling(window=5, min_periods=1).mean()
-            print(f"  [OK] moving_average_5 sütunu eklendi")
+            from rolling_stats import rolling_mean_multi
+
+            moving_averages = rolling_mean_multi(df[closing_price_col].to_numpy(), [5, 20], min_periods=1)
+            for window in (5, 20):
+                df[f'moving_average_{window}'] = moving_averages[window]
+                print(f"  [OK] moving_average_{window} sütunu eklendi")
         except Exception as e:
-            print(f"  [HATA] moving_average_5 hesaplanamadı: {e}")
+            print(f"  [HATA] Hareketli ortalamalar hesaplanamadı: {e}")
             df['moving_average_5'] = np.nan
-        
-        # 4. Moving Average 20: closing_price.rolling(window=20).mean()
-        try:
-            df['moving_average_20'] = df[closing_price_col].rolling(window=20, min_periods=1).mean()
-            print(f"  [OK] moving_average_20 sütunu eklendi")
-        except Exception as e:
-            print(f"  [HATA] moving_average_20 hesaplanamadı: {e}")
             df['moving_average_20'] = np.nan
         
+        # 5-7. EMA, RSI ve ATR: adım adım özyinelemeler (vektörleştirilemez) derlenmiş çekirdeklerle
+        # (isteğe bağlı model özellikleri, bkz. KERNEL_INDICATORS_ENABLED)
+        if KERNEL_INDICATORS_ENABLED:
+            try:
+                from kernels import atr, ema, resolve_backend, rsi
+
+                high_col = next((col for col in df.columns if col.strip().upper() == 'HIGHEST PRICE'), None)
+                low_col = next((col for col in df.columns if col.strip().upper() == 'LOWEST PRICE'), None)
+                close_values = df[closing_price_col].to_numpy(dtype='float64')
+
+                df[f'ema_{EMA_SPAN}'] = ema(close_values, EMA_SPAN, KERNEL_BACKEND)
+                df[f'rsi_{RSI_WINDOW}'] = rsi(close_values, RSI_WINDOW, KERNEL_BACKEND)
+                if high_col is not None and low_col is not None:
+                    df[f'atr_{ATR_WINDOW}'] = atr(
+                        df[high_col].to_numpy(dtype='float64'), df[low_col].to_numpy(dtype='float64'),
+                        close_values, ATR_WINDOW, KERNEL_BACKEND,
+                    )
+                print(f"  [OK] ema_{EMA_SPAN}, rsi_{RSI_WINDOW}, atr_{ATR_WINDOW} sütunları eklendi "
+                      f"({resolve_backend(KERNEL_BACKEND)} çekirdekleri)")
+            except Exception as e:
+                print(f"  [HATA] EMA/RSI/ATR hesaplanamadı: {e}")
+
         # Yeni sütunların istatistiklerini göster
         print(f"\nTeknik göstergeler hesaplandı:")
         print(f"  daily_return: Ortalama {df['daily_return'].mean():.4f}, Std {df['daily_return'].std():.4f}")
@@ -406,19 +643,18 @@ def main() -> None:
         print(f"  moving_average_5: Ortalama {df['moving_average_5'].mean():.2f}")
         print(f"  moving_average_20: Ortalama {df['moving_average_20'].mean():.2f}")
         
-        # NaN değerleri temizle (ilk günler için)
-        initial_nan_count = df.isna().sum().sum()
+        # NaN değerleri temizle (ilk günler için) - dropna sonrası NaN kalmaz
+        initial_nan_count = int(df.isna().to_numpy().sum())
         df = df.dropna()
-        final_nan_count = df.isna().sum().sum()
         
-        if initial_nan_count > final_nan_count:
-            print(f"  NaN değerler temizlendi: {initial_nan_count - final_nan_count} adet")
+        if initial_nan_count > 0:
+            print(f"  NaN değerler temizlendi: {initial_nan_count} adet")
         
         print(f"  Toplam kayıt sayısı: {len(df)}")
         
     except Exception as e:
         print(f"Teknik göstergeler hesaplanırken hata oluştu: {e}")
-        return
+        return None
 
     # 7. EKSİK VERİ ANALİZİ VE TEMİZLEME
     
@@ -444,7 +680,7 @@ def main() -> None:
             # Sayısal sütunlarda NaN değerleri doldur
             numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
             for col in numeric_cols:
-                if df[col].isna().sum() > 0:
+                if nan_summary[col] > 0:
                     # Hareketli ortalama gibi sütunlarda forward fill kullan
                     if 'moving_average' in col.lower():
                         df[col] = df[col].fillna(method='ffill').fillna(method='bfill')
@@ -457,16 +693,15 @@ def main() -> None:
             # Kategorik sütunlarda NaN değerleri doldur
             categorical_cols = df.select_dtypes(include=['object']).columns
             for col in categorical_cols:
-                if df[col].isna().sum() > 0:
+                if nan_summary[col] > 0:
                     df[col] = df[col].fillna('Unknown')
                     print(f"    [OK] {col}: 'Unknown' ile dolduruldu")
             
             # Kalan NaN değerleri olan satırları sil
-            remaining_nan = df.isna().sum().sum()
-            if remaining_nan > 0:
-                initial_rows = len(df)
-                df = df.dropna()
-                removed_rows = initial_rows - len(df)
+            initial_rows = len(df)
+            df = df.dropna()
+            removed_rows = initial_rows - len(df)
+            if removed_rows > 0:
                 print(f"    [UYARI] {removed_rows} satır NaN değerler nedeniyle silindi")
         else:
             print(f"  [OK] Hiç NaN değer bulunamadı")
@@ -475,7 +710,7 @@ def main() -> None:
         
     except Exception as e:
         print(f"NaN değer temizleme sırasında hata oluştu: {e}")
-        return
+        return None
 
     # Veri türlerini düzenleme
     try:
@@ -493,7 +728,10 @@ def main() -> None:
                     df[col] = pd.to_numeric(df[col], errors='coerce')
         
         # Teknik göstergeleri float formatına çevir
-        technical_cols = ['daily_return', 'pct_change', 'moving_average_5', 'moving_average_20']
+        technical_cols = [
+            'daily_return', 'pct_change', 'moving_average_5', 'moving_average_20',
+            f'ema_{EMA_SPAN}', f'rsi_{RSI_WINDOW}', f'atr_{ATR_WINDOW}',
+        ]
         for col in technical_cols:
             if col in df.columns:
                 df[col] = df[col].astype('float64')
@@ -502,138 +740,43 @@ def main() -> None:
         
     except Exception as e:
         print(f"Veri türleri düzenlenirken hata oluştu: {e}")
-        return
+        return None
 
-    # Özellik ve hedef değişkenleri ayırma (X, y)
-    try:
-        # Hedef değişkeni bul (closing_price)
-        target_col = None
-        possible_target_names = [
-            'CLOSING PRICE', 'CLOSING SESSION PRICE', 'CLOSE', 'CLOSING', 'CLOSE PRICE', 'LAST', 'LAST PRICE', 'SETTLEMENT', 'SETTLEMENT PRICE'
-        ]
-        
-        # Her sütunu kontrol et - CLOSING PRICE öncelikli
-        for col in df.columns:
-            col_upper = col.strip().upper()
-            
-            # Kapanış fiyatı sütununu bul - tam eşleşme öncelikli
-            if col_upper == 'CLOSING PRICE':
-                target_col = col
-                break
-            elif col_upper == 'CLOSING SESSION PRICE':
-                target_col = col
-                break
-            elif any(close_name in col_upper for close_name in possible_target_names):
-                # GROSS SETTLEMENT gibi yanlış sütunları filtrele
-                if 'SETTLEMENT' not in col_upper or 'CLOSING' in col_upper:
-                    target_col = col
-                    break
-        
-        if target_col is None:
-            print(f"Hedef değişken bulunamadı!")
-            return
-        
-        # Hedef değişkeni ayır (y) - yarının kapanış fiyatı
-        y = df[target_col].shift(-1).copy()  # shift(-1) ile yarının değeri
-        
-        # Son günün NaN değerini kaldır (yarın olmadığı için)
-        y = y.dropna()
-        df_aligned = df.iloc[:-1].copy()  # Son gün hariç tüm veri
-        
-        print(f"  [OK] Hedef değişken: yarının {target_col}")
-        print(f"  [OK] Hedef değişken boyutu: {len(y)}")
-        
-        # Özellik değişkenleri ayır (X) - bugünün verileri
-        print(f"  Özellik değişkenleri hazırlanıyor: bugünün verileri...")
-        
-        # Özellik olarak kullanılacak sütunları seç
-        feature_columns = [
-            # Fiyat verileri
-            'OPENING PRICE', 'OPENING SESSION PRICE', 'LOWEST PRICE', 'HIGHEST PRICE', 
-            'CLOSING PRICE', 'CLOSING SESSION PRICE', 'REFERENCE PRICE',
-            
-            # Hacim ve değer verileri
-            'TOTAL TRADED VOLUME', 'TOTAL TRADED VALUE',
-            'TRADED VOLUME AT OPENING SESSION', 'TRADED VALUE AT OPENING SESSION',
-            'TRADED VOLUME AT CLOSING SESSION', 'TRADED VALUE AT CLOSING SESSION',
-            'TRADED VOLUME OF TRADES AT CLOSING PRICE', 'TRADED VALUE OF TRADES AT CLOSING PRICE',
-            
-            # Teknik göstergeler
-            'daily_return', 'pct_change', 'moving_average_5', 'moving_average_20',
-            
-            # Diğer önemli veriler
-            'CHANGE TO PREVIOUS CLOSING (%)', 'VWAP', 'TOTAL NUMBER OF CONTRACTS',
-            'REMAINING BID', 'REMAINING ASK'
-        ]
-        
-        # Mevcut sütunlardan özellik sütunlarını bul
-        available_features = []
-        for feature in feature_columns:
-            for col in df.columns:
-                if col.upper() == feature.upper():
-                    available_features.append(col)
-                    break
-        
-        # Özellik verilerini hazırla (X)
-        X = df_aligned[available_features].copy()
-        
-        # NaN değerleri temizle
-        initial_rows = len(X)
-        X = X.dropna()
-        y = y.iloc[:len(X)]  # X ile aynı boyutta yap
-        
-        print(f"Özellik değişkenleri: {len(available_features)} adet")
-        print(f"Veri boyutu: X={X.shape}, y={y.shape}")
-        
-    except Exception as e:
-        print(f"Özellik/hedef ayrımı sırasında hata oluştu: {e}")
-        return
+    return df, trade_date_col, quality_report
 
-    # 1. VERİ SETİNİ AYIRMA
-    try:
-        print(f"\n1. VERİ SETİNİ AYIRMA")
-        
-        print(f"X → Teknik göstergeler ve özellikler ({len(available_features)} adet)")
-        print(f"y → Close session price (kapanış fiyatı)")
-        print(f"Veri boyutu: X={X.shape}, y={y.shape}")
-        
-        # train_test_split ile veriyi %80 eğitim, %20 test olarak ayır
-        train_size = int(len(df) * 0.8)  # %80 eğitim
-        
-        # Eğitim seti (ilk %80)
-        X_train = X.iloc[:train_size]
-        y_train = y.iloc[:train_size]
-        
-        # Test seti (son %20)
-        X_test = X.iloc[train_size:]
-        y_test = y.iloc[train_size:]
-        
-        print(f"\n  [OK] Veri seti ayrıldı:")
-        print(f"    Eğitim seti: {X_train.shape[0]} kayıt (%80)")
-        print(f"    Test seti: {X_test.shape[0]} kayıt (%20)")
-        print(f"    Toplam: {len(df)} kayıt")
-        
-        # Eğitim ve test setlerini DataFrame olarak kaydet
-        train_df = pd.concat([X_train, y_train], axis=1)
-        test_df = pd.concat([X_test, y_test], axis=1)
-        
-        # Dosya yollarını tanımla
-        train_output_path = DESKTOP_PATH / "THYAO_train.csv"
-        test_output_path = DESKTOP_PATH / "THYAO_test.csv"
-        
-        # Eğitim ve test setlerini kaydet
-        train_df.to_csv(train_output_path, index=False, encoding="utf-8-sig")
-        test_df.to_csv(test_output_path, index=False, encoding="utf-8-sig")
-        
-        print(f"  [OK] Veri setleri kaydedildi:")
-        print(f"    Eğitim: {train_output_path}")
-        print(f"    Test: {test_output_path}")
-        
-    except Exception as e:
-        print(f"Veri bölme sırasında hata oluştu: {e}")
-        return
 
-            # 8. LINEAR REGRESSION MODEL EĞİTİMİ
+def train_and_evaluate_models(
+    X_train: pd.DataFrame,
+    y_train: pd.Series,
+    X_test: pd.DataFrame,
+    y_test: pd.Series,
+    n_workers: int = 1,
+    threads_per_worker: Optional[int] = None,
+    oof_splits: int = ENSEMBLE_OOF_SPLITS,
+) -> Optional[Dict[str, Any]]:
+    """
+    Linear Regression ve KNN Regressor modellerini eğitir ve değerlendirir.
+    
+    KNN için KNN_K_VALUES içindeki k değerleri denenir, test R² skoruna göre
+    en iyi k seçilir. Modeller test R² skoruna göre karşılaştırılır. Ensemble
+    katmanının kullandığı zaman sıralı OOF tahminleri de burada üretilir ve
+    model çıktılarıyla aynı önbellek artefaktında saklanır.
+    
+    Args:
+        X_train: Eğitim özellikleri
+        y_train: Eğitim hedefi (yarının kapanış fiyatı)
+        X_test: Test özellikleri
+        y_test: Test hedefi
+        n_workers: KNN k taraması için süreç sayısı (1: seri; >1 ise matrisler
+            paylaşılan belleğe bir kez yayınlanır, bkz. shared_matrices.py)
+        threads_per_worker: Worker başına BLAS/OpenMP iş parçacığı sınırı
+        oof_splits: OOF tahminleri için TimeSeriesSplit katlama sayısı
+    
+    Returns:
+        Optional[Dict[str, Any]]: Eğitilmiş modeller, tahminler ve metrikler;
+        hata durumunda None
+    """
+    # 8. LINEAR REGRESSION MODEL EĞİTİMİ
     
     # Linear Regression modelini eğit ve değerlendir
     try:
@@ -709,21 +852,37 @@ def main() -> None:
         
         # K değerlerini test et ve en iyi sonucu bul
         print(f"Farklı k değerleri deneniyor (n_neighbors)...")
-        k_values = [3, 5, 7, 9, 11, 15, 20]
+        k_values = KNN_K_VALUES
         knn_results_list = []
         
         best_k = 5
         best_knn_r2 = -float('inf')
         
+        # Paralel tarama: worker'lar matrislere paylaşılan bellekten kopyasız bağlanır
+        parallel_predictions = {}
+        if n_workers > 1:
+            from shared_matrices import evaluate_models_parallel
+            
+            print(f"  {n_workers} süreçte paralel değerlendirme (paylaşılan bellek, "
+                  f"süreç başına {threads_per_worker or 'sınırsız'} iş parçacığı)...")
+            parallel_results = evaluate_models_parallel(
+                X_train.to_numpy(), y_train.to_numpy(), X_test.to_numpy(), y_test.to_numpy(),
+                [('knn', k) for k in k_values], n_workers, threads_per_worker,
+            )
+            parallel_predictions = {result['k']: result['pred'] for result in parallel_results}
+        
         for k in k_values:
             print(f"  k={k} deneniyor...")
             
-            # KNN modeli oluştur ve eğit
-            knn_temp = KNeighborsRegressor(n_neighbors=k)
-            knn_temp.fit(X_train, y_train)
-            
-            # Test verisi üzerinde tahmin yap
-            knn_temp_pred = knn_temp.predict(X_test)
+            if k in parallel_predictions:
+                knn_temp_pred = parallel_predictions[k]
+            else:
+                # KNN modeli oluştur ve eğit
+                knn_temp = KNeighborsRegressor(n_neighbors=k)
+                knn_temp.fit(X_train, y_train)
+                
+                # Test verisi üzerinde tahmin yap
+                knn_temp_pred = knn_temp.predict(X_test)
             
             # Performans metriklerini hesapla
             knn_temp_r2 = r2_score(y_test, knn_temp_pred)
@@ -872,297 +1031,1323 @@ def main() -> None:
         print(f"    R² Skoru: {best_result['test_r2']:.4f}")
         print(f"    RMSE: {best_result['test_rmse']:.4f}")
         print(f"    MAE: {best_result['test_mae']:.4f}")
-        
 
+        # Ensemble için OOF tahminleri (temel modellerin klonlarıyla, yalnızca geçmiş katlamalarla)
+        oof_predictions = None
+        try:
+            from ensemble import compute_oof_predictions
+            from sklearn.base import clone
+
+            oof_predictions = compute_oof_predictions(
+                X_train, y_train,
+                {'Linear Regression': lambda: clone(lr_model), 'KNN Regressor': lambda: clone(knn_model)},
+                oof_splits,
+            )
+        except Exception as e:
+            print(f"  ✗ OOF tahminleri üretilirken hata: {e}")
+
+        return {
+            'lr_model': lr_model,
+            'knn_model': knn_model,
+            'lr_train_pred': lr_train_pred,
+            'lr_test_pred': lr_test_pred,
+            'knn_train_pred': knn_train_pred,
+            'knn_test_pred': knn_test_pred,
+            'lr_results': lr_results,
+            'knn_results': knn_results,
+            'knn_results_list': knn_results_list,
+            'all_results': all_results,
+            'best_result': best_result,
+            'results_summary': results_summary,
+            'oof_predictions': oof_predictions,
+        }
         
     except ImportError as e:
         print(f"  [UYARI] Gerekli kütüphaneler bulunamadı: {e}")
         print(f"    Model eğitimi yapılamadı. scikit-learn kurulumu gerekli.")
+        return None
     except Exception as e:
         print(f"  ✗ Model eğitimi sırasında hata: {e}")
         print(f"    Model eğitimi yapılamadı.")
+        return None
 
-    # YORUM: Grafikleri oluştur ve kaydet
-    try:
-        print(f"\nGrafikler oluşturuluyor...")
-        
-        # Türkçe karakter desteği için font ayarı
-        plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'SimHei']
-        
-        # Grafik stilini ayarla
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
-        
-        # 10. GÖRSELLEŞTİRME VE GRAFİK OLUŞTURMA
+
+def plot_closing_price_trend(df: pd.DataFrame, target_col: str, output_path: Path) -> None:
+    """
+    Kapanış fiyatı trendini ve hareketli ortalamaları çizer ve kaydeder.
+    
+    Args:
+        df: Teknik göstergeleri içeren DataFrame
+        target_col: Kapanış fiyatı sütunu
+        output_path: PNG dosya yolu
+    """
+    # 1. Kapanış fiyatı trendi (zaman serisi grafiği)
+    print(f"  Kapanış fiyatı trendi çiziliyor...")
+    
+    figure = plt.figure(figsize=(14, 8))
+    
+    # Uzun seriler şekil genişliğindeki piksel sayısına göre seyreltilir (LTTB / min-max);
+    # kısa serilerde tüm noktalar çizilir
+    n_points = target_point_count(figure.get_figwidth(), PLOT_DPI)
+    
+    def series(column: str) -> Tuple[np.ndarray, np.ndarray]:
+        if PLOT_DECIMATION_METHOD is None:
+            return df.index.to_numpy(), df[column].to_numpy()
+        return decimate(df.index.to_numpy(), df[column].to_numpy(), n_points, PLOT_DECIMATION_METHOD)
+    
+    # Ana trend çizgisi - kapanış fiyatları
+    plt.plot(*series(target_col), linewidth=2, color='#2E86AB', alpha=0.8, label='Kapanış Fiyatı')
+    
+    # Hareketli ortalamalar - trend analizi için
+    if 'moving_average_5' in df.columns:
+        plt.plot(*series('moving_average_5'), linewidth=1.5, color='#A23B72', alpha=0.7, label='5 Günlük Hareketli Ortalama')
+    
+    if 'moving_average_20' in df.columns:
+        plt.plot(*series('moving_average_20'), linewidth=1.5, color='#F18F01', alpha=0.7, label='20 Günlük Hareketli Ortalama')
+    
+    # Grafik özelliklerini ayarla
+    plt.title('THYAO Kapanış Fiyatı Trendi ve Hareketli Ortalamalar', fontsize=16, fontweight='bold', pad=20)
+    plt.xlabel('Zaman', fontsize=12, fontweight='bold')
+    plt.ylabel('Fiyat (TL)', fontsize=12, fontweight='bold')
+    plt.grid(True, alpha=0.3)
+    plt.legend(fontsize=11, loc='upper left')
+    
+    # X ekseni etiketlerini optimize et
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    
+    # Grafiği kaydet
+    trend_plot_path = output_path
+    plt.savefig(trend_plot_path, dpi=PLOT_DPI, bbox_inches='tight', facecolor='white')
+    
+    # Grafiği ekranda göster
+    plt.show()
+    plt.close()
+    
+    print(f"    [OK] Kapanış fiyatı trendi kaydedildi: {trend_plot_path}")
+
+
+def plot_daily_return_distribution(df: pd.DataFrame, output_path: Path) -> None:
+    """
+    Günlük getiri histogramını normal dağılım eğrisiyle çizer ve kaydeder.
+    
+    Args:
+        df: daily_return sütununu içeren DataFrame
+        output_path: PNG dosya yolu
+    """
+    # 2. Günlük getiri dağılımı (histogram ve normal dağılım analizi)
+    print(f"  Günlük getiri dağılımı çiziliyor...")
+    
+    plt.figure(figsize=(12, 8))
+    
+    # Histogram
+    if 'daily_return' in df.columns:
+        # NaN değerleri temizle
+        daily_returns_clean = df['daily_return'].dropna()
         
-        # 1. Kapanış fiyatı trendi (zaman serisi grafiği)
-        print(f"  Kapanış fiyatı trendi çiziliyor...")
-        
-        plt.figure(figsize=(14, 8))
-        
-        # Ana trend çizgisi - kapanış fiyatları
-        plt.plot(df.index, df[target_col], linewidth=2, color='#2E86AB', alpha=0.8, label='Kapanış Fiyatı')
-        
-        # Hareketli ortalamalar - trend analizi için
-        if 'moving_average_5' in df.columns:
-            plt.plot(df.index, df['moving_average_5'], linewidth=1.5, color='#A23B72', alpha=0.7, label='5 Günlük Hareketli Ortalama')
-        
-        if 'moving_average_20' in df.columns:
-            plt.plot(df.index, df['moving_average_20'], linewidth=1.5, color='#F18F01', alpha=0.7, label='20 Günlük Hareketli Ortalama')
+        if len(daily_returns_clean) > 0:
+            # Histogram çiz
+            plt.hist(daily_returns_clean, bins=50, alpha=0.7, color='#2E86AB', edgecolor='black', linewidth=0.5)
+            
+            # Normal dağılım eğrisi ekle
+            import numpy as np
+            from scipy import stats
+            
+            # Normal dağılım parametreleri
+            mu = daily_returns_clean.mean()
+            sigma = daily_returns_clean.std()
+            
+            # Normal dağılım eğrisi
+            x = np.linspace(daily_returns_clean.min(), daily_returns_clean.max(), 100)
+            y = stats.norm.pdf(x, mu, sigma) * len(daily_returns_clean) * (daily_returns_clean.max() - daily_returns_clean.min()) / 50
+            
+            plt.plot(x, y, 'r-', linewidth=2, label=f'Normal Dağılım (μ={mu:.4f}, σ={sigma:.4f})')
+            
+            # İstatistik bilgileri
+            plt.axvline(mu, color='red', linestyle='--', alpha=0.8, label=f'Ortalama: {mu:.4f}')
+            plt.axvline(mu + sigma, color='orange', linestyle=':', alpha=0.8, label=f'+1σ: {mu + sigma:.4f}')
+            plt.axvline(mu - sigma, color='orange', linestyle=':', alpha=0.8, label=f'-1σ: {mu - sigma:.4f}')
+            
+            # Grafik özelliklerini ayarla
+            plt.title('THYAO Günlük Getiri Dağılımı', fontsize=16, fontweight='bold', pad=20)
+            plt.xlabel('Günlük Getiri', fontsize=12, fontweight='bold')
+            plt.ylabel('Frekans', fontsize=12, fontweight='bold')
+            plt.grid(True, alpha=0.3)
+            plt.legend(fontsize=11, loc='upper right')
+            
+            # İstatistik bilgilerini ekle
+            stats_text = f'Toplam Gözlem: {len(daily_returns_clean)}\nOrtalama: {mu:.4f}\nStd: {sigma:.4f}\nMin: {daily_returns_clean.min():.4f}\nMax: {daily_returns_clean.max():.4f}'
+            plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, fontsize=10, 
+                    verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
+            
+            plt.tight_layout()
+            
+            # Grafiği kaydet
+            histogram_plot_path = output_path
+            plt.savefig(histogram_plot_path, dpi=PLOT_DPI, bbox_inches='tight', facecolor='white')
+            
+            # Grafiği ekranda göster
+            plt.show()
+            plt.close()
+            
+            print(f"    [OK] Günlük getiri dağılımı kaydedildi: {histogram_plot_path}")
+            
+            # İstatistik özeti
+            print(f"    Günlük getiri istatistikleri:")
+            print(f"      Ortalama: {mu:.4f}")
+            print(f"      Standart Sapma: {sigma:.4f}")
+            print(f"      Minimum: {daily_returns_clean.min():.4f}")
+            print(f"      Maksimum: {daily_returns_clean.max():.4f}")
+            print(f"      Toplam gözlem: {len(daily_returns_clean)}")
+        else:
+            print(f"    ⚠ daily_return sütununda veri bulunamadı")
+    else:
+        print(f"    ⚠ daily_return sütunu bulunamadı")
+
+
+def plot_real_vs_prediction(
+    y_test: pd.Series,
+    lr_test_pred: Optional[np.ndarray],
+    knn_test_pred: Optional[np.ndarray],
+    lr_results: Dict[str, Any],
+    knn_results: Dict[str, Any],
+    output_path: Path,
+) -> None:
+    """
+    Her iki model için gerçek ve tahmin edilen fiyatları karşılaştırır.
+    
+    Args:
+        y_test: Gerçek test hedefi
+        lr_test_pred: Linear Regression test tahminleri
+        knn_test_pred: KNN test tahminleri
+        lr_results: Linear Regression metrikleri
+        knn_results: KNN metrikleri
+        output_path: PNG dosya yolu
+    """
+    lr_test_r2, lr_test_rmse, lr_test_mae = (lr_results.get(m) for m in ('test_r2', 'test_rmse', 'test_mae'))
+    knn_test_r2, knn_test_rmse, knn_test_mae = (knn_results.get(m) for m in ('test_r2', 'test_rmse', 'test_mae'))
+    
+    # 3. Gerçek vs. Tahmin grafiği (model performansı)
+    print(f"  Gerçek vs. Tahmin grafiği çiziliyor...")
+    
+    # Yoğun saçılımlar hexbin ile çizilir (nokta sayısından bağımsız çizim süresi)
+    def scatter(predictions: np.ndarray, color: str, cmap: str) -> None:
+        if len(y_test) >= PLOT_HEXBIN_MIN_POINTS:
+            plt.hexbin(y_test, predictions, gridsize=80, cmap=cmap, mincnt=1, bins='log')
+            plt.colorbar(label='Gün sayısı (log)')
+        else:
+            plt.scatter(y_test, predictions, alpha=0.6, color=color, s=50)
+    
+    try:
+        # Model tahminlerini al (eğer mevcut ise)
+        if lr_test_pred is not None and knn_test_pred is not None:
+            plt.figure(figsize=(14, 10))
+            
+            # Alt grafik 1: Linear Regression
+            plt.subplot(2, 1, 1)
+            scatter(lr_test_pred, '#2E86AB', 'Blues')
+            
+            # Mükemmel tahmin çizgisi (y=x)
+            min_val = min(y_test.min(), lr_test_pred.min())
+            max_val = max(y_test.max(), lr_test_pred.max())
+            plt.plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='Mükemmel Tahmin (y=x)')
+            
+            plt.title('Linear Regression: Gerçek vs. Tahmin', fontsize=14, fontweight='bold')
+            plt.xlabel('Gerçek Kapanış Fiyatı (TL)', fontsize=12)
+            plt.ylabel('Tahmin Edilen Fiyat (TL)', fontsize=12)
+            plt.grid(True, alpha=0.3)
+            plt.legend()
+            
+            # R² değerini ekle
+            plt.text(0.05, 0.95, f'R² = {lr_test_r2:.4f}', transform=plt.gca().transAxes, 
+                    fontsize=12, bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
+            
+            # Alt grafik 2: KNN Regressor
+            plt.subplot(2, 1, 2)
+            scatter(knn_test_pred, '#A23B72', 'RdPu')
+            
+            # Mükemmel tahmin çizgisi (y=x)
+            plt.plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='Mükemmel Tahmin (y=x)')
+            
+            plt.title('KNN Regressor: Gerçek vs. Tahmin', fontsize=14, fontweight='bold')
+            plt.xlabel('Gerçek Kapanış Fiyatı (TL)', fontsize=12)
+            plt.ylabel('Tahmin Edilen Fiyat (TL)', fontsize=12)
+            plt.grid(True, alpha=0.3)
+            plt.legend()
+            
+            # R² değerini ekle
+            plt.text(0.05, 0.95, f'R² = {knn_test_r2:.4f}', transform=plt.gca().transAxes, 
+                    fontsize=12, bbox=dict(boxstyle='round', facecolor='lightpink', alpha=0.8))
+            
+            plt.tight_layout()
+            
+            # Grafiği kaydet
+            prediction_plot_path = output_path
+            plt.savefig(prediction_plot_path, dpi=PLOT_DPI, bbox_inches='tight', facecolor='white')
+            
+            # Grafiği ekranda göster
+            plt.show()
+            plt.close()
+            
+            print(f"    [OK] Gerçek vs. Tahmin grafiği kaydedildi: {prediction_plot_path}")
+            
+            # Model performans özeti
+            print(f"    Model performans özeti:")
+            print(f"      Linear Regression: R²={lr_test_r2:.4f}, RMSE={lr_test_rmse:.4f}, MAE={lr_test_mae:.4f}")
+            print(f"      KNN Regressor: R²={knn_test_r2:.4f}, RMSE={knn_test_rmse:.4f}, MAE={knn_test_mae:.4f}")
+            
+        else:
+            print(f"    ⚠ Model tahminleri bulunamadı, grafik çizilemedi")
+            
+    except Exception as e:
+        print(f"    ⚠ Gerçek vs. Tahmin grafiği çizilemedi: {e}")
+
+
+def plot_knn_k_comparison(knn_results_list: List[Dict[str, Any]], output_path: Path) -> None:
+    """
+    KNN için k değerlerine göre R², RMSE ve MAE skorlarını karşılaştırır.
+    
+    Args:
+        knn_results_list: k değeri başına metrikler
+        output_path: PNG dosya yolu
+    """
+    # 4. KNN k değerleri karşılaştırma grafiği
+    print(f"  KNN k değerleri karşılaştırma grafiği çiziliyor...")
+    
+    try:
+        # KNN k değerleri sonuçlarını al (eğer mevcut ise)
+        if knn_results_list:
+            plt.figure(figsize=(14, 10))
+            
+            # Alt grafik 1: R² skorları
+            plt.subplot(2, 2, 1)
+            k_values = [result['k'] for result in knn_results_list]
+            r2_scores = [result['r2'] for result in knn_results_list]
+            
+            plt.plot(k_values, r2_scores, 'o-', linewidth=2, markersize=8, color='#A23B72')
+            plt.axhline(y=0, color='red', linestyle='--', alpha=0.7, label='R² = 0 (Random)')
+            
+            # En iyi k değerini işaretle
+            best_k_result = max(knn_results_list, key=lambda x: x['r2'])
+            plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2, 
+                       label=f'En iyi k = {best_k_result["k"]}')
+            
+            plt.title('KNN: k Değerine Göre R² Skoru', fontsize=14, fontweight='bold')
+            plt.xlabel('k (n_neighbors)', fontsize=12)
+            plt.ylabel('R² Skoru', fontsize=12)
+            plt.grid(True, alpha=0.3)
+            plt.legend()
+            
+            # Alt grafik 2: RMSE skorları
+            plt.subplot(2, 2, 2)
+            rmse_scores = [result['rmse'] for result in knn_results_list]
+            
+            plt.plot(k_values, rmse_scores, 's-', linewidth=2, markersize=8, color='#F18F01')
+            plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2)
+            
+            plt.title('KNN: k Değerine Göre RMSE', fontsize=14, fontweight='bold')
+            plt.xlabel('k (n_neighbors)', fontsize=12)
+            plt.ylabel('RMSE', fontsize=12)
+            plt.grid(True, alpha=0.3)
+            
+            # Alt grafik 3: MAE skorları
+            plt.subplot(2, 2, 3)
+            mae_scores = [result['mae'] for result in knn_results_list]
+            
+            plt.plot(k_values, mae_scores, '^-', linewidth=2, markersize=8, color='#2E86AB')
+            plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2)
+            
+            plt.title('KNN: k Değerine Göre MAE', fontsize=14, fontweight='bold')
+            plt.xlabel('k (n_neighbors)', fontsize=12)
+            plt.ylabel('MAE', fontsize=12)
+            plt.grid(True, alpha=0.3)
+            
+            # Alt grafik 4: Tüm metrikler karşılaştırması
+            plt.subplot(2, 2, 4)
+            
+            # Metrikleri normalize et (0-1 arasına)
+            r2_norm = [(r2 - min(r2_scores)) / (max(r2_scores) - min(r2_scores)) for r2 in r2_scores]
+            rmse_norm = [(rmse - min(rmse_scores)) / (max(rmse_scores) - min(rmse_scores)) for rmse in rmse_scores]
+            mae_norm = [(mae - min(mae_scores)) / (max(mae_scores) - min(mae_scores)) for mae in mae_scores]
+            
+            plt.plot(k_values, r2_norm, 'o-', linewidth=2, markersize=8, color='#A23B72', label='R² (normalize)')
+            plt.plot(k_values, rmse_norm, 's-', linewidth=2, markersize=8, color='#F18F01', label='RMSE (normalize)')
+            plt.plot(k_values, mae_norm, '^-', linewidth=2, markersize=8, color='#2E86AB', label='MAE (normalize)')
+            plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2)
+            
+            plt.title('KNN: Tüm Metrikler Karşılaştırması', fontsize=14, fontweight='bold')
+            plt.xlabel('k (n_neighbors)', fontsize=12)
+            plt.ylabel('Normalize Edilmiş Skorlar', fontsize=12)
+            plt.grid(True, alpha=0.3)
+            plt.legend()
+            
+            plt.tight_layout()
+            
+            # Grafiği kaydet
+            knn_comparison_plot_path = output_path
+            plt.savefig(knn_comparison_plot_path, dpi=PLOT_DPI, bbox_inches='tight', facecolor='white')
+            
+            # Grafiği ekranda göster
+            plt.show()
+            plt.close()
+            
+            print(f"    [OK] KNN k değerleri karşılaştırma grafiği kaydedildi: {knn_comparison_plot_path}")
+            
+            # K değerleri özeti
+            print(f"    K değerleri özeti:")
+            print(f"      En iyi k: {best_k_result['k']}")
+            print(f"      En iyi R²: {best_k_result['r2']:.4f}")
+            print(f"      En iyi RMSE: {best_k_result['rmse']:.4f}")
+            print(f"      En iyi MAE: {best_k_result['mae']:.4f}")
+            
+        else:
+            print(f"    ⚠ KNN k değerleri sonuçları bulunamadı, grafik çizilemedi")
+            
+    except Exception as e:
+        print(f"    ⚠ KNN k değerleri karşılaştırma grafiği çizilemedi: {e}")
+
+
+def plot_feature_importance(importance_df: pd.DataFrame, output_path: Path, top_n: int = 15) -> None:
+    """
+    LR ve KNN permütasyon önemini ve standartlaştırılmış LR katsayılarını çizer ve kaydeder.
+    
+    Args:
+        importance_df: explainability.explain_models çıktısı
+        output_path: PNG dosya yolu
+        top_n: Her panelde gösterilecek en önemli özellik sayısı
+    """
+    # 5. Özellik önemi grafiği (permütasyon önemi ve katsayılar)
+    print(f"  Özellik önemi grafiği çiziliyor...")
+    
+    try:
+        panels = [
+            ('lr_importance', 'lr_importance_std', 'Linear Regression: Permütasyon Önemi', 'R² düşüşü', '#2E86AB'),
+            ('knn_importance', 'knn_importance_std', 'KNN Regressor: Permütasyon Önemi', 'R² düşüşü', '#A23B72'),
+            ('lr_standardized_coef', None, 'Linear Regression: Standartlaştırılmış Katsayılar', 'Katsayı × σ_x / σ_y', '#F18F01'),
+        ]
         
-        # Grafik özelliklerini ayarla
-        plt.title('THYAO Kapanış Fiyatı Trendi ve Hareketli Ortalamalar', fontsize=16, fontweight='bold', pad=20)
-        plt.xlabel('Zaman', fontsize=12, fontweight='bold')
-        plt.ylabel('Fiyat (TL)', fontsize=12, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.legend(fontsize=11, loc='upper left')
+        plt.figure(figsize=(18, 8))
+        for i, (column, error_column, title, xlabel, color) in enumerate(panels, start=1):
+            plt.subplot(1, 3, i)
+            top = importance_df.reindex(importance_df[column].abs().sort_values(ascending=False).index).head(top_n)[::-1]
+            errors = top[error_column] if error_column else None
+            plt.barh(top['feature'], top[column], xerr=errors, color=color, alpha=0.8)
+            plt.axvline(x=0, color='black', linewidth=0.8)
+            plt.title(title, fontsize=12, fontweight='bold')
+            plt.xlabel(xlabel, fontsize=11)
+            plt.yticks(fontsize=8)
+            plt.grid(True, alpha=0.3, axis='x')
         
-        # X ekseni etiketlerini optimize et
-        plt.xticks(rotation=45)
         plt.tight_layout()
         
         # Grafiği kaydet
-        trend_plot_path = DESKTOP_PATH / "THYAO_closing_price_trend.png"
-        plt.savefig(trend_plot_path, dpi=300, bbox_inches='tight', facecolor='white')
+        plt.savefig(output_path, dpi=PLOT_DPI, bbox_inches='tight', facecolor='white')
         
         # Grafiği ekranda göster
         plt.show()
         plt.close()
         
-        print(f"    [OK] Kapanış fiyatı trendi kaydedildi: {trend_plot_path}")
+        print(f"    [OK] Özellik önemi grafiği kaydedildi: {output_path}")
         
-        # 2. Günlük getiri dağılımı (histogram ve normal dağılım analizi)
-        print(f"  Günlük getiri dağılımı çiziliyor...")
+    except Exception as e:
+        print(f"    ⚠ Özellik önemi grafiği çizilemedi: {e}")
+
+
+def main() -> None:
+    """
+    THYAO hisse senedi veri analizi ve makine öğrenmesi ana fonksiyonu.
+    
+    Bu fonksiyon şu adımları gerçekleştirir:
+    1. CSV veri dosyasını yükle
+    2. Tarih sütununu işle ve sırala
+    3. Veri temizleme ve filtreleme
+    4. Teknik göstergeler hesapla
+    5. Model eğitimi ve değerlendirme
+    6. Sonuçları görselleştir ve kaydet
+    """
+    # AŞAMA ÖNBELLEĞİ
+    
+    # Her aşamanın çıktısı girdilerinin ve konfigürasyonunun hash'i ile saklanır;
+    # girdileri değişmeyen aşamalar atlanır ve çıktıları önbellekten yüklenir
+    from artifact_cache import ArtifactCache, write_run_manifest
+    
+    artifact_cache = ArtifactCache(ARTIFACT_CACHE_DIR, ARTIFACT_CACHE_MAX_BYTES, ARTIFACT_CACHE_ENABLED)
+    stage_timings: Dict[str, Dict[str, Any]] = {}
+    
+    # Girdi kaynağı: düz CSV veya arşivdeki hisse üyesi
+    input_source: CsvSource = INPUT_CSV_PATH
+    if INPUT_ARCHIVE_PATH is not None:
+        try:
+            archive_members = list_csv_members(INPUT_ARCHIVE_PATH, [INPUT_CSV_PATH.stem])
+        except FileNotFoundError:
+            print(f"Arşiv bulunamadı: {INPUT_ARCHIVE_PATH}")
+            return
+        if not archive_members:
+            print(f"Arşivde {INPUT_CSV_PATH.stem} üyesi bulunamadı: {INPUT_ARCHIVE_PATH}")
+            return
+        input_source = archive_members[0]
+        print(f"Girdi arşivden okunacak: {input_source}")
+    
+    # Çalıştırma özeti: rapor üretimi için metrikler ve çıktı yolları burada toplanır
+    run_manifest: Dict[str, Any] = {
+        'created': pd.Timestamp.now().isoformat(timespec='seconds'),
+        'input': str(input_source),
+        'outputs': {},
+        'figures': {},
+    }
+    
+    # PARALELLİK AYARI
+    
+    # Ana süreçteki BLAS/OpenMP havuzları süreç x iş parçacığı bütçesiyle sınırlanır;
+    # KNN taramasındaki worker'lar kendi süreçlerinde threads_per_process uygular
+    from execution import ExecutionConfig
+    
+    execution_config = ExecutionConfig(EXECUTION_PROCESSES, EXECUTION_THREADS_PER_PROCESS)
+    execution_config.apply(execution_config.serial_threads)
+    run_manifest['execution'] = execution_config.summary()
+    print(f"Paralellik: {execution_config.processes} süreç x {execution_config.threads_per_process} iş parçacığı "
+          f"(etkin {execution_config.effective_parallelism}, çekirdek {execution_config.cpu_count}, "
+          f"ana süreç {execution_config.serial_threads} iş parçacığı)")
+    if execution_config.oversubscribed:
+        print(f"  ⚠ Süreç x iş parçacığı çekirdek sayısını aşıyor; BLAS/OpenMP aşırı aboneliği yavaşlamaya yol açabilir")
+    
+    # 1-7. VERİ YÜKLEME, TEMİZLEME VE TEKNİK GÖSTERGELER
+    # Arşiv üyeleri için arşivin tamamı yerine üye imzası (CRC, boyut) anahtara girer
+    try:
+        import archive_source
+        import corporate_actions
+        import data_quality
+        import kernels
+        import rolling_stats
+
+        clean_input = input_source.signature() if isinstance(input_source, ArchiveMember) else input_source
+        clean_key = artifact_cache.make_key(
+            'clean', [clean_input],
+            {
+                'rules': VALIDATION_RULES,
+                'indicators': {
+                    'enabled': KERNEL_INDICATORS_ENABLED, 'ema': EMA_SPAN, 'rsi': RSI_WINDOW, 'atr': ATR_WINDOW,
+                },
+                'corporate_actions': {
+                    'enabled': CORPORATE_ACTION_ADJUSTMENT_ENABLED,
+                    'tolerance': CORPORATE_ACTION_TOLERANCE,
+                    'holidays': CORPORATE_ACTION_HOLIDAYS,
+                    'events': CORPORATE_ACTION_EVENTS,
+                },
+            },
+            # Aşamanın çağırdığı tüm yerel modüller: biri değişirse önbellek geçersizleşir
+            code=[load_and_clean_data, corporate_actions, data_quality, rolling_stats, kernels, archive_source],
+        )
+    except FileNotFoundError:
+        print(f"Dosya bulunamadı: {input_source}")
+        return
+    
+    cleaned = artifact_cache.run_stage(
+        'clean', clean_key, lambda: load_and_clean_data(input_source), stage_timings
+    )
+    if cleaned is None:
+        return
+    df, trade_date_col, quality_report = cleaned
+    
+    # Veri kalitesi raporunu kaydet
+    try:
+        from data_quality import write_quality_report
         
-        plt.figure(figsize=(12, 8))
+        write_quality_report(quality_report, DATA_QUALITY_REPORT_PATH)
+        print(f"  [OK] Veri kalitesi raporu kaydedildi: {DATA_QUALITY_REPORT_PATH}")
+        run_manifest['outputs']['data_quality'] = str(DATA_QUALITY_REPORT_PATH)
+    except Exception as e:
+        print(f"  ✗ Veri kalitesi raporu kaydedilemedi: {e}")
+    
+    # Hisse kodunu bul (INSTRUMENT SERIES CODE, yoksa dosya adı)
+    ticker = INPUT_CSV_PATH.stem.upper()
+    for col in df.columns:
+        if col.strip().upper() == "INSTRUMENT SERIES CODE" and df[col].notna().any():
+            ticker = str(df[col].dropna().iloc[0]).strip().upper()
+            break
+    
+    run_manifest['ticker'] = ticker
+    run_manifest['data_quality'] = {
+        key: quality_report[key]
+        for key in ('rows', 'missing_total', 'invalid_rows', 'outlier_rows', 'suspended_rows',
+                    'duplicate_dates', 'date_range')
+        if key in quality_report
+    }
+    run_manifest['data_quality']['clean_rows'] = len(df)
+    if 'corporate_actions' in quality_report:
+        run_manifest['corporate_actions'] = quality_report['corporate_actions']
+
+    # TARİH İNDEKSLİ DEPO
+
+    # Temizlenmiş veri sıralı int64 tarih indeksiyle bellek eşlemli dosyalara yazılır;
+    # tarih aralığı / son N seans / as-of sorguları ikili aramayla kopyasız dilim döndürür.
+    # Temizleme girdisi değişmediyse depo yeniden yazılmaz.
+    try:
+        from date_store import DateIndexedStore, read_store_meta, write_date_store
+
+        store_dir = DATE_STORE_DIR / ticker
+        store_meta = read_store_meta(store_dir)
+        if store_meta is None or store_meta.get('source_key') != clean_key:
+            stored_columns = write_date_store(df, trade_date_col, store_dir, source_key=clean_key)
+            print(f"\nTarih deposu yazıldı: {store_dir} ({len(stored_columns)} sütun)")
+        else:
+            print(f"\nTarih deposu güncel: {store_dir}")
+
+        date_store = DateIndexedStore(store_dir)
+        last_window = date_store.last(20)
+        print(f"  {len(date_store)} seans, {date_store.first_date.date()} - {date_store.last_date.date()}; "
+              f"son 20 seans: {pd.Timestamp(int(last_window.dates[0])).date()} itibarıyla")
+        run_manifest['outputs']['date_store'] = str(store_dir)
+    except Exception as e:
+        print(f"  ✗ Tarih deposu oluşturulamadı: {e}")
+
+    # KESİTSEL ÖZELLİKLER (PİYASA GENELİ)
+
+    # Tüm hisseler tarih x hisse matrislerinde birlikte tutulur; endeks getirileri,
+    # piyasa genişliği, sıralar ve hacim z-skorları tarihe göre hizalanarak eklenir
+    try:
+        market_csv_paths = find_csv_sources(MARKET_DATA_DIR, archives=MARKET_ARCHIVE_PATHS)
+
+        if len(market_csv_paths) > 1:
+            from cross_sectional import MarketPanel, compute_cross_sectional_features
+
+            print(f"\nKesitsel özellikler hesaplanıyor...")
+            market_panel = MarketPanel(MARKET_PANEL_CACHE_PATH)
+            reloaded_tickers = market_panel.update(market_csv_paths, max_workers=ARCHIVE_READ_WORKERS)
+            print(f"  Panel: {len(market_panel.tickers)} hisse, {len(reloaded_tickers)} hisse yeniden okundu")
+
+            cross_features = compute_cross_sectional_features(market_panel, ticker)
+            aligned = cross_features.reindex(df[trade_date_col].to_numpy())
+            for feature in CROSS_SECTIONAL_FEATURES:
+                df[feature] = aligned[feature].to_numpy()
+            print(f"  [OK] {len(CROSS_SECTIONAL_FEATURES)} kesitsel özellik eklendi ({ticker})")
+        else:
+            print(f"\nKesitsel özellikler atlandı: {MARKET_DATA_DIR} içinde birden fazla hisse bulunamadı")
+
+    except Exception as e:
+        print(f"  ✗ Kesitsel özellikler hesaplanırken hata: {e}")
+
+    # ÇOKLU ZAMAN DİLİMİ (HAFTALIK / AYLIK ÇUBUKLAR)
+
+    # Tüm zaman dilimleri günlük OHLCV dizilerinden tek indirgeme geçişiyle üretilir;
+    # önbellekteki tamamlanmış çubuklar yeniden hesaplanmaz, yalnızca sonrası indirgenir
+    multi_timeframe_features: List[str] = []
+    if MULTI_TIMEFRAME_ENABLED:
+        try:
+            from timeframes import compute_multi_timeframe_features
+
+            print(f"\nÇoklu zaman dilimi özellikleri hesaplanıyor ({', '.join(MULTI_TIMEFRAMES)})...")
+            timeframe_features, bars_df, reused_bars = compute_multi_timeframe_features(
+                df, trade_date_col, ticker, MULTI_TIMEFRAMES, MULTI_TIMEFRAME_MA_BARS, BAR_CACHE_DIR,
+            )
+            for feature in timeframe_features.columns:
+                df[feature] = timeframe_features[feature].to_numpy()
+            multi_timeframe_features = list(timeframe_features.columns)
+
+            for name in MULTI_TIMEFRAMES:
+                bars = bars_df[bars_df['timeframe'] == name]
+                print(f"  {name}: {len(bars)} çubuk ({reused_bars[name]} önbellekten, "
+                      f"{int(bars['complete'].sum())} tamamlanmış)")
+            bars_df.to_csv(MULTI_TIMEFRAME_BARS_PATH, index=False, encoding="utf-8-sig")
+            print(f"  [OK] {len(multi_timeframe_features)} çoklu zaman dilimi özelliği eklendi, "
+                  f"çubuklar kaydedildi: {MULTI_TIMEFRAME_BARS_PATH}")
+            run_manifest['multi_timeframe'] = {
+                name: {'bars': int((bars_df['timeframe'] == name).sum()), 'reused': reused_bars[name]}
+                for name in MULTI_TIMEFRAMES
+            }
+            run_manifest['outputs']['bars'] = str(MULTI_TIMEFRAME_BARS_PATH)
+
+        except Exception as e:
+            print(f"  ✗ Çoklu zaman dilimi özellikleri hesaplanırken hata: {e}")
+
+    # Özellik ve hedef değişkenleri ayırma (X, y)
+    try:
+        # Hedef değişkeni bul (closing_price)
+        target_col = None
+        possible_target_names = [
+            'CLOSING PRICE', 'CLOSING SESSION PRICE', 'CLOSE', 'CLOSING', 'CLOSE PRICE', 'LAST', 'LAST PRICE', 'SETTLEMENT', 'SETTLEMENT PRICE'
+        ]
         
-        # Histogram
-        if 'daily_return' in df.columns:
-            # NaN değerleri temizle
-            daily_returns_clean = df['daily_return'].dropna()
+        # Her sütunu kontrol et - CLOSING PRICE öncelikli
+        for col in df.columns:
+            col_upper = col.strip().upper()
             
-            if len(daily_returns_clean) > 0:
-                # Histogram çiz
-                plt.hist(daily_returns_clean, bins=50, alpha=0.7, color='#2E86AB', edgecolor='black', linewidth=0.5)
-                
-                # Normal dağılım eğrisi ekle
-                import numpy as np
-                from scipy import stats
-                
-                # Normal dağılım parametreleri
-                mu = daily_returns_clean.mean()
-                sigma = daily_returns_clean.std()
-                
-                # Normal dağılım eğrisi
-                x = np.linspace(daily_returns_clean.min(), daily_returns_clean.max(), 100)
-                y = stats.norm.pdf(x, mu, sigma) * len(daily_returns_clean) * (daily_returns_clean.max() - daily_returns_clean.min()) / 50
-                
-                plt.plot(x, y, 'r-', linewidth=2, label=f'Normal Dağılım (μ={mu:.4f}, σ={sigma:.4f})')
-                
-                # İstatistik bilgileri
-                plt.axvline(mu, color='red', linestyle='--', alpha=0.8, label=f'Ortalama: {mu:.4f}')
-                plt.axvline(mu + sigma, color='orange', linestyle=':', alpha=0.8, label=f'+1σ: {mu + sigma:.4f}')
-                plt.axvline(mu - sigma, color='orange', linestyle=':', alpha=0.8, label=f'-1σ: {mu - sigma:.4f}')
-                
-                # Grafik özelliklerini ayarla
-                plt.title('THYAO Günlük Getiri Dağılımı', fontsize=16, fontweight='bold', pad=20)
-                plt.xlabel('Günlük Getiri', fontsize=12, fontweight='bold')
-                plt.ylabel('Frekans', fontsize=12, fontweight='bold')
-                plt.grid(True, alpha=0.3)
-                plt.legend(fontsize=11, loc='upper right')
-                
-                # İstatistik bilgilerini ekle
-                stats_text = f'Toplam Gözlem: {len(daily_returns_clean)}\nOrtalama: {mu:.4f}\nStd: {sigma:.4f}\nMin: {daily_returns_clean.min():.4f}\nMax: {daily_returns_clean.max():.4f}'
-                plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, fontsize=10, 
-                        verticalalignment='top', bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8))
-                
-                plt.tight_layout()
-                
-                # Grafiği kaydet
-                histogram_plot_path = DESKTOP_PATH / "THYAO_daily_return_distribution.png"
-                plt.savefig(histogram_plot_path, dpi=300, bbox_inches='tight', facecolor='white')
-                
-                # Grafiği ekranda göster
-                plt.show()
-                plt.close()
-                
-                print(f"    [OK] Günlük getiri dağılımı kaydedildi: {histogram_plot_path}")
-                
-                # İstatistik özeti
-                print(f"    Günlük getiri istatistikleri:")
-                print(f"      Ortalama: {mu:.4f}")
-                print(f"      Standart Sapma: {sigma:.4f}")
-                print(f"      Minimum: {daily_returns_clean.min():.4f}")
-                print(f"      Maksimum: {daily_returns_clean.max():.4f}")
-                print(f"      Toplam gözlem: {len(daily_returns_clean)}")
-            else:
-                print(f"    ⚠ daily_return sütununda veri bulunamadı")
-        else:
-            print(f"    ⚠ daily_return sütunu bulunamadı")
+            # Kapanış fiyatı sütununu bul - tam eşleşme öncelikli
+            if col_upper == 'CLOSING PRICE':
+                target_col = col
+                break
+            elif col_upper == 'CLOSING SESSION PRICE':
+                target_col = col
+                break
+            elif any(close_name in col_upper for close_name in possible_target_names):
+                # GROSS SETTLEMENT gibi yanlış sütunları filtrele
+                if 'SETTLEMENT' not in col_upper or 'CLOSING' in col_upper:
+                    target_col = col
+                    break
         
-        # 3. Gerçek vs. Tahmin grafiği (model performansı)
-        print(f"  Gerçek vs. Tahmin grafiği çiziliyor...")
+        if target_col is None:
+            print(f"Hedef değişken bulunamadı!")
+            return
+        
+        # Hedef değişkeni ayır (y) - yarının kapanış fiyatı
+        y = df[target_col].shift(-1).copy()  # shift(-1) ile yarının değeri
+        
+        # Son günün NaN değerini kaldır (yarın olmadığı için)
+        y = y.dropna()
+        df_aligned = df.iloc[:-1].copy()  # Son gün hariç tüm veri
+        
+        print(f"  [OK] Hedef değişken: yarının {target_col}")
+        print(f"  [OK] Hedef değişken boyutu: {len(y)}")
+        
+        # Özellik değişkenleri ayır (X) - bugünün verileri
+        print(f"  Özellik değişkenleri hazırlanıyor: bugünün verileri...")
+        
+        # Özellik olarak kullanılacak sütunları seç
+        feature_columns = [
+            # Fiyat verileri
+            'OPENING PRICE', 'OPENING SESSION PRICE', 'LOWEST PRICE', 'HIGHEST PRICE', 
+            'CLOSING PRICE', 'CLOSING SESSION PRICE', 'REFERENCE PRICE',
+            
+            # Hacim ve değer verileri
+            'TOTAL TRADED VOLUME', 'TOTAL TRADED VALUE',
+            'TRADED VOLUME AT OPENING SESSION', 'TRADED VALUE AT OPENING SESSION',
+            'TRADED VOLUME AT CLOSING SESSION', 'TRADED VALUE AT CLOSING SESSION',
+            'TRADED VOLUME OF TRADES AT CLOSING PRICE', 'TRADED VALUE OF TRADES AT CLOSING PRICE',
+            
+            # Teknik göstergeler
+            'daily_return', 'pct_change', 'moving_average_5', 'moving_average_20',
+            *([f'ema_{EMA_SPAN}', f'rsi_{RSI_WINDOW}', f'atr_{ATR_WINDOW}'] if KERNEL_INDICATORS_ENABLED else []),
+            
+            # Diğer önemli veriler
+            'CHANGE TO PREVIOUS CLOSING (%)', 'VWAP', 'TOTAL NUMBER OF CONTRACTS',
+            'REMAINING BID', 'REMAINING ASK',
+
+            # Kesitsel (piyasa geneli) özellikler
+            *CROSS_SECTIONAL_FEATURES,
+
+            # Çoklu zaman dilimi (önceki tamamlanmış haftalık/aylık çubuk) özellikleri
+            *multi_timeframe_features,
+        ]
+        
+        # Mevcut sütunlardan özellik sütunlarını bul
+        available_features = []
+        for feature in feature_columns:
+            for col in df.columns:
+                if col.upper() == feature.upper():
+                    available_features.append(col)
+                    break
+        
+        # Özellik verilerini hazırla (X)
+        X = df_aligned[available_features].copy()
+        
+        # NaN değerleri temizle
+        initial_rows = len(X)
+        X = X.dropna()
+        y = y.loc[X.index]  # X ile aynı satırlar (baştaki NaN satırları da hizalanır)
+        
+        print(f"Özellik değişkenleri: {len(available_features)} adet")
+        print(f"Veri boyutu: X={X.shape}, y={y.shape}")
+        
+    except Exception as e:
+        print(f"Özellik/hedef ayrımı sırasında hata oluştu: {e}")
+        return
+
+    # 1. VERİ SETİNİ AYIRMA
+    try:
+        print(f"\n1. VERİ SETİNİ AYIRMA")
         
+        print(f"X → Teknik göstergeler ve özellikler ({len(available_features)} adet)")
+        print(f"y → Close session price (kapanış fiyatı)")
+        print(f"Veri boyutu: X={X.shape}, y={y.shape}")
+        
+        # train_test_split ile veriyi %80 eğitim, %20 test olarak ayır
+        train_size = int(len(X) * 0.8)  # %80 eğitim (NaN satırları atıldıktan sonraki X üzerinden)
+        
+        # Eğitim seti (ilk %80)
+        X_train = X.iloc[:train_size]
+        y_train = y.iloc[:train_size]
+        
+        # Test seti (son %20)
+        X_test = X.iloc[train_size:]
+        y_test = y.iloc[train_size:]
+        
+        print(f"\n  [OK] Veri seti ayrıldı:")
+        print(f"    Eğitim seti: {X_train.shape[0]} kayıt (%80)")
+        print(f"    Test seti: {X_test.shape[0]} kayıt (%20)")
+        print(f"    Toplam: {len(X)} kayıt")
+        
+        # Eğitim ve test setlerini DataFrame olarak kaydet
+        train_df = pd.concat([X_train, y_train], axis=1)
+        test_df = pd.concat([X_test, y_test], axis=1)
+        
+        # Dosya yollarını tanımla
+        train_output_path = DESKTOP_PATH / "THYAO_train.csv"
+        test_output_path = DESKTOP_PATH / "THYAO_test.csv"
+        
+        # Eğitim ve test setlerini kaydet
+        train_df.to_csv(train_output_path, index=False, encoding="utf-8-sig")
+        test_df.to_csv(test_output_path, index=False, encoding="utf-8-sig")
+        
+        print(f"  [OK] Veri setleri kaydedildi:")
+        print(f"    Eğitim: {train_output_path}")
+        print(f"    Test: {test_output_path}")
+        
+    except Exception as e:
+        print(f"Veri bölme sırasında hata oluştu: {e}")
+        return
+
+    # ÖZELLİK SEÇİMİ
+
+    # Korelasyon, VIF ve ortak bilgi tek matris geçişinde hesaplanır; eleme kararı
+    # yalnızca eğitim verisine göre verilir ve önbelleğe alınır
+    if FEATURE_SELECTION_ENABLED:
         try:
-            # Model tahminlerini al (eğer mevcut ise)
-            if 'lr_test_pred' in locals() and 'knn_test_pred' in locals():
-                plt.figure(figsize=(14, 10))
-                
-                # Alt grafik 1: Linear Regression
-                plt.subplot(2, 1, 1)
-                plt.scatter(y_test, lr_test_pred, alpha=0.6, color='#2E86AB', s=50)
-                
-                # Mükemmel tahmin çizgisi (y=x)
-                min_val = min(y_test.min(), lr_test_pred.min())
-                max_val = max(y_test.max(), lr_test_pred.max())
-                plt.plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='Mükemmel Tahmin (y=x)')
-                
-                plt.title('Linear Regression: Gerçek vs. Tahmin', fontsize=14, fontweight='bold')
-                plt.xlabel('Gerçek Kapanış Fiyatı (TL)', fontsize=12)
-                plt.ylabel('Tahmin Edilen Fiyat (TL)', fontsize=12)
-                plt.grid(True, alpha=0.3)
-                plt.legend()
-                
-                # R² değerini ekle
-                plt.text(0.05, 0.95, f'R² = {lr_test_r2:.4f}', transform=plt.gca().transAxes, 
-                        fontsize=12, bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8))
-                
-                # Alt grafik 2: KNN Regressor
-                plt.subplot(2, 1, 2)
-                plt.scatter(y_test, knn_test_pred, alpha=0.6, color='#A23B72', s=50)
-                
-                # Mükemmel tahmin çizgisi (y=x)
-                plt.plot([min_val, max_val], [min_val, max_val], 'r--', linewidth=2, label='Mükemmel Tahmin (y=x)')
-                
-                plt.title('KNN Regressor: Gerçek vs. Tahmin', fontsize=14, fontweight='bold')
-                plt.xlabel('Gerçek Kapanış Fiyatı (TL)', fontsize=12)
-                plt.ylabel('Tahmin Edilen Fiyat (TL)', fontsize=12)
-                plt.grid(True, alpha=0.3)
-                plt.legend()
-                
-                # R² değerini ekle
-                plt.text(0.05, 0.95, f'R² = {knn_test_r2:.4f}', transform=plt.gca().transAxes, 
-                        fontsize=12, bbox=dict(boxstyle='round', facecolor='lightpink', alpha=0.8))
-                
-                plt.tight_layout()
-                
-                # Grafiği kaydet
-                prediction_plot_path = DESKTOP_PATH / "THYAO_real_vs_prediction.png"
-                plt.savefig(prediction_plot_path, dpi=300, bbox_inches='tight', facecolor='white')
-                
-                # Grafiği ekranda göster
-                plt.show()
-                plt.close()
-                
-                print(f"    [OK] Gerçek vs. Tahmin grafiği kaydedildi: {prediction_plot_path}")
-                
-                # Model performans özeti
-                print(f"    Model performans özeti:")
-                print(f"      Linear Regression: R²={lr_test_r2:.4f}, RMSE={lr_test_rmse:.4f}, MAE={lr_test_mae:.4f}")
-                print(f"      KNN Regressor: R²={knn_test_r2:.4f}, RMSE={knn_test_rmse:.4f}, MAE={knn_test_mae:.4f}")
-                
-            else:
-                print(f"    ⚠ Model tahminleri bulunamadı, grafik çizilemedi")
-                
+            import feature_selection
+            from feature_selection import select_features
+
+            print(f"\nÖZELLİK SEÇİMİ")
+            selection_config = {
+                'correlation_threshold': FEATURE_CORRELATION_THRESHOLD,
+                'vif_threshold': FEATURE_VIF_THRESHOLD,
+                'mi_bins': FEATURE_MI_BINS,
+            }
+            selection_key = artifact_cache.make_key(
+                'feature_selection', [X_train, y_train], selection_config, code=[feature_selection]
+            )
+            selected_features, selection_report = artifact_cache.run_stage(
+                'feature_selection', selection_key,
+                lambda: select_features(
+                    X_train, y_train, FEATURE_CORRELATION_THRESHOLD, FEATURE_VIF_THRESHOLD, FEATURE_MI_BINS
+                ),
+                stage_timings,
+            )
+
+            dropped = selection_report[selection_report['dropped'] != '']
+            for _, row in dropped.iterrows():
+                detail = f" ({row['corr_with']})" if row['corr_with'] else ""
+                print(f"  - {row['column']}: {row['dropped']}{detail}")
+            print(f"  [OK] {len(available_features)} özellikten {len(selected_features)} tanesi tutuldu")
+
+            selection_report.to_csv(FEATURE_SELECTION_REPORT_PATH, index=False, encoding="utf-8-sig")
+            run_manifest['feature_selection'] = {
+                'selected': selected_features,
+                'dropped': dict(zip(dropped['column'], dropped['dropped'])),
+            }
+            run_manifest['outputs']['feature_selection'] = str(FEATURE_SELECTION_REPORT_PATH)
+
+            available_features = selected_features
+            X = X[selected_features]
+            X_train = X_train[selected_features]
+            X_test = X_test[selected_features]
+
         except Exception as e:
-            print(f"    ⚠ Gerçek vs. Tahmin grafiği çizilemedi: {e}")
-        
-        # 4. KNN k değerleri karşılaştırma grafiği
-        print(f"  KNN k değerleri karşılaştırma grafiği çiziliyor...")
+            print(f"  ✗ Özellik seçimi sırasında hata, tüm özellikler kullanılacak: {e}")
+
+    # 8-11. MODEL EĞİTİMİ VE DEĞERLENDİRME
+    # Ensemble'ın OOF tahminleri de bu aşamada üretilip aynı artefaktta önbelleğe alınır
+    import ensemble
+    import shared_matrices
+
+    model_key = artifact_cache.make_key(
+        'models', [X_train, y_train, X_test, y_test], {'k_values': KNN_K_VALUES, 'oof_splits': ENSEMBLE_OOF_SPLITS},
+        code=[train_and_evaluate_models, shared_matrices, ensemble.compute_oof_predictions],
+    )
+    model_outputs = artifact_cache.run_stage(
+        'models', model_key,
+        lambda: train_and_evaluate_models(
+            X_train, y_train, X_test, y_test, execution_config.processes, execution_config.threads_per_process,
+            ENSEMBLE_OOF_SPLITS,
+        ),
+        stage_timings,
+    )
+    
+    if model_outputs is not None:
+        lr_test_pred = model_outputs['lr_test_pred']
+        knn_test_pred = model_outputs['knn_test_pred']
+        all_results = model_outputs['all_results']
+        best_result = model_outputs['best_result']
+        if stage_timings['models']['cache_hit']:
+            print(f"  En iyi model: {best_result['model']} (R²: {best_result['test_r2']:.4f})")
+        
+        run_manifest['split'] = {'train_rows': len(X_train), 'test_rows': len(X_test), 'features': len(X_train.columns)}
+        run_manifest['metrics'] = [
+            {key: value for key, value in result.items() if key != 'knn_results_list'} for result in all_results
+        ]
+        run_manifest['knn_k_results'] = model_outputs['knn_results_list']
+        run_manifest['best_model'] = best_result['model']
+        run_manifest['outputs']['train'] = str(train_output_path)
+        run_manifest['outputs']['test'] = str(test_output_path)
         
+        # Tahmin sunucusu için model paketi: modeller + son gün dahil tüm özellik satırları
         try:
-            # KNN k değerleri sonuçlarını al (eğer mevcut ise)
-            if 'knn_results_list' in locals() and len(knn_results_list) > 0:
-                plt.figure(figsize=(14, 10))
-                
-                # Alt grafik 1: R² skorları
-                plt.subplot(2, 2, 1)
-                k_values = [result['k'] for result in knn_results_list]
-                r2_scores = [result['r2'] for result in knn_results_list]
-                
-                plt.plot(k_values, r2_scores, 'o-', linewidth=2, markersize=8, color='#A23B72')
-                plt.axhline(y=0, color='red', linestyle='--', alpha=0.7, label='R² = 0 (Random)')
-                
-                # En iyi k değerini işaretle
-                best_k_result = max(knn_results_list, key=lambda x: x['r2'])
-                plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2, 
-                           label=f'En iyi k = {best_k_result["k"]}')
-                
-                plt.title('KNN: k Değerine Göre R² Skoru', fontsize=14, fontweight='bold')
-                plt.xlabel('k (n_neighbors)', fontsize=12)
-                plt.ylabel('R² Skoru', fontsize=12)
-                plt.grid(True, alpha=0.3)
-                plt.legend()
-                
-                # Alt grafik 2: RMSE skorları
-                plt.subplot(2, 2, 2)
-                rmse_scores = [result['rmse'] for result in knn_results_list]
-                
-                plt.plot(k_values, rmse_scores, 's-', linewidth=2, markersize=8, color='#F18F01')
-                plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2)
-                
-                plt.title('KNN: k Değerine Göre RMSE', fontsize=14, fontweight='bold')
-                plt.xlabel('k (n_neighbors)', fontsize=12)
-                plt.ylabel('RMSE', fontsize=12)
-                plt.grid(True, alpha=0.3)
-                
-                # Alt grafik 3: MAE skorları
-                plt.subplot(2, 2, 3)
-                mae_scores = [result['mae'] for result in knn_results_list]
-                
-                plt.plot(k_values, mae_scores, '^-', linewidth=2, markersize=8, color='#2E86AB')
-                plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2)
-                
-                plt.title('KNN: k Değerine Göre MAE', fontsize=14, fontweight='bold')
-                plt.xlabel('k (n_neighbors)', fontsize=12)
-                plt.ylabel('MAE', fontsize=12)
-                plt.grid(True, alpha=0.3)
-                
-                # Alt grafik 4: Tüm metrikler karşılaştırması
-                plt.subplot(2, 2, 4)
-                
-                # Metrikleri normalize et (0-1 arasına)
-                r2_norm = [(r2 - min(r2_scores)) / (max(r2_scores) - min(r2_scores)) for r2 in r2_scores]
-                rmse_norm = [(rmse - min(rmse_scores)) / (max(rmse_scores) - min(rmse_scores)) for rmse in rmse_scores]
-                mae_norm = [(mae - min(mae_scores)) / (max(mae_scores) - min(mae_scores)) for mae in mae_scores]
-                
-                plt.plot(k_values, r2_norm, 'o-', linewidth=2, markersize=8, color='#A23B72', label='R² (normalize)')
-                plt.plot(k_values, rmse_norm, 's-', linewidth=2, markersize=8, color='#F18F01', label='RMSE (normalize)')
-                plt.plot(k_values, mae_norm, '^-', linewidth=2, markersize=8, color='#2E86AB', label='MAE (normalize)')
-                plt.axvline(x=best_k_result['k'], color='green', linestyle=':', linewidth=2)
-                
-                plt.title('KNN: Tüm Metrikler Karşılaştırması', fontsize=14, fontweight='bold')
-                plt.xlabel('k (n_neighbors)', fontsize=12)
-                plt.ylabel('Normalize Edilmiş Skorlar', fontsize=12)
-                plt.grid(True, alpha=0.3)
-                plt.legend()
-                
-                plt.tight_layout()
-                
-                # Grafiği kaydet
-                knn_comparison_plot_path = DESKTOP_PATH / "THYAO_knn_k_comparison.png"
-                plt.savefig(knn_comparison_plot_path, dpi=300, bbox_inches='tight', facecolor='white')
-                
-                # Grafiği ekranda göster
-                plt.show()
-                plt.close()
-                
-                print(f"    [OK] KNN k değerleri karşılaştırma grafiği kaydedildi: {knn_comparison_plot_path}")
-                
-                # K değerleri özeti
-                print(f"    K değerleri özeti:")
-                print(f"      En iyi k: {best_k_result['k']}")
-                print(f"      En iyi R²: {best_k_result['r2']:.4f}")
-                print(f"      En iyi RMSE: {best_k_result['rmse']:.4f}")
-                print(f"      En iyi MAE: {best_k_result['mae']:.4f}")
-                
+            from prediction_server import save_model_bundle
+            
+            serving_rows = df[available_features].notna().all(axis=1)
+            serving_features = df.loc[serving_rows, available_features]
+            serving_features.index = pd.DatetimeIndex(df.loc[serving_rows, trade_date_col])
+            closing_prices = pd.Series(df.loc[serving_rows, target_col].to_numpy(), index=serving_features.index)
+            
+            bundle_path = MODEL_BUNDLE_DIR / f"{ticker}_model_bundle.pkl"
+            save_model_bundle(
+                bundle_path, ticker, model_outputs['lr_model'], model_outputs['knn_model'],
+                serving_features, closing_prices,
+            )
+            run_manifest['outputs']['model_bundle'] = str(bundle_path)
+            print(f"  [OK] Model paketi kaydedildi: {bundle_path}")
+        except Exception as e:
+            print(f"  ✗ Model paketi kaydedilemedi: {e}")
+
+    # AÇIKLANABİLİRLİK (PERMÜTASYON ÖNEMİ)
+
+    # LR tahminleri doğrusal güncellemeyle, KNN tahminleri bir kez hesaplanan
+    # test x eğitim uzaklık matrisinden yeniden bulunur; modeller yeniden
+    # eğitilmez. Özellikler süreç havuzunda paylaşılan matrislerle dağıtılır.
+    importance_df = None
+    if model_outputs is not None and EXPLAINABILITY_ENABLED:
+        try:
+            import explainability
+            from explainability import explain_models
+
+            print(f"\nAÇIKLANABİLİRLİK (PERMÜTASYON ÖNEMİ)")
+
+            best_k = model_outputs['knn_results']['best_k']
+            importance_key = artifact_cache.make_key(
+                'feature_importance', [model_key], {'repeats': PERMUTATION_REPEATS, 'best_k': best_k},
+                code=[explainability, shared_matrices],
+            )
+            importance_df = artifact_cache.run_stage(
+                'feature_importance', importance_key,
+                lambda: explain_models(
+                    X_train, y_train, X_test, y_test, model_outputs['lr_model'], best_k, PERMUTATION_REPEATS,
+                    execution_config.processes, execution_config.threads_per_process,
+                ),
+                stage_timings,
+            )
+
+            print(f"    {'Özellik':<42} {'LR önemi':<10} {'KNN önemi':<10} {'Std. katsayı':<12}")
+            print(f"    {'-'*76}")
+            for _, row in importance_df.head(10).iterrows():
+                print(f"    {row['feature'][:41]:<42} {row['lr_importance']:<10.4f} {row['knn_importance']:<10.4f} "
+                      f"{row['lr_standardized_coef']:<12.4f}")
+
+            importance_df.to_csv(FEATURE_IMPORTANCE_OUTPUT_PATH, index=False, encoding="utf-8-sig")
+            print(f"  [OK] Özellik önemi kaydedildi: {FEATURE_IMPORTANCE_OUTPUT_PATH}")
+            run_manifest['feature_importance'] = importance_df.to_dict(orient='records')
+            run_manifest['outputs']['feature_importance'] = str(FEATURE_IMPORTANCE_OUTPUT_PATH)
+
+        except Exception as e:
+            print(f"  ✗ Özellik önemi hesaplanırken hata: {e}")
+
+    # TAHMİN ARALIKLARI
+
+    # LR bootstrap tekrarları tek matris çarpımıyla, KNN tekrarları test günlerinin
+    # komşu hedef kümelerinden üretilir; parçalar iş parçacıklarında paralel çalışır
+    if model_outputs is not None and PREDICTION_INTERVALS_ENABLED:
+        try:
+            import prediction_intervals
+            from prediction_intervals import compute_prediction_intervals
+
+            print(f"\nTAHMİN ARALIKLARI (%{PREDICTION_INTERVAL_LEVEL * 100:.0f})")
+
+            best_k = model_outputs['knn_results']['best_k']
+            interval_config = {
+                'level': PREDICTION_INTERVAL_LEVEL, 'replicates': BOOTSTRAP_REPLICATES, 'best_k': best_k,
+            }
+            interval_key = artifact_cache.make_key(
+                'prediction_intervals', [X_train, y_train, X_test, y_test], interval_config,
+                code=[prediction_intervals],
+            )
+            coverage_df, intervals_df = artifact_cache.run_stage(
+                'prediction_intervals', interval_key,
+                lambda: compute_prediction_intervals(
+                    X_train, y_train, X_test, y_test, best_k, PREDICTION_INTERVAL_LEVEL, BOOTSTRAP_REPLICATES,
+                    max_workers=execution_config.serial_threads,
+                ),
+                stage_timings,
+            )
+
+            print(f"    {'Model':<20} {'Yöntem':<11} {'Kapsama':<9} {'Ort. genişlik':<14} {'Medyan gen.':<12} {'Süre (sn)':<10}")
+            print(f"    {'-'*78}")
+            for _, row in coverage_df.iterrows():
+                print(f"    {row['model']:<20} {row['method']:<11} {row['coverage']:<9.2%} "
+                      f"{row['mean_width']:<14.4f} {row['median_width']:<12.4f} {row['seconds']:<10.4f}")
+
+            coverage_df.to_csv(PREDICTION_INTERVAL_COVERAGE_PATH, index=False, encoding="utf-8-sig")
+            intervals_df.assign(date=df.loc[intervals_df.index, trade_date_col].to_numpy()).to_csv(
+                PREDICTION_INTERVALS_PATH, index=False, encoding="utf-8-sig"
+            )
+            print(f"  [OK] Tahmin aralıkları kaydedildi: {PREDICTION_INTERVALS_PATH}")
+            run_manifest['prediction_intervals'] = coverage_df.to_dict(orient='records')
+            run_manifest['outputs']['interval_coverage'] = str(PREDICTION_INTERVAL_COVERAGE_PATH)
+            run_manifest['outputs']['prediction_intervals'] = str(PREDICTION_INTERVALS_PATH)
+
+        except Exception as e:
+            print(f"  ✗ Tahmin aralıkları hesaplanırken hata: {e}")
+
+    # KAYMA İZLEME
+
+    # İzleyici eğitim özellikleriyle kurulur; test günleri sırayla "yeni gün" olarak
+    # akıtılır (gün başına sabit maliyetli güncelleme). Kaydedilen izleyici günlük
+    # işlerde yüklenip yeni satırlarla güncellenmeye devam edebilir.
+    if model_outputs is not None and DRIFT_MONITOR_ENABLED:
+        try:
+            import drift_monitor as drift_monitor_module
+            from drift_monitor import DriftMonitor
+
+            print(f"\nKAYMA İZLEME (pencere: {DRIFT_WINDOW} gün, PSI eşiği: {DRIFT_PSI_THRESHOLD})")
+
+            def monitor_test_days() -> Tuple[Any, pd.DataFrame]:
+                monitor = DriftMonitor(DRIFT_BINS, DRIFT_WINDOW, DRIFT_PSI_THRESHOLD, DRIFT_MIN_ROWS).fit(X_train)
+                return monitor, monitor.update_many(X_test)
+
+            drift_config = {
+                'bins': DRIFT_BINS, 'window': DRIFT_WINDOW, 'psi_threshold': DRIFT_PSI_THRESHOLD,
+                'min_rows': DRIFT_MIN_ROWS,
+            }
+            drift_key = artifact_cache.make_key(
+                'drift_monitor', [X_train, X_test], drift_config, code=[drift_monitor_module],
+            )
+            drift_monitor, drift_history = artifact_cache.run_stage(
+                'drift_monitor', drift_key, monitor_test_days, stage_timings,
+            )
+            drift_df = drift_monitor.status()
+
+            drifted = drift_df[drift_df['drifted']]
+            print(f"  İzlenen gün: {drift_monitor.rows_seen}, kayan özellik: {len(drifted)}/{len(drift_df)}")
+            if not drifted.empty:
+                print(f"    {'Özellik':<28} {'PSI':<8} {'KS':<8} {'KS kritik':<10} {'Ort. kayma (σ)':<14}")
+                print(f"    {'-'*70}")
+                for _, row in drifted.head(10).iterrows():
+                    print(f"    {row['feature']:<28} {row['psi']:<8.3f} {row['ks']:<8.3f} "
+                          f"{row['ks_critical']:<10.3f} {row['mean_shift_std']:<14.2f}")
+            if drift_monitor.retrain_needed:
+                first_flag = drift_history.index[drift_history['retrain']][0]
+                print(f"  ⚠ Yeniden eğitim önerilir (ilk uyarı: {df.loc[first_flag, trade_date_col]})")
             else:
-                print(f"    ⚠ KNN k değerleri sonuçları bulunamadı, grafik çizilemedi")
-                
+                print("  [OK] Belirgin dağılım kayması yok")
+
+            drift_df.to_csv(DRIFT_REPORT_PATH, index=False, encoding="utf-8-sig")
+            drift_monitor.save(DRIFT_MONITOR_PATH)
+            print(f"  [OK] Kayma raporu kaydedildi: {DRIFT_REPORT_PATH}")
+            run_manifest['drift'] = {
+                'rows_monitored': drift_monitor.rows_seen,
+                'window': DRIFT_WINDOW,
+                'psi_threshold': DRIFT_PSI_THRESHOLD,
+                'retrain_needed': drift_monitor.retrain_needed,
+                'drifted_features': drifted['feature'].tolist(),
+                'features': drift_df.to_dict(orient='records'),
+            }
+            run_manifest['outputs']['drift_report'] = str(DRIFT_REPORT_PATH)
+            run_manifest['outputs']['drift_monitor'] = str(DRIFT_MONITOR_PATH)
+
+        except Exception as e:
+            print(f"  ✗ Kayma izleme sırasında hata: {e}")
+
+    # AĞAÇ TABANLI MODELLER (MODEL KAYIT DEFTERİ)
+
+    # HistGradientBoosting ve Random Forest çok çekirdekli eğitilir; erken durdurma
+    # eğitim setinin zaman sıralı son dilimiyle yapılır. Mevcut LR/KNN ile aynı
+    # iş parçacığı ayarında eğitim süreleri karşılaştırılır.
+    if model_outputs is not None and EXTRA_MODEL_FAMILIES:
+        try:
+            import model_registry
+            from model_registry import train_registered_models
+
+            print(f"\nAĞAÇ TABANLI MODELLER")
+
+            best_k = model_outputs['knn_results']['best_k']
+            benchmark_keys = ['linear_regression', 'knn', *EXTRA_MODEL_FAMILIES]
+            registry_config = {
+                'models': benchmark_keys, 'n_jobs': execution_config.serial_threads, 'best_k': best_k,
+                'validation_fraction': EARLY_STOPPING_VALIDATION_FRACTION, 'patience': EARLY_STOPPING_PATIENCE,
+            }
+            registry_key = artifact_cache.make_key(
+                'model_registry', [X_train, y_train, X_test, y_test], registry_config, code=[model_registry]
+            )
+            benchmark_df, registry_models, registry_predictions = artifact_cache.run_stage(
+                'model_registry', registry_key,
+                lambda: train_registered_models(
+                    benchmark_keys, X_train, y_train, X_test, y_test, execution_config.serial_threads,
+                    validation_fraction=EARLY_STOPPING_VALIDATION_FRACTION,
+                    patience=EARLY_STOPPING_PATIENCE,
+                    params={'knn': {'n_neighbors': best_k}},
+                ),
+                stage_timings,
+            )
+
+            print(f"    {'Model':<22} {'n_jobs':<7} {'Fit (sn)':<10} {'Boyut':<7} {'R²':<10} {'RMSE':<10}")
+            print(f"    {'-'*66}")
+            for _, row in benchmark_df.iterrows():
+                size = '-' if pd.isna(row['best_size']) else int(row['best_size'])
+                print(f"    {row['model']:<22} {row['n_jobs']:<7} {row['fit_seconds']:<10.4f} {size!s:<7} "
+                      f"{row['test_r2']:<10.4f} {row['test_rmse']:<10.4f}")
+
+            benchmark_df.to_csv(MODEL_BENCHMARK_OUTPUT_PATH, index=False, encoding="utf-8-sig")
+            print(f"  [OK] Model karşılaştırması kaydedildi: {MODEL_BENCHMARK_OUTPUT_PATH}")
+
+            # Ağaç tabanlı modeller en iyi model seçimine dahil edilir
+            for _, row in benchmark_df[benchmark_df['best_size'].notna()].iterrows():
+                all_results.append({
+                    'model': row['model'],
+                    **{metric: row[metric] for metric in ('test_mse', 'test_rmse', 'test_mae', 'test_r2')},
+                })
+            best_result = max(all_results, key=lambda x: x['test_r2'])
+            print(f"  En iyi model (tüm aileler): {best_result['model']} (R²: {best_result['test_r2']:.4f})")
+
+            run_manifest['metrics'] = [
+                {key: value for key, value in result.items() if key != 'knn_results_list'} for result in all_results
+            ]
+            run_manifest['best_model'] = best_result['model']
+            run_manifest['model_benchmark'] = benchmark_df.to_dict(orient='records')
+            run_manifest['outputs']['model_benchmark'] = str(MODEL_BENCHMARK_OUTPUT_PATH)
+
         except Exception as e:
-            print(f"    ⚠ KNN k değerleri karşılaştırma grafiği çizilemedi: {e}")
+            print(f"  ✗ Ağaç tabanlı modeller eğitilirken hata: {e}")
+
+    # ENSEMBLE (MODEL BİRLEŞTİRME)
+
+    # Temel modellerin zaman sıralı OOF tahminleri model aşamasının artefaktından okunur
+    # (modeller yeniden eğitilmez); birleştirme, Ridge stacking ve rejim bazlı ağırlıklar
+    # yalnızca meta-fit maliyetindedir
+    if model_outputs is not None and model_outputs.get('oof_predictions') is not None:
+        try:
+            from ensemble import assign_regimes, run_ensembles
+
+            print(f"\nENSEMBLE (MODEL BİRLEŞTİRME)")
+
+            oof = model_outputs['oof_predictions']
+
+            # Volatilite rejimi: geçmiş günlerin getiri std'si, eşik eğitim medyanı
+            if 'daily_return' in df.columns:
+                volatility = (
+                    df['daily_return'].rolling(ENSEMBLE_REGIME_WINDOW, min_periods=2).std().loc[X.index].to_numpy()
+                )
+            else:
+                volatility = np.zeros(len(X))
+            regime_threshold = float(np.nanmedian(volatility[:len(X_train)]))
+            regimes = assign_regimes(volatility, regime_threshold)
+
+            test_predictions = pd.DataFrame(
+                {'Linear Regression': lr_test_pred, 'KNN Regressor': knn_test_pred}, index=X_test.index
+            )
+            ensemble_key = artifact_cache.make_key(
+                'ensemble', [oof, y_train, test_predictions, y_test, regimes],
+                {'ridge_alpha': ENSEMBLE_RIDGE_ALPHA, 'train_rows': len(X_train)},
+                code=[ensemble],
+            )
+            ensemble_report, ensemble_predictions, ensemble_weights = artifact_cache.run_stage(
+                'ensemble', ensemble_key,
+                lambda: run_ensembles(
+                    oof, y_train, test_predictions, y_test,
+                    regimes[:len(X_train)], regimes[len(X_train):], ENSEMBLE_RIDGE_ALPHA,
+                ),
+                stage_timings,
+            )
+
+            print(f"  OOF: {int(oof.notna().all(axis=1).sum())}/{len(oof)} eğitim satırı, {ENSEMBLE_OOF_SPLITS} katlama")
+            print(f"    {'Model':<25} {'R²':<10} {'RMSE':<10} {'MAE':<10}")
+            print(f"    {'-'*55}")
+            for _, row in ensemble_report.iterrows():
+                print(f"    {row['model']:<25} {row['r2']:<10.4f} {row['rmse']:<10.4f} {row['mae']:<10.4f}")
+
+            ensemble_report.to_csv(ENSEMBLE_OUTPUT_PATH, index=False, encoding="utf-8-sig")
+            print(f"  [OK] Ensemble metrikleri kaydedildi: {ENSEMBLE_OUTPUT_PATH}")
+            run_manifest['ensemble'] = ensemble_report.to_dict(orient='records')
+            run_manifest['ensemble_weights'] = ensemble_weights
+            run_manifest['outputs']['ensemble'] = str(ENSEMBLE_OUTPUT_PATH)
+
+        except Exception as e:
+            print(f"  ✗ Ensemble sırasında hata: {e}")
+
+    # ÇOKLU UFUK TAHMİNİ
+
+    # Tüm ufuklar için hedef matrisi tek geçişte oluşturulur; LR tek çözümle,
+    # KNN tek komşu sorgusuyla tüm ufukları tahmin eder
+    if MULTI_HORIZON_MODE:
+        try:
+            import multi_horizon
+            from multi_horizon import build_horizon_targets, run_multi_horizon
+
+            print(f"\nÇOKLU UFUK TAHMİNİ")
+            print(f"  Ufuklar: {FORECAST_HORIZONS} gün")
+
+            # Hedef matrisi ve özellikleri hizala (geleceği olmayan son günler atılır)
+            Y_horizons = build_horizon_targets(df[target_col], FORECAST_HORIZONS)
+            Y_horizons = Y_horizons.loc[X.index].dropna()
+            X_horizons = X.loc[Y_horizons.index]
+
+            # Kronolojik %80 eğitim, %20 test
+            mh_train_size = int(len(X_horizons) * 0.8)
+            mh_key = artifact_cache.make_key(
+                'multi_horizon', [X_horizons, Y_horizons],
+                {'horizons': FORECAST_HORIZONS, 'k_values': KNN_K_VALUES, 'train_size': mh_train_size},
+                code=[multi_horizon],
+            )
+            mh_report, mh_predictions, mh_best_k = artifact_cache.run_stage(
+                'multi_horizon', mh_key,
+                lambda: run_multi_horizon(
+                    X_horizons.iloc[:mh_train_size],
+                    Y_horizons.iloc[:mh_train_size],
+                    X_horizons.iloc[mh_train_size:],
+                    Y_horizons.iloc[mh_train_size:],
+                    FORECAST_HORIZONS,
+                    KNN_K_VALUES,
+                ),
+                stage_timings,
+            )
+
+            print(f"    {'Model':<25} {'Ufuk':<6} {'R²':<10} {'RMSE':<10} {'MAE':<10}")
+            print(f"    {'-'*61}")
+            for _, row in mh_report.iterrows():
+                print(f"    {row['model']:<25} {row['horizon']:<6} {row['r2']:<10.4f} {row['rmse']:<10.4f} {row['mae']:<10.4f}")
+
+            mh_report.to_csv(MULTI_HORIZON_OUTPUT_PATH, index=False, encoding="utf-8-sig")
+            print(f"  [OK] Çoklu ufuk metrikleri kaydedildi: {MULTI_HORIZON_OUTPUT_PATH}")
+            run_manifest['multi_horizon'] = mh_report.to_dict(orient='records')
+            run_manifest['outputs']['multi_horizon'] = str(MULTI_HORIZON_OUTPUT_PATH)
+
+        except Exception as e:
+            print(f"  ✗ Çoklu ufuk tahmini sırasında hata: {e}")
+
+    # BACKTEST (AL-SAT SİMÜLASYONU)
+
+    # Model tahminlerini long/flat/short sinyallerine çevir ve tüm eşik/maliyet
+    # kombinasyonlarını test penceresinde vektörel olarak simüle et
+    try:
+        if model_outputs is not None:
+            import backtest
+            from backtest import build_config_grid, run_model_backtests
+
+            print(f"\nBACKTEST (AL-SAT SİMÜLASYONU)")
+
+            config_grid = build_config_grid(
+                BACKTEST_LONG_THRESHOLDS, BACKTEST_SHORT_THRESHOLDS,
+                BACKTEST_COST_BPS, BACKTEST_SLIPPAGE_BPS,
+            )
+            print(f"  {len(config_grid)} konfigürasyon x {len(X_test)} gün simüle ediliyor...")
+
+            model_predictions = {'Linear Regression': lr_test_pred, 'KNN Regressor': knn_test_pred}
+            current_prices = df.loc[X_test.index, target_col].to_numpy()
+            backtest_key = artifact_cache.make_key(
+                'backtest', [model_predictions, current_prices, y_test.to_numpy(), config_grid],
+                code=[backtest],
+            )
+            backtest_df = artifact_cache.run_stage(
+                'backtest', backtest_key,
+                lambda: run_model_backtests(model_predictions, current_prices, y_test.to_numpy(), config_grid),
+                stage_timings,
+            )
+
+            backtest_best = backtest_df.loc[backtest_df.groupby('model', sort=False)['sharpe'].idxmax()]
+            for _, best_row in backtest_best.iterrows():
+                model_name = best_row['model']
+                print(f"  {model_name} - en iyi Sharpe konfigürasyonu:")
+                print(f"    Long eşiği: {best_row['long_threshold']:.4f}, Short eşiği: {best_row['short_threshold']:.4f}")
+                print(f"    Maliyet: {best_row['cost_bps']:.1f} bp, Kayma: {best_row['slippage_bps']:.1f} bp")
+                print(f"    Toplam getiri: {best_row['total_return']:.4f}, Sharpe: {best_row['sharpe']:.4f}")
+                print(f"    Maks. düşüş: {best_row['max_drawdown']:.4f}, İsabet oranı: {best_row['hit_rate']:.4f}")
+
+            backtest_df.to_csv(BACKTEST_OUTPUT_PATH, index=False, encoding="utf-8-sig")
+            print(f"  [OK] Backtest sonuçları kaydedildi: {BACKTEST_OUTPUT_PATH}")
+            run_manifest['backtest_best'] = backtest_best.to_dict(orient='records')
+            run_manifest['outputs']['backtest'] = str(BACKTEST_OUTPUT_PATH)
+        else:
+            print(f"  [UYARI] Model tahminleri bulunamadı, backtest yapılamadı")
+
+    except Exception as e:
+        print(f"  ✗ Backtest sırasında hata: {e}")
+
+    # YORUM: Grafikleri oluştur ve kaydet
+    try:
+        import plot_decimation
+
+        print(f"\nGrafikler oluşturuluyor...")
+        
+        # Türkçe karakter desteği için font ayarı
+        plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'SimHei']
         
+        # Grafik stilini ayarla
+        plot_config = {
+            'style': 'seaborn-v0_8', 'palette': 'husl', 'dpi': PLOT_DPI,
+            'decimation': PLOT_DECIMATION_METHOD, 'hexbin_min_points': PLOT_HEXBIN_MIN_POINTS,
+        }
+        plt.style.use(plot_config['style'])
+        sns.set_palette(plot_config['palette'])
 
+        figure_paths: Dict[str, str] = run_manifest['figures']
+        
+        # 10. GÖRSELLEŞTİRME VE GRAFİK OLUŞTURMA
+        # Her grafik kendi verisi ve çizim kodu ile anahtarlanır; değişmeyen
+        # grafikler yeniden çizilmez, önbellekteki PNG kopyalanır
+        
+        # 1. Kapanış fiyatı trendi (zaman serisi grafiği)
+        trend_plot_path = DESKTOP_PATH / "THYAO_closing_price_trend.png"
+        trend_columns = [c for c in [target_col, 'moving_average_5', 'moving_average_20'] if c in df.columns]
+        trend_key = artifact_cache.make_key(
+            'closing_price_trend', [df[trend_columns]], plot_config,
+            code=[plot_closing_price_trend, plot_decimation],
+        )
+        if artifact_cache.run_file_stage(
+            'closing_price_trend', trend_key, trend_plot_path,
+            lambda: plot_closing_price_trend(df, target_col, trend_plot_path), stage_timings,
+        ):
+            figure_paths['closing_price_trend'] = str(trend_plot_path)
+        
+        # 2. Günlük getiri dağılımı (histogram ve normal dağılım analizi)
+        histogram_plot_path = DESKTOP_PATH / "THYAO_daily_return_distribution.png"
+        histogram_inputs = [df['daily_return']] if 'daily_return' in df.columns else []
+        histogram_key = artifact_cache.make_key(
+            'daily_return_distribution', histogram_inputs, plot_config, code=[plot_daily_return_distribution]
+        )
+        if artifact_cache.run_file_stage(
+            'daily_return_distribution', histogram_key, histogram_plot_path,
+            lambda: plot_daily_return_distribution(df, histogram_plot_path), stage_timings,
+        ):
+            figure_paths['daily_return_distribution'] = str(histogram_plot_path)
+        
+        # 3. Gerçek vs. Tahmin grafiği (model performansı)
+        # 4. KNN k değerleri karşılaştırma grafiği
+        if model_outputs is not None:
+            prediction_plot_path = DESKTOP_PATH / "THYAO_real_vs_prediction.png"
+            prediction_key = artifact_cache.make_key(
+                'real_vs_prediction', [y_test, lr_test_pred, knn_test_pred], plot_config,
+                code=[plot_real_vs_prediction],
+            )
+            if artifact_cache.run_file_stage(
+                'real_vs_prediction', prediction_key, prediction_plot_path,
+                lambda: plot_real_vs_prediction(
+                    y_test, lr_test_pred, knn_test_pred,
+                    model_outputs['lr_results'], model_outputs['knn_results'], prediction_plot_path,
+                ),
+                stage_timings,
+            ):
+                figure_paths['real_vs_prediction'] = str(prediction_plot_path)
+            
+            knn_comparison_plot_path = DESKTOP_PATH / "THYAO_knn_k_comparison.png"
+            knn_comparison_key = artifact_cache.make_key(
+                'knn_k_comparison', [model_outputs['knn_results_list']], plot_config,
+                code=[plot_knn_k_comparison],
+            )
+            if artifact_cache.run_file_stage(
+                'knn_k_comparison', knn_comparison_key, knn_comparison_plot_path,
+                lambda: plot_knn_k_comparison(model_outputs['knn_results_list'], knn_comparison_plot_path),
+                stage_timings,
+            ):
+                figure_paths['knn_k_comparison'] = str(knn_comparison_plot_path)
+            
+            # 5. Özellik önemi grafiği
+            if importance_df is not None:
+                importance_plot_path = DESKTOP_PATH / "THYAO_feature_importance.png"
+                importance_plot_key = artifact_cache.make_key(
+                    'feature_importance_plot', [importance_df], plot_config, code=[plot_feature_importance],
+                )
+                if artifact_cache.run_file_stage(
+                    'feature_importance_plot', importance_plot_key, importance_plot_path,
+                    lambda: plot_feature_importance(importance_df, importance_plot_path), stage_timings,
+                ):
+                    figure_paths['feature_importance'] = str(importance_plot_path)
+        else:
+            print(f"    ⚠ Model tahminleri bulunamadı, model grafikleri çizilemedi")
         
     except ImportError as e:
         print(f"  ⚠ Gerekli kütüphaneler bulunamadı: {e}")
@@ -1190,6 +2375,27 @@ def main() -> None:
     print(f"Silinen sütun sayısı: {len(dropped_cols)}")
 
     print(f"Temizlenmiş dosya kaydedildi: {OUTPUT_CSV_PATH}")
+    run_manifest['outputs']['cleaned'] = str(OUTPUT_CSV_PATH)
+
+    # Çalıştırma özetini kaydet (aşama süreleri ve önbellek isabetleri dahil)
+    run_manifest['stage_timings'] = stage_timings
+    try:
+        write_run_manifest(run_manifest, RUN_MANIFEST_PATH)
+        cache_hits = sum(1 for timing in stage_timings.values() if timing['cache_hit'])
+        print(f"Önbellek: {cache_hits}/{len(stage_timings)} aşama önbellekten yüklendi")
+        print(f"Çalıştırma özeti kaydedildi: {RUN_MANIFEST_PATH}")
+    except Exception as e:
+        print(f"Çalıştırma özeti kaydedilirken hata oluştu: {e}")
+        return
+
+    # Raporu çalıştırma özetinden üret (hesaplama tekrarlanmaz)
+    try:
+        from report import generate_report
+
+        report_paths = generate_report(run_manifest, REPORT_OUTPUT_DIR)
+        print(f"Rapor kaydedildi: {', '.join(str(path) for path in report_paths)}")
+    except Exception as e:
+        print(f"Rapor oluşturulurken hata oluştu: {e}")
 
 
 
@@ -0,0 +1,245 @@
+import pickle
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Çubuk adı -> pandas periyot frekansı (haftalık çubuklar cuma kapanışıyla biter)
+DEFAULT_TIMEFRAMES: Dict[str, str] = {'weekly': 'W-FRI', 'monthly': 'M'}
+
+# Çubuk sütunu -> (ham günlük sütun, birleştirme)
+BAR_COLUMNS: Dict[str, Tuple[str, str]] = {
+    'open': ('OPENING PRICE', 'first'),
+    'high': ('HIGHEST PRICE', 'max'),
+    'low': ('LOWEST PRICE', 'min'),
+    'close': ('CLOSING PRICE', 'last'),
+    'volume': ('TOTAL TRADED VOLUME', 'sum'),
+    'value': ('TOTAL TRADED VALUE', 'sum'),
+}
+
+# Çubuk özelliklerinde hareketli ortalama penceresi (çubuk sayısı)
+DEFAULT_MA_BARS = 4
+
+# Çubuk başına üretilen özellikler (sütun adı: f"{çubuk adı}_{özellik}")
+BAR_FEATURES: List[str] = ['return', 'range', 'close_to_ma', 'volume_ratio']
+
+
+def feature_names(timeframes: Dict[str, str]) -> List[str]:
+    """Günlük satırlara eklenecek çoklu zaman dilimi özellik adları."""
+    return [f"{name}_{feature}" for name in timeframes for feature in BAR_FEATURES]
+
+
+def period_codes(dates: np.ndarray, freq: str) -> np.ndarray:
+    """Tarihlerin periyot sıra numaraları (int64; aynı hafta/ay aynı kod)."""
+    return pd.DatetimeIndex(dates).to_period(freq).asi8
+
+
+def aggregate_bars(codes: np.ndarray, dates: np.ndarray, values: Dict[str, np.ndarray]) -> pd.DataFrame:
+    """
+    Sıralı günlük satırları periyot çubuklarına tek geçişte indirger.
+
+    Satırlar tarihe göre sıralı olduğundan her periyot ardışık bir bloktur;
+    blok başlangıçları bir kez bulunur ve her sütun ``ufunc.reduceat`` ile
+    (max/min/toplam) veya blok ilk/son indeksiyle (açılış/kapanış)
+    indirgenir. groupby yoktur.
+
+    Args:
+        codes: Satır başına periyot kodu (artan)
+        dates: Satır tarihleri
+        values: Çubuk sütunu -> günlük değerler (BAR_COLUMNS anahtarları)
+
+    Returns:
+        pd.DataFrame: Periyot kodu indeksli open/high/low/close/volume/value,
+        first_date, last_date ve days sütunları
+    """
+    if len(codes) == 0:
+        return pd.DataFrame(columns=[*BAR_COLUMNS, 'first_date', 'last_date', 'days'])
+
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)] - 1
+    reducers = {'max': np.fmax.reduceat, 'min': np.fmin.reduceat, 'sum': np.add.reduceat}
+
+    bars = {}
+    for column, (_, how) in BAR_COLUMNS.items():
+        series = values[column]
+        if how == 'first':
+            bars[column] = series[starts]
+        elif how == 'last':
+            bars[column] = series[ends]
+        else:
+            bars[column] = reducers[how](series, starts)
+    bars['first_date'] = dates[starts]
+    bars['last_date'] = dates[ends]
+    bars['days'] = ends - starts + 1
+    return pd.DataFrame(bars, index=pd.Index(codes[starts], name='period'))
+
+
+def bar_features(bars: pd.DataFrame, name: str, ma_bars: int = DEFAULT_MA_BARS) -> pd.DataFrame:
+    """Çubuk serisi üzerinde getiri, aralık, ortalamaya uzaklık ve göreli hacim."""
+    close = bars['close']
+    return pd.DataFrame({
+        f"{name}_return": close.pct_change(),
+        f"{name}_range": (bars['high'] - bars['low']) / close,
+        f"{name}_close_to_ma": close / close.rolling(ma_bars, min_periods=1).mean() - 1.0,
+        f"{name}_volume_ratio": bars['volume'] / bars['volume'].rolling(ma_bars, min_periods=1).mean(),
+    }, index=bars.index)
+
+
+def align_completed(codes: np.ndarray, features: pd.DataFrame) -> pd.DataFrame:
+    """
+    Her günlük satıra, satırın periyodundan önce tamamlanmış son çubuğun özelliklerini atar.
+
+    Satırın kendi (henüz bitmemiş) periyodu hiçbir zaman kullanılmaz; bu
+    nedenle ileriye bakma yoktur. İlk periyottaki satırlar NaN alır.
+    """
+    bar_codes = features.index.to_numpy()
+    position = np.searchsorted(bar_codes, codes, side='left') - 1
+    aligned = features.to_numpy()[np.maximum(position, 0)]
+    aligned[position < 0] = np.nan
+    return pd.DataFrame(aligned, columns=features.columns)
+
+
+class BarCache:
+    """
+    Tamamlanmış çubukları hisse ve zaman dilimi başına diskte tutan önbellek.
+
+    Son satırın periyodu dışındaki çubuklar tamamlanmış sayılır ve saklanır.
+    Sonraki çalıştırmada yalnızca son tamamlanmış periyottan sonraki günlük
+    satırlar indirgenir (yeni tamamlanan çubuklar + güncel kısmi çubuk).
+    Önbelleğin kapsadığı günlük satırların özeti (satır sayısı, son tarih,
+    kapanış ve hacim toplamı) değişmişse çubuklar baştan üretilir.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+
+    def _path(self, ticker: str) -> Optional[Path]:
+        return self.cache_dir / f"{ticker}.pkl" if self.cache_dir is not None else None
+
+    def _load(self, ticker: str) -> Dict[str, dict]:
+        path = self._path(ticker)
+        if path is None or not path.exists():
+            return {}
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"  [UYARI] Çubuk önbelleği okunamadı, yeniden oluşturulacak: {e}")
+            return {}
+
+    def _save(self, ticker: str, state: Dict[str, dict]) -> None:
+        path = self._path(ticker)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(state, f)
+
+    @staticmethod
+    def _fingerprint(dates: np.ndarray, values: Dict[str, np.ndarray], rows: int) -> Tuple:
+        if rows == 0:
+            return (0,)
+        return (rows, dates[rows - 1], float(np.nansum(values['close'][:rows])),
+                float(np.nansum(values['volume'][:rows])))
+
+    def update(
+        self, ticker: str, dates: np.ndarray, values: Dict[str, np.ndarray], timeframes: Dict[str, str]
+    ) -> Tuple[Dict[str, Tuple[np.ndarray, pd.DataFrame]], Dict[str, int]]:
+        """
+        Tüm zaman dilimleri için çubukları üretir (tamamlanmışlar önbellekten).
+
+        Args:
+            ticker: Hisse kodu
+            dates: Sıralı günlük tarihler
+            values: Çubuk sütunu -> günlük değerler
+            timeframes: Çubuk adı -> periyot frekansı
+
+        Returns:
+            Tuple:
+            - Çubuk adı -> (satır başına periyot kodu, tüm çubuklar; son çubuk kısmi olabilir)
+            - Çubuk adı -> önbellekten kullanılan tamamlanmış çubuk sayısı
+        """
+        state = self._load(ticker)
+        result: Dict[str, Tuple[np.ndarray, pd.DataFrame]] = {}
+        reused: Dict[str, int] = {}
+
+        for name, freq in timeframes.items():
+            codes = period_codes(dates, freq)
+            cached = state.get(name)
+            start = 0
+            completed = None
+            if cached is not None and cached['freq'] == freq:
+                rows = int(np.searchsorted(codes, cached['last_code'], side='right'))
+                if cached['fingerprint'] == self._fingerprint(dates, values, rows):
+                    start, completed = rows, cached['bars']
+
+            tail = aggregate_bars(codes[start:], dates[start:], {k: v[start:] for k, v in values.items()})
+            bars = tail if completed is None else pd.concat([completed, tail])
+            reused[name] = 0 if completed is None else len(completed)
+            result[name] = (codes, bars)
+
+            # Son satırın periyodu kısmi kabul edilir; öncekiler saklanır
+            if len(codes):
+                done = bars.iloc[:-1]
+                last_code = int(done.index[-1]) if len(done) else int(codes[0]) - 1
+                rows = int(np.searchsorted(codes, last_code, side='right'))
+                state[name] = {
+                    'freq': freq, 'bars': done, 'last_code': last_code,
+                    'fingerprint': self._fingerprint(dates, values, rows),
+                }
+
+        self._save(ticker, state)
+        return result, reused
+
+
+def compute_multi_timeframe_features(
+    df: pd.DataFrame,
+    date_col: str,
+    ticker: str,
+    timeframes: Dict[str, str] = DEFAULT_TIMEFRAMES,
+    ma_bars: int = DEFAULT_MA_BARS,
+    cache_dir: Optional[Path] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    """
+    Temizlenmiş günlük veriden haftalık/aylık çubuklar ve günlük satırlara hizalanmış özellikler.
+
+    Günlük OHLCV sütunları bir kez diziye alınır; her zaman dilimi için
+    tamamlanmış çubuklar önbellekten okunur ve yalnızca sonrası indirgenir.
+    Özellikler her günlük satıra, o satırdan önce tamamlanmış son çubuktan
+    atanır (ileriye bakma yok).
+
+    Args:
+        df: Tarihe göre sıralı temizlenmiş günlük veri
+        date_col: TRADE DATE sütunu
+        ticker: Önbellek anahtarı olarak hisse kodu
+        timeframes: Çubuk adı -> periyot frekansı
+        ma_bars: Çubuk hareketli ortalama penceresi
+        cache_dir: Çubuk önbelleği klasörü (None: önbellek yok)
+
+    Returns:
+        Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+        - df indeksli özellikler (feature_names(timeframes) sütunları)
+        - Tüm çubuklar (timeframe, period, complete sütunlarıyla uzun format)
+        - Zaman dilimi başına önbellekten kullanılan çubuk sayısı
+    """
+    columns = {col.strip().upper(): col for col in df.columns}
+    missing = [source for source, _ in BAR_COLUMNS.values() if source not in columns]
+    if missing:
+        raise KeyError(f"Çubuk için gerekli sütunlar bulunamadı: {missing}")
+
+    dates = df[date_col].to_numpy(dtype='datetime64[ns]')
+    values = {bar: df[columns[source]].to_numpy(dtype='float64') for bar, (source, _) in BAR_COLUMNS.items()}
+    bars_by_name, reused = BarCache(cache_dir).update(ticker, dates, values, timeframes)
+
+    feature_frames = []
+    bar_frames = []
+    for name, (codes, bars) in bars_by_name.items():
+        feature_frames.append(align_completed(codes, bar_features(bars, name, ma_bars)))
+        bar_frames.append(bars.reset_index().assign(
+            timeframe=name, complete=np.arange(len(bars)) < len(bars) - 1,
+        ))
+
+    features = pd.concat(feature_frames, axis=1)
+    features.index = df.index
+    return features, pd.concat(bar_frames, ignore_index=True), reused